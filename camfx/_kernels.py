@@ -0,0 +1,122 @@
+"""Fused per-pixel kernels for the effect hot paths.
+
+Numba is optional. The kernels are JIT compiled with ``parallel=True``;
+without numba they fall back to equivalent OpenCV calls, so results are
+the same either way. A prebuilt extension from ``camfx._kernels_aot`` is
+serial, so it only covers the first frames while the parallel kernel
+compiles in the background, or stands in when numba isn't installed.
+"""
+
+import threading
+
+import cv2
+import numpy as np
+
+try:
+	from ._camfx_kernels import blend_u8 as _blend_u8_aot
+	AOT_AVAILABLE = True
+except ImportError:
+	AOT_AVAILABLE = False
+
+try:
+	from numba import njit, prange
+	NUMBA_AVAILABLE = True
+except ImportError:
+	NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+	@njit(parallel=True, fastmath=True, cache=True)
+	def _blend_u8_jit(frame, bg, mask, out):
+		h, w, channels = frame.shape
+		for y in prange(h):
+			for x in range(w):
+				m = mask[y, x]
+				if m < 0.0:
+					m = 0.0
+				elif m > 1.0:
+					m = 1.0
+				inv = 1.0 - m
+				for c in range(channels):
+					# Convex combination of two uint8 values stays within [0, 255]
+					out[y, x, c] = np.uint8(frame[y, x, c] * m + bg[y, x, c] * inv + 0.5)
+
+	
+	@njit(parallel=True, cache=True)
+	def _bgr_to_rgb_jit(src, dst):
+		h, w, _ = src.shape
+		for y in prange(h):
+			for x in range(w):
+				# Read the whole pixel first so dst may alias src
+				b = src[y, x, 0]
+				g = src[y, x, 1]
+				r = src[y, x, 2]
+				dst[y, x, 0] = r
+				dst[y, x, 1] = g
+				dst[y, x, 2] = b
+
+
+# Set once the parallel JIT blend is compiled; until then the AOT build is used
+_blend_jit_ready = threading.Event()
+_blend_warmup_lock = threading.Lock()
+_blend_warmup_started = False
+
+
+def _warm_blend_jit():
+	frame = np.zeros((1, 1, 3), dtype=np.uint8)
+	# Same dtypes and C layout as the frames, so this compiles the specialization used later
+	_blend_u8_jit(frame, frame.copy(), np.zeros((1, 1), dtype=np.float32), np.empty_like(frame))
+	_blend_jit_ready.set()
+
+
+def _start_blend_warmup():
+	global _blend_warmup_started
+	with _blend_warmup_lock:
+		if _blend_warmup_started:
+			return
+		_blend_warmup_started = True
+	threading.Thread(target=_warm_blend_jit, name='camfx-jit-warmup', daemon=True).start()
+
+
+def blend_u8(frame: np.ndarray, bg: np.ndarray, mask: np.ndarray, out: np.ndarray) -> np.ndarray:
+	"""Blend two uint8 images in one pass: ``out = frame * mask + bg * (1 - mask)``.
+	
+	Args:
+		frame: Foreground image (HxWx3 uint8)
+		bg: Background image, same shape as frame
+		mask: Per-pixel float32 weights for ``frame`` (HxW), clamped to [0, 1]
+		out: Preallocated uint8 output, same shape as frame (may alias frame or bg)
+	
+	Returns:
+		``out``
+	"""
+	if NUMBA_AVAILABLE and (_blend_jit_ready.is_set() or not AOT_AVAILABLE):
+		_blend_u8_jit(frame, bg, mask, out)
+	elif AOT_AVAILABLE:
+		if NUMBA_AVAILABLE:
+			_start_blend_warmup()
+		_blend_u8_aot(frame, bg, mask, out)
+	else:
+		weights = np.clip(mask, 0.0, 1.0)
+		cv2.blendLinear(frame, bg, weights, 1.0 - weights, dst=out)
+	return out
+
+
+def bgr_to_rgb(src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+	"""Swap the channel order of a uint8 BGR image into ``dst``.
+	
+	For OpenCV builds without SIMD dispatch (some ARM boards) where
+	``cvtColor`` is slow; falls back to ``cvtColor`` without numba.
+	
+	Args:
+		src: BGR image (HxWx3 uint8)
+		dst: Preallocated uint8 output, same shape as src (may alias src)
+	
+	Returns:
+		``dst``
+	"""
+	if NUMBA_AVAILABLE:
+		_bgr_to_rgb_jit(src, dst)
+	else:
+		cv2.cvtColor(src, cv2.COLOR_BGR2RGB, dst=dst)
+	return dst
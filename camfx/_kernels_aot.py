@@ -0,0 +1,37 @@
+"""Ahead-of-time build of the fused blend kernel.
+
+Run ``python -m camfx._kernels_aot`` (requires numba) to build the
+``_camfx_kernels`` extension next to this file. ``camfx._kernels`` picks it
+up when present, so enabling blur/replace no longer waits on JIT compilation;
+the serial AOT kernel is replaced by the parallel JIT one once that compiles.
+
+``numba.pycc`` is deprecated upstream and may be removed in a future numba
+release, so this build step is optional and best-effort.
+"""
+
+import os
+
+from numba.pycc import CC
+
+cc = CC('_camfx_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export('blend_u8', 'void(u1[:,:,:], u1[:,:,:], f4[:,:], u1[:,:,:])')
+def blend_u8(frame, bg, mask, out):
+	# AOT exports can't use prange, so this is the serial form of _kernels._blend_u8_jit
+	h, w, channels = frame.shape
+	for y in range(h):
+		for x in range(w):
+			m = mask[y, x]
+			if m < 0.0:
+				m = 0.0
+			elif m > 1.0:
+				m = 1.0
+			inv = 1.0 - m
+			for c in range(channels):
+				out[y, x, c] = int(frame[y, x, c] * m + bg[y, x, c] * inv + 0.5)
+
+
+if __name__ == '__main__':
+	cc.compile()
@@ -130,8 +130,9 @@ def cli():
 @click.option('--fps', default=30, type=int, help='Virtual camera FPS')
 @click.option('--name', default='camfx', type=str, help='Name for the virtual camera source')
 @click.option('--dbus', is_flag=True, default=False, help='Enable D-Bus service for runtime effect and camera control (REQUIRED for camera toggle)')
+@click.option('--pipeline', is_flag=True, default=False, help='Run each effect of a multi-effect chain on its own thread (higher FPS, adds a frame of latency per effect)')
 def start(input_index: int, width: int | None, height: int | None, fps: int, name: str,
-         dbus: bool):
+         dbus: bool, pipeline: bool):
 	"""Start camfx daemon (virtual camera service).
 
 	The camera is OFF by default. Use D-Bus or CLI commands to control it:
@@ -151,6 +152,7 @@ def start(input_index: int, width: int | None, height: int | None, fps: int, nam
 			'enable_virtual': True,
 			'camera_name': name,
 			'enable_dbus': dbus,
+			'pipeline_effects': pipeline,
 		},
 	)
 	
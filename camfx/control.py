@@ -1,6 +1,9 @@
 """Effect chain and controller for managing effects at runtime."""
 
+import functools
 import logging
+import os
+import queue
 import threading
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -18,11 +21,53 @@ logger = logging.getLogger(__name__)
 _DEFAULT_BACKGROUND_PATH = Path(__file__).parent / "resources" / "default_background.jpg"
 
 
+@functools.lru_cache(maxsize=4)
+def _decode_background(path: str, mtime_ns: int) -> np.ndarray:
+	image = cv2.imread(path)
+	if image is None:
+		# Raised rather than returned so lru_cache never stores a failed decode
+		raise ValueError(f"could not decode '{path}'")
+	return image
+
+
+# (path, mtime_ns) of images that failed to decode, so each failure is logged once
+_failed_backgrounds: set = set()
+
+
+def _read_background(path: str) -> Optional[np.ndarray]:
+	"""Decode a background image, reusing the same array until the file changes.
+	
+	Args:
+		path: Image file path
+	
+	Returns:
+		BGR image, or None if the file is missing or unreadable
+	"""
+	try:
+		key = (path, os.stat(path).st_mtime_ns)
+	except OSError:
+		key = (path, None)
+	else:
+		try:
+			return _decode_background(*key)
+		except ValueError:
+			pass
+	if key not in _failed_backgrounds:
+		_failed_backgrounds.add(key)
+		logger.warning("Failed to load background image from '%s'", path)
+	return None
+
+# Effects whose apply() accepts a caller-supplied ``dst`` output buffer
+_DST_EFFECTS = ('BackgroundBlur', 'BackgroundReplace', 'BrightnessAdjustment', 'FaceBeautification', 'AutoFraming')
+
+
 class EffectChain:
 	"""Manages a chain of effects to apply in sequence."""
 	
 	def __init__(self):
 		self.effects: List[tuple] = []  # List of (effect_instance, config_dict)
+		# Ping-pong scratch buffers for intermediate results, allocated on first use
+		self._buffers: List[Optional[np.ndarray]] = [None, None]
 	
 	def add_effect(self, effect_type: str, config: Dict[str, Any]) -> bool:
 		"""Add an effect to the chain, or update if same type already exists.
@@ -119,26 +164,46 @@ class EffectChain:
 		else:
 			raise ValueError(f"Unknown effect_type: {effect_type}")
 	
-	def apply(self, frame: np.ndarray, mask: Optional[np.ndarray], **kwargs) -> np.ndarray:
+	def _scratch_for(self, result: np.ndarray) -> np.ndarray:
+		"""Return a scratch buffer shaped like ``result`` that does not alias it."""
+		buf_index = 1 if self._buffers[0] is result else 0
+		buf = self._buffers[buf_index]
+		if buf is None or buf.shape != result.shape:
+			buf = np.empty_like(result)
+			self._buffers[buf_index] = buf
+		return buf
+	
+	def apply(self, frame: np.ndarray, mask: Optional[np.ndarray], dst: Optional[np.ndarray] = None, **kwargs) -> np.ndarray:
 		"""Apply all effects in sequence.
 		
+		Intermediate results ping-pong between two scratch buffers owned by the
+		chain, and the last effect writes into ``dst`` when given, so effects
+		that support a ``dst`` buffer do not allocate a new frame each time.
+		
 		Args:
 			frame: Input frame (BGR format)
 			mask: Optional segmentation mask
+			dst: Optional buffer (same shape as frame) for the final effect to write into
 			**kwargs: Additional parameters to pass to effects
 		
 		Returns:
-			Processed frame
+			Processed frame (``dst`` when the last effect wrote into it)
 		"""
 		result = frame
 		current_mask = mask
+		last_index = len(self.effects) - 1
 		
-		for effect, config in self.effects:
+		for index, (effect, config) in enumerate(self.effects):
 			# Determine if this effect needs a mask
 			needs_mask = effect.__class__.__name__ in ['BackgroundBlur', 'BackgroundReplace']
 			
 			# Merge config with kwargs (kwargs take precedence)
 			effect_kwargs = {**config, **kwargs}
+			if effect.__class__.__name__ in _DST_EFFECTS and result.dtype == np.uint8:
+				if index < last_index:
+					effect_kwargs['dst'] = self._scratch_for(result)
+				elif dst is not None and dst is not result and dst.shape == result.shape:
+					effect_kwargs['dst'] = dst
 			
 			# Apply effect
 			if needs_mask and current_mask is not None:
@@ -149,24 +214,20 @@ class EffectChain:
 					if background is None:
 						image_path = effect_kwargs.pop('image', None)
 						if image_path:
-							background = cv2.imread(image_path)
-							if background is None:
-								logger.warning(f"Failed to load background image from '{image_path}', using default background")
-								# Fall back to default background if user-provided image fails to load
-								image_path = None
+							# Falls back to the default background below if the image can't be read
+							background = _read_background(image_path)
 						
 						# If no image path provided or user image failed, use default background
 						if background is None:
 							if _DEFAULT_BACKGROUND_PATH.exists():
-								background = cv2.imread(str(_DEFAULT_BACKGROUND_PATH))
+								background = _read_background(str(_DEFAULT_BACKGROUND_PATH))
 								if background is None:
-									logger.error(f"Failed to load default background image from '{_DEFAULT_BACKGROUND_PATH}', skipping BackgroundReplace")
 									continue
 								logger.debug("Using default professional workspace background image")
 							else:
 								logger.warning(f"Default background image not found at '{_DEFAULT_BACKGROUND_PATH}', skipping BackgroundReplace")
 								continue
-					result = effect.apply(result, current_mask, background)
+					result = effect.apply(result, current_mask, background, dst=effect_kwargs.get('dst'))
 				else:
 					result = effect.apply(result, current_mask, **effect_kwargs)
 			else:
@@ -194,12 +255,126 @@ class EffectChain:
 		return iter(self.effects)
 
 
+class EffectPipeline:
+	"""Runs each effect of a chain on its own thread so consecutive frames overlap.
+	
+	While frame K is in effect N, frame K+1 can already be in effect N-1, so
+	throughput follows the slowest effect instead of the sum of all of them,
+	at the cost of up to one frame of latency per stage. Every effect instance
+	is only ever touched by its own stage thread, which keeps per-effect
+	MediaPipe state single-threaded.
+	"""
+	
+	_STOP = object()
+	
+	def __init__(self, effects: List[tuple], pin_threads: bool = True):
+		"""Start one stage thread per effect.
+		
+		Args:
+			effects: (effect_instance, config) pairs, as in EffectChain.effects
+			pin_threads: Pin each stage to its own CPU when enough are available (Linux only)
+		"""
+		self.effect_ids = tuple(id(effect) for effect, _ in effects)
+		self.depth = len(effects)
+		self._in_flight = 0
+		# Bounded hand-off queues apply backpressure; the output queue is drained by process()
+		self._queues = [queue.Queue(maxsize=1) for _ in range(self.depth)]
+		self._queues.append(queue.Queue())
+		
+		cpus: List[int] = []
+		if pin_threads and hasattr(os, 'sched_getaffinity'):
+			cpus = sorted(os.sched_getaffinity(0))
+			if len(cpus) <= self.depth:
+				# Leave at least one core for capture and segmentation
+				cpus = []
+		
+		self._threads = []
+		for index, (effect, _) in enumerate(effects):
+			cpu = cpus[index + 1] if cpus else None
+			thread = threading.Thread(
+				target=self._stage_loop,
+				args=(index, effect, cpu),
+				name=f"camfx-effect-{effect.__class__.__name__}",
+				daemon=True,
+			)
+			thread.start()
+			self._threads.append(thread)
+	
+	def _stage_loop(self, index: int, effect, cpu: Optional[int]):
+		if cpu is not None:
+			try:
+				os.sched_setaffinity(0, {cpu})
+			except OSError as exc:
+				logger.debug("Could not pin effect stage %d to CPU %d: %s", index, cpu, exc)
+		in_q = self._queues[index]
+		out_q = self._queues[index + 1]
+		# Single-effect chain reuses EffectChain's per-effect dispatch (mask, background loading)
+		stage = EffectChain()
+		while True:
+			item = in_q.get()
+			if item is self._STOP:
+				out_q.put(item)
+				return
+			frame, mask, configs, kwargs = item
+			stage.effects = [(effect, configs[index])]
+			try:
+				frame = stage.apply(frame, mask, **kwargs)
+			except Exception as exc:
+				logger.error("Effect %s failed in pipeline: %s", effect.__class__.__name__, exc, exc_info=True)
+			out_q.put((frame, mask, configs, kwargs))
+	
+	def process(self, frame: np.ndarray, mask: Optional[np.ndarray], chain: 'EffectChain', **kwargs) -> Optional[np.ndarray]:
+		"""Submit a frame and return the oldest finished one.
+		
+		Args:
+			frame: Input frame (BGR format)
+			mask: Segmentation mask for this frame (or None)
+			chain: Chain snapshot supplying the current per-effect configs
+			**kwargs: Additional parameters passed to each effect
+		
+		Returns:
+			A processed frame from ``depth`` submissions ago, or None while the
+			pipeline is still filling
+		"""
+		configs = tuple(config for _, config in chain.effects)
+		self._queues[0].put((frame, mask, configs, kwargs))
+		self._in_flight += 1
+		out_q = self._queues[-1]
+		if self._in_flight > self.depth:
+			result = out_q.get()
+		else:
+			try:
+				result = out_q.get_nowait()
+			except queue.Empty:
+				return None
+		self._in_flight -= 1
+		return result[0]
+	
+	def matches(self, chain: 'EffectChain') -> bool:
+		"""Whether this pipeline runs the same effect instances as chain."""
+		return self.effect_ids == tuple(id(effect) for effect, _ in chain.effects)
+	
+	def stop(self, timeout: float = 2.0):
+		"""Stop all stage threads, discarding frames still in flight."""
+		self._queues[0].put(self._STOP)
+		for thread in self._threads:
+			thread.join(timeout=timeout)
+		self._threads = []
+
+
 class EffectController:
 	"""Thread-safe controller for managing effects."""
 	
 	def __init__(self):
 		self.chain = EffectChain()
 		self.lock = threading.Lock()
+		# Frozen (effect, config) pairs handed out by get_chain(); rebuilt lazily
+		# after a mutation so the render loop does not copy configs every frame.
+		self._snapshot: Optional[tuple] = None
+	
+	def _invalidate_snapshot(self):
+		"""Drop the cached chain snapshot. Caller must hold ``self.lock``."""
+		self._snapshot = None
 	
 	def set_effect(self, effect_type: str, config: Dict[str, Any]):
 		"""Replace all effects with a single effect.
@@ -211,6 +386,7 @@ class EffectController:
 		with self.lock:
 			self.chain.clear()
 			self.chain.add_effect(effect_type, config)
+			self._invalidate_snapshot()
 	
 	def add_effect(self, effect_type: str, config: Dict[str, Any]) -> bool:
 		"""Add an effect to the chain.
@@ -223,6 +399,7 @@ class EffectController:
 			True if effect was added, False if duplicate was detected
 		"""
 		with self.lock:
+			self._invalidate_snapshot()
 			return self.chain.add_effect(effect_type, config)
 	
 	def remove_effect(self, index: int):
@@ -233,6 +410,7 @@ class EffectController:
 		"""
 		with self.lock:
 			self.chain.remove_effect(index)
+			self._invalidate_snapshot()
 	
 	def remove_effect_by_type(self, effect_type: str) -> bool:
 		"""Remove an effect from the chain by type.
@@ -244,24 +422,33 @@ class EffectController:
 			True if effect was found and removed, False otherwise
 		"""
 		with self.lock:
+			self._invalidate_snapshot()
 			return self.chain.remove_effect_by_type(effect_type)
 	
 	def clear_chain(self):
 		"""Clear all effects from the chain."""
 		with self.lock:
 			self.chain.clear()
+			self._invalidate_snapshot()
 	
 	def get_chain(self) -> EffectChain:
 		"""Get current effect chain (thread-safe copy).
 		
+		The returned chain is built from a snapshot taken under the lock, so
+		D-Bus mutators running on the GLib thread never change the effects or
+		configs a caller is iterating over during ``chain.apply``.
+		
 		Returns:
 			A copy of the current effect chain
 		"""
 		with self.lock:
-			# Return a copy to avoid race conditions
+			if self._snapshot is None:
+				# Copy configs once per mutation instead of once per frame
+				self._snapshot = tuple((effect, config.copy()) for effect, config in self.chain.effects)
 			chain_copy = EffectChain()
-			# Deep copy effects list
-			chain_copy.effects = [(effect, config.copy()) for effect, config in self.chain.effects]
+			chain_copy.effects = list(self._snapshot)
+			# Share scratch buffers so per-frame snapshots don't reallocate them
+			chain_copy._buffers = self.chain._buffers
 			return chain_copy
 	
 	def update_effect_parameter(self, effect_type: str, parameter: str, value: Any):
@@ -287,6 +474,7 @@ class EffectController:
 				}
 				if effect_class_name == expected_class_names.get(effect_type):
 					config[parameter] = value
+					self._invalidate_snapshot()
 					return
 			raise ValueError(f"Effect type '{effect_type}' not found in chain")
 
@@ -9,7 +9,7 @@ from typing import Dict, List, Optional
 from .camera_devices import list_camera_devices, probe_camera_modes
 from .segmentation import PersonSegmenter
 from .output_pipewire import PipeWireOutput
-from .control import EffectController
+from .control import EffectController, EffectPipeline
 
 logger = logging.getLogger('camfx.core')
 
@@ -30,11 +30,19 @@ class VideoEnhancer:
 		self._virtual_frames_sent = 0
 		self._black_frames_sent = 0
 		self._last_effect_chain_signature: Optional[str] = None
+		# Output buffer the effect chain writes its final result into
+		self._processed_buf: Optional[np.ndarray] = None
+		# Per-effect stage threads for multi-effect chains (opt-in via 'pipeline_effects')
+		self._pipeline: Optional[EffectPipeline] = None
 		self._virtual_warning_logged = False
 		
 		# Camera is not opened immediately - requires explicit start via D-Bus or CLI
 		self.cap: Optional[cv2.VideoCapture] = None
 		self.camera_active = False
+		# Set while the camera is running so the idle loop can wake immediately
+		self._camera_state_event = threading.Event()
+		self._black_frame_bytes = b''
+		self._black_frame_size: Optional[tuple] = None
 		
 		# Initialize effect controller
 		self.effect_controller = EffectController()
@@ -51,6 +59,7 @@ class VideoEnhancer:
 		# Get target dimensions and FPS from config
 		self.target_fps = int(self.config.get('fps', 30))
 		self.enable_virtual = bool(self.config.get('enable_virtual', True))
+		self.pipeline_effects = bool(self.config.get('pipeline_effects', False))
 		self.camera_name = self.config.get('camera_name', 'camfx')
 		
 		# Use config dimensions or defaults
@@ -161,6 +170,7 @@ class VideoEnhancer:
 			self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
 			
 			self.camera_active = True
+			self._camera_state_event.set()
 			self._last_camera_state_log = time.time()
 			self._log_checkpoint(
 				'camera.start.success',
@@ -174,6 +184,7 @@ class VideoEnhancer:
 		with self.camera_lock:
 			if self.cap is None:
 				self.camera_active = False
+				self._camera_state_event.clear()
 				logger.debug("Camera stop requested but capture already released")
 				return
 			
@@ -181,9 +192,24 @@ class VideoEnhancer:
 			self.cap.release()
 			self.cap = None
 			self.camera_active = False
+			self._camera_state_event.clear()
 			self._last_camera_state_log = time.time()
 			self._log_checkpoint('camera.stop.success')
 	
+	def _process_pipelined(self, chain, frame: np.ndarray, mask: Optional[np.ndarray], **kwargs) -> Optional[np.ndarray]:
+		"""Run the chain through the stage pipeline, rebuilding it when the effects change."""
+		if self._pipeline is None or not self._pipeline.matches(chain):
+			self._stop_pipeline()
+			self._pipeline = EffectPipeline(chain.effects)
+			self._log_checkpoint('effects.pipeline.start', stages=self._pipeline.depth)
+		return self._pipeline.process(frame, mask, chain, **kwargs)
+	
+	def _stop_pipeline(self):
+		"""Stop the stage pipeline, if running. Only called from the processing loop."""
+		if self._pipeline is not None:
+			self._pipeline.stop()
+			self._pipeline = None
+	
 	def _open_capture_for_source(self) -> Optional[cv2.VideoCapture]:
 		"""Create a VideoCapture for the current source."""
 		if self.camera_source_index is not None:
@@ -386,6 +412,8 @@ class VideoEnhancer:
 				
 				# Check if camera is active
 				if not self.camera_active:
+					# Frames still in flight belong to the previous session
+					self._stop_pipeline()
 					now = time.time()
 					if now - self._last_inactive_log >= 5.0:
 						self._log_checkpoint(
@@ -394,13 +422,19 @@ class VideoEnhancer:
 							reason='camera_off',
 						)
 						self._last_inactive_log = now
+					# Set once sleep_until_next_frame() has already waited out this frame
+					paced = False
 					# Send a black frame when camera is off
 					if self.virtual_cam is not None:
-						black_frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-						frame_rgb = cv2.cvtColor(black_frame, cv2.COLOR_BGR2RGB)
+						black_size = (self.width, self.height)
+						if black_size != self._black_frame_size:
+							# Black is the same in BGR and RGB; build the bytes once per size
+							self._black_frame_bytes = bytes(self.width * self.height * 3)
+							self._black_frame_size = black_size
 						try:
-							self.virtual_cam.send(frame_rgb.tobytes())
+							self.virtual_cam.send(self._black_frame_bytes)
 							self.virtual_cam.sleep_until_next_frame()
+							paced = True
 							self._black_frames_sent += 1
 							if self._black_frames_sent == 1 or now - self._last_black_frame_log >= 5.0:
 								self._log_checkpoint(
@@ -426,12 +460,21 @@ class VideoEnhancer:
 						if key == ord('q'):
 							break
 					
-					time.sleep(0.1)  # Small delay when inactive
+					# Block until the camera starts instead of polling; keep waking at
+					# frame rate only while something still needs idle frames. The
+					# black-frame send is already paced, so don't wait a second interval.
+					if not paced:
+						if self.virtual_cam is not None or preview:
+							idle_timeout = 1.0 / max(1, self.target_fps)
+						else:
+							idle_timeout = 1.0
+						self._camera_state_event.wait(timeout=idle_timeout)
 					continue
 				
 				# Camera is active, process frames
 				if self.cap is None:
 					self.camera_active = False
+					self._camera_state_event.clear()
 					logger.warning("Camera marked active but VideoCapture handle is None; restarting soon")
 					time.sleep(0.1)
 					continue
@@ -482,8 +525,17 @@ class VideoEnhancer:
 				mask = self.segmenter.get_mask(frame) if needs_mask else None
 				
 				# Apply effect chain
+				if self._processed_buf is None or self._processed_buf.shape != frame.shape:
+					self._processed_buf = np.empty_like(frame)
 				try:
-					processed = chain.apply(frame, mask, **kwargs)
+					if self.pipeline_effects and len(chain.effects) > 1:
+						processed = self._process_pipelined(chain, frame, mask, **kwargs)
+						if processed is None:
+							# Pipeline is still filling; nothing to output yet
+							continue
+					else:
+						self._stop_pipeline()
+						processed = chain.apply(frame, mask, dst=self._processed_buf, **kwargs)
 				except Exception as effect_error:
 					logger.error("Effect chain processing failed: %s", effect_error, exc_info=True)
 					self._log_checkpoint(
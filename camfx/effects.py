@@ -1,38 +1,78 @@
 import cv2
 import numpy as np
+from . import gpu
+from ._kernels import blend_u8
 from .segmentation import FaceDetector
 
 
+def _mask_weights(mask: np.ndarray, frame: np.ndarray) -> np.ndarray:
+	"""Return the mask as float32 blend weights matching the frame size."""
+	if mask.shape[:2] != frame.shape[:2]:
+		raise ValueError(f"Mask shape {mask.shape[:2]} does not match frame shape {frame.shape[:2]}")
+	# blend_u8 clamps to [0, 1] itself, so only the dtype needs normalizing
+	return np.ascontiguousarray(mask, dtype=np.float32)
+
+
 class BackgroundBlur:
-	def apply(self, frame: np.ndarray, mask: np.ndarray, strength: int = 25) -> np.ndarray:
-		if strength <= 0:
-			raise ValueError(f"Strength must be positive, got {strength}")
-		if strength % 2 == 0:
-			raise ValueError(f"Strength must be odd (Gaussian blur requires odd kernel size), got {strength}. Use an odd number like {strength + 1} or {strength - 1}")
-		frame_f = frame.astype(np.float32)
+	def __init__(self):
+		# Scratch buffer for the blurred frame, reused across frames
+		self._blur_buf: np.ndarray | None = None
+		# Last validated strength and its kernel size tuple
+		self._strength: int | None = None
+		self._ksize: tuple[int, int] | None = None
+	
+	def apply(self, frame: np.ndarray, mask: np.ndarray, strength: int = 25, dst: np.ndarray | None = None) -> np.ndarray:
+		"""
+		Args:
+			frame: Input frame (BGR format)
+			mask: Person segmentation mask (None blurs the whole frame)
+			strength: Gaussian kernel size (positive, odd)
+			dst: Optional preallocated uint8 buffer (same shape as frame) to write into
+		
+		The blur runs directly on the uint8 frame (OpenCV's fixed-point path).
+		"""
+		if strength != self._strength:
+			if strength <= 0:
+				raise ValueError(f"Strength must be positive, got {strength}")
+			if strength % 2 == 0:
+				raise ValueError(f"Strength must be odd (Gaussian blur requires odd kernel size), got {strength}. Use an odd number like {strength + 1} or {strength - 1}")
+			self._strength = strength
+			self._ksize = (strength, strength)
+		ksize = self._ksize
+		if dst is None:
+			dst = np.empty_like(frame)
 		
 		# If no mask provided, blur the entire frame
 		if mask is None:
-			blurred = cv2.GaussianBlur(frame_f, (strength, strength), 0)
-			return np.clip(blurred, 0, 255).astype(np.uint8)
-		
-		mask_f = np.clip(mask.astype(np.float32), 0.0, 1.0)
-		blurred = cv2.GaussianBlur(frame_f, (strength, strength), 0)
-		mask_3d = np.stack((mask_f,) * 3, axis=-1)
-		blended = frame_f * mask_3d + blurred * (1.0 - mask_3d)
-		return np.clip(blended, 0, 255).astype(np.uint8)
+			return gpu.gaussian_blur(frame, ksize, dst)
+		
+		weights = _mask_weights(mask, frame)
+		if self._blur_buf is None or self._blur_buf.shape != frame.shape:
+			self._blur_buf = np.empty_like(frame)
+		self._blur_buf = gpu.gaussian_blur(frame, ksize, self._blur_buf)
+		return blend_u8(frame, self._blur_buf, weights, dst)
 
 
 class BackgroundReplace:
-	def apply(self, frame: np.ndarray, mask: np.ndarray, background: np.ndarray) -> np.ndarray:
+	def __init__(self):
+		# Background resized to the frame size, reused until the image or frame size changes
+		self._bg_cache: np.ndarray | None = None
+		self._bg_key: tuple | None = None
+		# Holding the source keeps its id() from being reused by a different image
+		self._bg_source: np.ndarray | None = None
+	
+	def apply(self, frame: np.ndarray, mask: np.ndarray, background: np.ndarray, dst: np.ndarray | None = None) -> np.ndarray:
 		if background is None:
 			raise ValueError("Background image is not loaded or invalid.")
-		frame_f = frame.astype(np.float32)
-		mask_f = np.clip(mask.astype(np.float32), 0.0, 1.0)
-		bg = cv2.resize(background, (frame.shape[1], frame.shape[0])).astype(np.float32)
-		mask_3d = np.stack((mask_f,) * 3, axis=-1)
-		blended = frame_f * mask_3d + bg * (1.0 - mask_3d)
-		return np.clip(blended, 0, 255).astype(np.uint8)
+		if dst is None:
+			dst = np.empty_like(frame)
+		weights = _mask_weights(mask, frame)
+		key = (id(background), background.shape, frame.shape[:2])
+		if key != self._bg_key or background is not self._bg_source:
+			self._bg_cache = cv2.resize(background, (frame.shape[1], frame.shape[0]))
+			self._bg_key = key
+			self._bg_source = background
+		return blend_u8(frame, self._bg_cache, weights, dst)
 
 
 class BrightnessAdjustment:
@@ -40,7 +80,7 @@ class BrightnessAdjustment:
 	
 	Can be applied globally or selectively to the face region using a mask.
 	"""
-	def apply(self, frame: np.ndarray, mask: np.ndarray | None = None, brightness: int = 0, contrast: float = 1.0, face_only: bool = False) -> np.ndarray:
+	def apply(self, frame: np.ndarray, mask: np.ndarray | None = None, brightness: int = 0, contrast: float = 1.0, face_only: bool = False, dst: np.ndarray | None = None) -> np.ndarray:
 		"""
 		Args:
 			frame: Input frame (BGR format)
@@ -48,6 +88,7 @@ class BrightnessAdjustment:
 			brightness: Brightness adjustment (-100 to 100, 0 = no change)
 			contrast: Contrast multiplier (0.5 to 2.0, 1.0 = no change)
 			face_only: If True and mask provided, apply only to face region
+			dst: Optional preallocated uint8 buffer (same shape as frame) to write into
 		"""
 		# Clamp values
 		brightness = np.clip(brightness, -100, 100)
@@ -55,31 +96,43 @@ class BrightnessAdjustment:
 		
 		if face_only and mask is not None:
 			# Apply to face region only
-			mask_f = np.clip(mask.astype(np.float32), 0.0, 1.0)
-			mask_3d = np.stack((mask_f,) * 3, axis=-1)
+			weights = _mask_weights(mask, frame)
 			
 			# Adjust face region
-			face_region = frame.astype(np.float32)
-			face_adjusted = cv2.convertScaleAbs(face_region, alpha=contrast, beta=brightness)
+			face_adjusted = cv2.convertScaleAbs(frame, alpha=contrast, beta=brightness)
 			
-			# Keep background unchanged
-			background = frame.astype(np.float32)
-			
-			# Blend
-			result = face_adjusted.astype(np.float32) * mask_3d + background * (1.0 - mask_3d)
-			return np.clip(result, 0, 255).astype(np.uint8)
+			# Blend adjusted face over the unchanged background
+			if dst is None:
+				dst = np.empty_like(frame)
+			return blend_u8(face_adjusted, frame, weights, dst)
 		else:
-			# Apply globally
-			frame_f = frame.astype(np.float32)
-			return cv2.convertScaleAbs(frame_f, alpha=contrast, beta=brightness)
+			# Apply globally; convertScaleAbs saturates straight from uint8
+			return cv2.convertScaleAbs(frame, dst=dst, alpha=contrast, beta=brightness)
 
 
 class FaceBeautification:
 	"""Apply skin smoothing and beautification effects to the face.
 	
 	Uses MediaPipe Face Mesh landmarks to identify face region and applies
-	bilateral filtering for natural-looking skin smoothing.
+	bilateral filtering for natural-looking skin smoothing. The face mask is
+	cached and Face Mesh only re-runs every few frames or when the scene moves.
 	"""
+	# Re-run Face Mesh at least this often (in frames) even when the scene is still
+	_MESH_INTERVAL = 5
+	# Mean absolute difference (0-255) on the motion thumbnail that forces a re-run
+	_MOTION_THRESHOLD = 4.0
+	# Thumbnail size used for the motion check
+	_THUMB_SIZE = (160, 90)
+	# Face Mesh input width; MediaPipe resizes internally anyway
+	_MESH_WIDTH = 320
+	# Upper bound on frames skipped after consecutive Face Mesh misses
+	_MAX_MISS_SKIP = 10
+	# Face-local canonical mask: size, and where the anchor landmarks
+	# (nose tip, eye outer corners) sit in it
+	_CANONICAL_SIZE = 160
+	_ANCHOR_INDICES = (1, 33, 263)
+	_CANONICAL_ANCHORS = np.float32([[80, 95], [50, 65], [110, 65]])
+	
 	def __init__(self):
 		import mediapipe as mp
 		self.face_mesh = mp.solutions.face_mesh.FaceMesh(
@@ -88,59 +141,139 @@ class FaceBeautification:
 			min_detection_confidence=0.5,
 			min_tracking_confidence=0.5
 		)
+		# Only the face oval contributes to the convex hull, so skip the other landmarks
+		self._oval_indices = sorted({i for edge in mp.solutions.face_mesh.FACEMESH_FACE_OVAL for i in edge})
+		self._cached_mask: np.ndarray | None = None
+		# Feathered face mask in canonical space, warped onto each frame
+		self._canonical_mask: np.ndarray | None = None
+		self._frame_count = 0
+		self._prev_small: np.ndarray | None = None
+		# Back-off while no face is found: skip Face Mesh for _miss_skip frames
+		self._miss_streak = 0
+		self._miss_skip = 0
+		# Bilateral filter output, reused across frames when writing into dst
+		self._smooth_buf: np.ndarray | None = None
 	
-	def apply(self, frame: np.ndarray, mask: np.ndarray | None = None, smoothness: int = 5) -> np.ndarray:
+	def apply(self, frame: np.ndarray, mask: np.ndarray | None = None, smoothness: int = 5, dst: np.ndarray | None = None) -> np.ndarray:
 		"""
 		Args:
 			frame: Input frame (BGR format)
 			mask: Optional segmentation mask (unused, kept for API compatibility)
 			smoothness: Skin smoothing strength (1-15, higher = more smoothing)
+			dst: Optional preallocated uint8 buffer (same shape as frame) to write into
 		"""
+		# A 1-pixel bilateral filter is an identity; skip Face Mesh entirely
+		if smoothness <= 1:
+			return frame
 		# Clamp smoothness
-		smoothness = max(1, min(15, smoothness))
+		smoothness = min(15, smoothness)
 		# Ensure odd number for bilateral filter
 		if smoothness % 2 == 0:
 			smoothness += 1
 		
-		# Convert to RGB for MediaPipe
-		frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-		results = self.face_mesh.process(frame_rgb)
-		
-		if results.multi_face_landmarks:
-			# Get face landmarks
-			face_landmarks = results.multi_face_landmarks[0]
-			h, w = frame.shape[:2]
-			
-			# Extract face region using landmarks
-			# Get face contour points (approximate face oval)
-			face_points = []
-			for landmark in face_landmarks.landmark:
-				x = int(landmark.x * w)
-				y = int(landmark.y * h)
-				face_points.append([x, y])
-			
-			face_points = np.array(face_points, dtype=np.int32)
-			
-			# Create mask for face region
-			face_mask = np.zeros((h, w), dtype=np.uint8)
-			# Use convex hull for face region
-			hull = cv2.convexHull(face_points)
-			cv2.fillPoly(face_mask, [hull], 255)
-			
-			# Smooth the mask edges
-			face_mask = cv2.GaussianBlur(face_mask, (21, 21), 0)
-			face_mask = face_mask.astype(np.float32) / 255.0
-			face_mask_3d = np.stack((face_mask,) * 3, axis=-1)
-			
-			# Apply bilateral filter for skin smoothing (preserves edges)
-			smoothed = cv2.bilateralFilter(frame, smoothness, 75, 75)
-			
-			# Blend smoothed face with original
-			result = frame.astype(np.float32) * (1.0 - face_mask_3d) + smoothed.astype(np.float32) * face_mask_3d
-			return np.clip(result, 0, 255).astype(np.uint8)
-		else:
+		face_mask = self._face_mask(frame)
+		if face_mask is None:
 			# No face detected, return original
 			return frame
+		
+		# Apply bilateral filter for skin smoothing (preserves edges)
+		if dst is None:
+			smoothed = dst = gpu.bilateral_filter(frame, smoothness, 75, 75)
+		else:
+			if self._smooth_buf is None or self._smooth_buf.shape != frame.shape:
+				self._smooth_buf = np.empty_like(frame)
+			smoothed = self._smooth_buf = gpu.bilateral_filter(frame, smoothness, 75, 75, self._smooth_buf)
+		
+		# Blend smoothed face with original
+		return blend_u8(smoothed, frame, face_mask, dst)
+	
+	def _face_mask(self, frame: np.ndarray) -> np.ndarray | None:
+		"""Return the float32 face mask for frame, reusing the cached one when possible."""
+		h, w = frame.shape[:2]
+		small = cv2.resize(frame, self._THUMB_SIZE, interpolation=cv2.INTER_AREA)
+		
+		self._frame_count += 1
+		still = (
+			self._prev_small is not None
+			and cv2.norm(small, self._prev_small, cv2.NORM_L1) / small.size < self._MOTION_THRESHOLD
+		)
+		if (
+			still
+			and self._cached_mask is not None
+			and self._cached_mask.shape == (h, w)
+			and self._frame_count % self._MESH_INTERVAL != 0
+		):
+			return self._cached_mask
+		if still and self._miss_skip > 0:
+			# No face lately and nothing moved; don't look again yet
+			self._miss_skip -= 1
+			return None
+		
+		self._frame_count = 0
+		self._prev_small = small
+		previous_mask, self._cached_mask = self._cached_mask, None
+		
+		# Convert to RGB for MediaPipe, on a downscaled copy (landmarks are normalized)
+		if w > self._MESH_WIDTH:
+			mesh_h = max(1, round(h * self._MESH_WIDTH / w))
+			mesh_input = cv2.resize(frame, (self._MESH_WIDTH, mesh_h), interpolation=cv2.INTER_AREA)
+		else:
+			mesh_input = frame
+		frame_rgb = cv2.cvtColor(mesh_input, cv2.COLOR_BGR2RGB)
+		results = self.face_mesh.process(frame_rgb)
+		
+		if not results.multi_face_landmarks:
+			self._miss_streak += 1
+			self._miss_skip = min(self._miss_streak, self._MAX_MISS_SKIP)
+			# The next face found may be someone else; rebuild its shape then
+			self._canonical_mask = None
+			return None
+		self._miss_streak = 0
+		self._miss_skip = 0
+		
+		# Get face landmarks
+		landmarks = results.multi_face_landmarks[0].landmark
+		anchors = np.array([(landmarks[i].x * w, landmarks[i].y * h) for i in self._ANCHOR_INDICES], dtype=np.float32)
+		if self._canonical_mask is None:
+			self._canonical_mask = self._build_canonical_mask(landmarks, anchors, w, h)
+		
+		# Place the canonical mask on the face with a single bilinear pass
+		M = cv2.getAffineTransform(self._CANONICAL_ANCHORS, anchors)
+		if previous_mask is None or previous_mask.shape != (h, w):
+			previous_mask = None
+		self._cached_mask = cv2.warpAffine(
+			self._canonical_mask, M, (w, h), dst=previous_mask,
+			flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_CONSTANT, borderValue=0
+		)
+		return self._cached_mask
+	
+	def _build_canonical_mask(self, landmarks, anchors: np.ndarray, w: int, h: int) -> np.ndarray:
+		"""Rasterize the face oval into canonical space and feather its edges.
+		
+		Args:
+			landmarks: Face Mesh landmarks (normalized coordinates)
+			anchors: Anchor landmark positions in frame pixels
+			w: Frame width
+			h: Frame height
+		
+		Returns:
+			float32 mask in [0, 1] of size _CANONICAL_SIZE x _CANONICAL_SIZE
+		"""
+		# Extract face region from the face oval landmarks, mapped into canonical space
+		points = np.array([(landmarks[i].x, landmarks[i].y) for i in self._oval_indices], dtype=np.float32)
+		to_canonical = cv2.getAffineTransform(anchors, self._CANONICAL_ANCHORS)
+		face_points = cv2.transform((points * (w, h))[None], to_canonical)[0].astype(np.int32)
+		
+		# Create mask for face region
+		size = self._CANONICAL_SIZE
+		face_mask = np.zeros((size, size), dtype=np.uint8)
+		# Use convex hull for face region
+		hull = cv2.convexHull(face_points)
+		cv2.fillPoly(face_mask, [hull], 255)
+		
+		# Smooth the mask edges
+		face_mask = cv2.GaussianBlur(face_mask, (9, 9), 0)
+		return face_mask.astype(np.float32) * (1.0 / 255.0)
 
 
 class AutoFraming:
@@ -148,10 +281,15 @@ class AutoFraming:
 	
 	Maintains original frame dimensions by cropping and scaling.
 	"""
+	# Face detection runs on a downscaled copy; the bbox only needs to be coarse
+	_DETECT_SCALE = 0.25
+	# Skip downscaling when it would leave the detector too few pixels
+	_MIN_DETECT_WIDTH = 320
+	
 	def __init__(self):
 		self.face_detector = FaceDetector()
 	
-	def apply(self, frame: np.ndarray, mask: np.ndarray | None = None, padding: float = 0.3, min_zoom: float = 1.0, max_zoom: float = 2.0) -> np.ndarray:
+	def apply(self, frame: np.ndarray, mask: np.ndarray | None = None, padding: float = 0.3, min_zoom: float = 1.0, max_zoom: float = 2.0, dst: np.ndarray | None = None) -> np.ndarray:
 		"""
 		Args:
 			frame: Input frame (BGR format)
@@ -159,15 +297,27 @@ class AutoFraming:
 			padding: Padding around face as fraction of face size (0.0-1.0)
 			min_zoom: Minimum zoom level (1.0 = no zoom, >1.0 = zoom in)
 			max_zoom: Maximum zoom level
+			dst: Optional preallocated buffer (same shape as frame) to write into
 		"""
 		h, w = frame.shape[:2]
-		bbox = self.face_detector.get_face_bbox(frame, smooth=True)
+		if w * self._DETECT_SCALE >= self._MIN_DETECT_WIDTH:
+			small = cv2.resize(frame, (0, 0), fx=self._DETECT_SCALE, fy=self._DETECT_SCALE, interpolation=cv2.INTER_AREA)
+		else:
+			small = frame
+		bbox = self.face_detector.get_face_bbox(small, smooth=True)
 		
 		if bbox is None:
 			# No face detected, return original
 			return frame
 		
+		# Scale the bbox back to full-resolution coordinates
+		scale_x = w / small.shape[1]
+		scale_y = h / small.shape[0]
 		x, y, face_w, face_h = bbox
+		x = int(x * scale_x)
+		y = int(y * scale_y)
+		face_w = int(face_w * scale_x)
+		face_h = int(face_h * scale_y)
 		
 		# Calculate desired crop region with padding
 		padding_pixels_w = int(face_w * padding)
@@ -212,8 +362,7 @@ class AutoFraming:
 		
 		# Resize to original dimensions
 		if cropped.size > 0:
-			result = cv2.resize(cropped, (w, h), interpolation=cv2.INTER_LINEAR)
-			return result
+			return gpu.resize(cropped, (w, h), interpolation=cv2.INTER_LINEAR, dst=dst)
 		else:
 			# Fallback if crop is invalid
 			return frame
@@ -0,0 +1,118 @@
+"""Optional CUDA offload for the heavier OpenCV image kernels.
+
+Used only when OpenCV is built with CUDA and a device is present. Every
+helper falls back to the matching CPU call otherwise, so callers never
+need to check ``HAS_CUDA`` themselves.
+"""
+
+import logging
+import threading
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger('camfx.gpu')
+
+
+def _detect_cuda() -> bool:
+	try:
+		return hasattr(cv2, 'cuda') and cv2.cuda.getCudaEnabledDeviceCount() > 0
+	except cv2.error:
+		return False
+
+
+HAS_CUDA = _detect_cuda()
+if HAS_CUDA:
+	logger.info("CUDA device available, offloading blur/bilateral/resize to GPU")
+
+# CUDA separable filters are limited to 32-tap kernels
+_MAX_CUDA_GAUSSIAN_KSIZE = 31
+
+# Device buffers and filters keyed by role, reused across the chain. They are
+# per thread because pipeline stages (EffectPipeline) run effects concurrently.
+_local = threading.local()
+
+
+def _cache(name: str) -> dict:
+	cache = getattr(_local, name, None)
+	if cache is None:
+		cache = {}
+		setattr(_local, name, cache)
+	return cache
+
+
+def _mat(name: str):
+	mats = _cache('mats')
+	mat = mats.get(name)
+	if mat is None:
+		mat = cv2.cuda_GpuMat()
+		mats[name] = mat
+	return mat
+
+
+def _upload(frame: np.ndarray):
+	src = _mat('src')
+	src.upload(frame)
+	return src
+
+
+def gaussian_blur(frame: np.ndarray, ksize: tuple[int, int], dst: np.ndarray | None = None) -> np.ndarray:
+	"""Gaussian blur of a uint8 BGR frame.
+	
+	Args:
+		frame: Input frame (BGR, uint8)
+		ksize: Odd kernel size as a (width, height) tuple
+		dst: Optional preallocated output buffer
+	
+	Returns:
+		Blurred frame (``dst`` when given)
+	"""
+	if not HAS_CUDA or ksize[0] > _MAX_CUDA_GAUSSIAN_KSIZE:
+		return cv2.GaussianBlur(frame, ksize, 0, dst=dst)
+	filters = _cache('gaussian_filters')
+	gauss = filters.get(ksize)
+	if gauss is None:
+		# The CUDA linear filters take 1- or 4-channel images only
+		gauss = cv2.cuda.createGaussianFilter(cv2.CV_8UC4, cv2.CV_8UC4, ksize, 0)
+		filters[ksize] = gauss
+	bgra = cv2.cuda.cvtColor(_upload(frame), cv2.COLOR_BGR2BGRA, _mat('bgra'))
+	blurred = gauss.apply(bgra, _mat('blurred'))
+	out = cv2.cuda.cvtColor(blurred, cv2.COLOR_BGRA2BGR, _mat('out'))
+	return out.download(dst)
+
+
+def bilateral_filter(frame: np.ndarray, d: int, sigma_color: float, sigma_space: float, dst: np.ndarray | None = None) -> np.ndarray:
+	"""Edge-preserving bilateral filter of a uint8 BGR frame.
+	
+	Args:
+		frame: Input frame (BGR, uint8)
+		d: Diameter of the pixel neighbourhood
+		sigma_color: Filter sigma in color space
+		sigma_space: Filter sigma in coordinate space
+		dst: Optional preallocated output buffer (must not alias frame)
+	
+	Returns:
+		Filtered frame (``dst`` when given)
+	"""
+	if not HAS_CUDA:
+		return cv2.bilateralFilter(frame, d, sigma_color, sigma_space, dst=dst)
+	out = cv2.cuda.bilateralFilter(_upload(frame), d, sigma_color, sigma_space, _mat('out'))
+	return out.download(dst)
+
+
+def resize(frame: np.ndarray, dsize: tuple[int, int], interpolation: int = cv2.INTER_LINEAR, dst: np.ndarray | None = None) -> np.ndarray:
+	"""Resize a frame to ``dsize`` (width, height).
+	
+	Args:
+		frame: Input frame
+		dsize: Output size as (width, height)
+		interpolation: OpenCV interpolation flag
+		dst: Optional preallocated output buffer of size ``dsize`` (must not alias frame)
+	
+	Returns:
+		Resized frame (``dst`` when given)
+	"""
+	if not HAS_CUDA:
+		return cv2.resize(frame, dsize, dst=dst, interpolation=interpolation)
+	out = cv2.cuda.resize(_upload(frame), dsize, _mat('out'), interpolation=interpolation)
+	return out.download(dst)
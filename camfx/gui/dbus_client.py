@@ -1,12 +1,46 @@
 """D-Bus client wrapper for camfx service."""
 
+import functools
+import logging
+
 import dbus
 import dbus.exceptions
-from typing import List, Dict, Any, Optional, Callable
+from dbus.mainloop.glib import DBusGMainLoop, threads_init
+from typing import List, Dict, Any, Optional, Callable, Tuple
 import gi
 gi.require_version('GLib', '2.0')
 from gi.repository import GLib
 
+logger = logging.getLogger('camfx.gui.dbus_client')
+
+# The client may be created on a worker thread and then used from the GTK thread
+threads_init()
+
+
+# Exact-type converters for UpdateEffectParameter values (bool must not fall into int)
+_DBUS_VALUE_TYPES = {
+	bool: dbus.Boolean,
+	int: dbus.Int32,
+	float: dbus.Double,
+	str: dbus.String,
+}
+
+
+def _to_dbus_dict(config: Dict[str, Any]) -> dbus.Dictionary:
+	"""Convert an effect config to an a{sv} dictionary, dropping None values (D-Bus can't encode NoneType)."""
+	return dbus.Dictionary({k: v for k, v in config.items() if v is not None}, signature='sv')
+
+
+def _to_dbus_value(value: Any):
+	"""Convert a parameter value to a D-Bus variant-compatible value."""
+	converter = _DBUS_VALUE_TYPES.get(type(value))
+	if converter is not None:
+		return converter(value)
+	# Subclasses such as numpy scalars take the slower path
+	if isinstance(value, (int, float, str, bool)):
+		return value
+	return str(value)
+
 
 class CamfxDBusClient:
 	"""Wrapper for D-Bus communication with camfx service."""
@@ -14,86 +48,129 @@ class CamfxDBusClient:
 	SERVICE_NAME = 'org.camfx.Control1'
 	OBJECT_PATH = '/org/camfx/Control1'
 	INTERFACE_NAME = 'org.camfx.Control1'
+	# Parameter updates are coalesced and sent at most once per frame (~60 Hz)
+	PARAMETER_FLUSH_MS = 16
+	# Remote methods bound once in _connect, as attribute name -> (D-Bus member,
+	# in_signature). The proxy skips introspection, so the signatures must match
+	# the service's declarations or arguments are marshalled by guessing from
+	# their Python types (e.g. int as 'i' where the service expects 'u').
+	_RPC_METHODS = {
+		'_rpc_get_current_effects': ('GetCurrentEffects', ''),
+		'_rpc_add_effect': ('AddEffect', 'sa{sv}'),
+		'_rpc_set_effect': ('SetEffect', 'sa{sv}'),
+		'_rpc_remove_effect': ('RemoveEffect', 'i'),
+		'_rpc_remove_effect_by_type': ('RemoveEffectByType', 's'),
+		'_rpc_clear_chain': ('ClearChain', ''),
+		'_rpc_update_effect_parameter': ('UpdateEffectParameter', 'ssv'),
+		'_rpc_start_camera': ('StartCamera', ''),
+		'_rpc_stop_camera': ('StopCamera', ''),
+		'_rpc_get_camera_state': ('GetCameraState', ''),
+		'_rpc_list_camera_sources': ('ListCameraSources', ''),
+		'_rpc_get_camera_modes': ('GetCameraModes', 's'),
+		'_rpc_get_camera_config': ('GetCameraConfig', ''),
+		'_rpc_apply_camera_config': ('ApplyCameraConfig', 'suuu'),
+	}
 	
 	def __init__(self):
 		"""Initialize D-Bus client."""
-		self.bus = dbus.SessionBus()
+		# GLib main loop integration delivers signals and async replies on the GTK loop
+		self.bus = dbus.SessionBus(mainloop=DBusGMainLoop())
 		self.service = None
 		self.control = None
 		self.signal_handlers = []
+		# Latest unsent (value, callback) per (effect_type, parameter)
+		self._pending: Dict[Tuple[str, str], Tuple[Any, Optional[Callable]]] = {}
+		self._flush_timer: Optional[int] = None
 		self._connect()
-		self._setup_signals()
 	
 	def _connect(self):
 		"""Connect to camfx D-Bus service."""
 		try:
+			# Every call names its interface and argument signature (_RPC_METHODS),
+			# so skip the Introspect round-trip before the first method call
 			self.service = self.bus.get_object(
 				self.SERVICE_NAME,
-				self.OBJECT_PATH
+				self.OBJECT_PATH,
+				introspect=False
 			)
 			self.control = dbus.Interface(
 				self.service,
 				self.INTERFACE_NAME
 			)
+			# Bind each remote method once instead of resolving it through the proxy per call
+			for attr, (member, signature) in self._RPC_METHODS.items():
+				method = self.service.get_dbus_method(member, self.INTERFACE_NAME)
+				setattr(self, attr, functools.partial(method, signature=signature))
 		except dbus.exceptions.DBusException as e:
 			raise ConnectionError(f"camfx service not running: {e}")
 	
-	def is_connected(self) -> bool:
-		"""Check if connected to service."""
-		return self.service is not None and self.control is not None
-	
-	def _setup_signals(self):
-		"""Set up signal handlers for effect changes."""
+	@staticmethod
+	def _wrap(method: Callable, *args):
+		"""Call a bound remote method, mapping D-Bus failures to ConnectionError."""
 		try:
-			self.service.connect_to_signal(
-				'EffectChanged',
-				self._on_effect_changed,
-				dbus_interface=self.INTERFACE_NAME
-			)
-			self.service.connect_to_signal(
-				'CameraStateChanged',
-				self._on_camera_state_changed,
-				dbus_interface=self.INTERFACE_NAME
-			)
-			self.service.connect_to_signal(
-				'CameraConfigChanged',
-				self._on_camera_config_changed,
-				dbus_interface=self.INTERFACE_NAME
-			)
-		except Exception as e:
-			# Signals may not be available if service is not running
-			pass
-	
-	def _on_effect_changed(self, action: str, effect_type: str, config: Dict[str, Any]):
-		"""Internal callback for effect change signals."""
-		# This will be overridden by signal handlers set via connect_signals
-		pass
+			return method(*args)
+		except dbus.exceptions.DBusException as e:
+			raise ConnectionError(f"D-Bus error: {e}")
 	
-	def _on_camera_state_changed(self, is_active: bool):
-		"""Internal callback for camera state change signals."""
-		# This will be overridden by signal handlers set via connect_signals
-		pass
+	@staticmethod
+	def _call_async(method: Callable, args: tuple, callback: Callable, convert: Callable = lambda reply: reply):
+		"""Call a bound remote method without blocking the main loop.
+		
+		Args:
+			method: Bound remote method
+			args: Call arguments
+			callback: Callback(result, error) run on the main loop; error is a
+				ConnectionError on failure, in which case result is None
+			convert: Maps the raw reply to the result passed to callback
+		"""
+		def on_reply(*reply):
+			# Methods with several out args reply with several values
+			raw = reply[0] if len(reply) == 1 else reply
+			try:
+				result = convert(raw)
+			except Exception as e:
+				callback(None, ConnectionError(f"Malformed D-Bus reply: {e}"))
+				return
+			callback(result, None)
+		
+		def on_error(e):
+			callback(None, ConnectionError(f"D-Bus error: {e}"))
+		
+		method(*args, reply_handler=on_reply, error_handler=on_error)
 	
-	def _on_camera_config_changed(self, source_id: str, width: int, height: int, fps: int):
-		"""Internal callback for camera configuration changes."""
-		pass
+	def is_connected(self) -> bool:
+		"""Check if connected to service."""
+		return self.service is not None and self.control is not None
 	
 	def connect_signals(self, on_effect_changed: Optional[Callable] = None,
 	                   on_camera_state_changed: Optional[Callable] = None,
 	                   on_camera_config_changed: Optional[Callable] = None):
 		"""Connect signal handlers.
 		
+		Callbacks are registered with the bus directly, so dbus-python calls
+		them from the GLib main loop without an intermediate dispatch.
+		
 		Args:
 			on_effect_changed: Callback(action, effect_type, config)
 			on_camera_state_changed: Callback(is_active)
 			on_camera_config_changed: Callback(source_id, width, height, fps)
 		"""
-		if on_effect_changed:
-			self._on_effect_changed = on_effect_changed
-		if on_camera_state_changed:
-			self._on_camera_state_changed = on_camera_state_changed
-		if on_camera_config_changed:
-			self._on_camera_config_changed = on_camera_config_changed
+		for signal_name, handler in (
+			('EffectChanged', on_effect_changed),
+			('CameraStateChanged', on_camera_state_changed),
+			('CameraConfigChanged', on_camera_config_changed),
+		):
+			if handler is None:
+				continue
+			try:
+				self.signal_handlers.append(self.service.connect_to_signal(
+					signal_name,
+					handler,
+					dbus_interface=self.INTERFACE_NAME
+				))
+			except dbus.exceptions.DBusException as e:
+				# Signals may not be available if service is not running
+				logger.warning("Failed to connect %s signal: %s", signal_name, e)
 	
 	def get_current_effects(self) -> List[tuple]:
 		"""Get current effect chain.
@@ -101,10 +178,7 @@ class CamfxDBusClient:
 		Returns:
 			List of tuples: (effect_type, class_name, config_dict)
 		"""
-		try:
-			return self.control.GetCurrentEffects()
-		except dbus.exceptions.DBusException as e:
-			raise ConnectionError(f"D-Bus error: {e}")
+		return self._wrap(self._rpc_get_current_effects)
 	
 	def add_effect(self, effect_type: str, config: Dict[str, Any]) -> bool:
 		"""Add effect to chain.
@@ -116,14 +190,8 @@ class CamfxDBusClient:
 		Returns:
 			True if successful, False otherwise
 		"""
-		try:
-			# Filter out None values - D-Bus can't encode NoneType
-			dbus_config = {k: v for k, v in config.items() if v is not None}
-			# Convert to dbus-compatible format
-			dbus_config = dbus.Dictionary(dbus_config, signature='sv')
-			return self.control.AddEffect(effect_type, dbus_config)
-		except dbus.exceptions.DBusException as e:
-			raise ConnectionError(f"D-Bus error: {e}")
+		self.flush()
+		return self._wrap(self._rpc_add_effect, effect_type, _to_dbus_dict(config))
 	
 	def set_effect(self, effect_type: str, config: Dict[str, Any]) -> bool:
 		"""Replace all effects with a single effect.
@@ -135,14 +203,8 @@ class CamfxDBusClient:
 		Returns:
 			True if successful, False otherwise
 		"""
-		try:
-			# Filter out None values - D-Bus can't encode NoneType
-			dbus_config = {k: v for k, v in config.items() if v is not None}
-			# Convert to dbus-compatible format
-			dbus_config = dbus.Dictionary(dbus_config, signature='sv')
-			return self.control.SetEffect(effect_type, dbus_config)
-		except dbus.exceptions.DBusException as e:
-			raise ConnectionError(f"D-Bus error: {e}")
+		self.flush()
+		return self._wrap(self._rpc_set_effect, effect_type, _to_dbus_dict(config))
 	
 	def remove_effect(self, index: int) -> bool:
 		"""Remove effect from chain by index.
@@ -153,10 +215,8 @@ class CamfxDBusClient:
 		Returns:
 			True if successful, False otherwise
 		"""
-		try:
-			return self.control.RemoveEffect(index)
-		except dbus.exceptions.DBusException as e:
-			raise ConnectionError(f"D-Bus error: {e}")
+		self.flush()
+		return self._wrap(self._rpc_remove_effect, index)
 	
 	def remove_effect_by_type(self, effect_type: str) -> bool:
 		"""Remove effect from chain by type.
@@ -167,10 +227,8 @@ class CamfxDBusClient:
 		Returns:
 			True if successful, False otherwise
 		"""
-		try:
-			return self.control.RemoveEffectByType(effect_type)
-		except dbus.exceptions.DBusException as e:
-			raise ConnectionError(f"D-Bus error: {e}")
+		self.flush()
+		return self._wrap(self._rpc_remove_effect_by_type, effect_type)
 	
 	def clear_chain(self) -> bool:
 		"""Clear all effects from chain.
@@ -178,31 +236,56 @@ class CamfxDBusClient:
 		Returns:
 			True if successful, False otherwise
 		"""
-		try:
-			return self.control.ClearChain()
-		except dbus.exceptions.DBusException as e:
-			raise ConnectionError(f"D-Bus error: {e}")
+		self.flush()
+		return self._wrap(self._rpc_clear_chain)
 	
-	def update_effect_parameter(self, effect_type: str, parameter: str, value: Any) -> bool:
-		"""Update a parameter of an effect in the chain.
+	def update_effect_parameter(self, effect_type: str, parameter: str, value: Any,
+	                            callback: Optional[Callable] = None):
+		"""Queue a parameter update; only the latest value per parameter is sent.
+		
+		Updates are flushed by a short GLib timer, so rapid slider changes
+		collapse into one D-Bus call per frame. Call flush() to send immediately.
 		
 		Args:
 			effect_type: Type of effect to update
 			parameter: Parameter name
 			value: New parameter value
-		
-		Returns:
-			True if successful, False otherwise
+			callback: Optional callback(success, error) run on the main loop once
+				the service replies; error is a ConnectionError on failure. A value
+				superseded before the flush is never sent and its callback never runs.
 		"""
-		try:
-			# Convert value to dbus-compatible type
-			if isinstance(value, (int, float, str, bool)):
-				dbus_value = value
-			else:
-				dbus_value = str(value)
-			return self.control.UpdateEffectParameter(effect_type, parameter, dbus_value)
-		except dbus.exceptions.DBusException as e:
-			raise ConnectionError(f"D-Bus error: {e}")
+		self._pending[(effect_type, parameter)] = (value, callback)
+		if self._flush_timer is None:
+			self._flush_timer = GLib.timeout_add(self.PARAMETER_FLUSH_MS, self._flush_pending)
+	
+	def flush(self):
+		"""Send any queued parameter updates now."""
+		if self._flush_timer is not None:
+			GLib.source_remove(self._flush_timer)
+		self._flush_pending()
+	
+	def _flush_pending(self) -> bool:
+		"""Timer callback: send the latest queued value for each parameter."""
+		self._flush_timer = None
+		pending, self._pending = self._pending, {}
+		for (effect_type, parameter), (value, callback) in pending.items():
+			self._call_async(
+				self._rpc_update_effect_parameter,
+				(effect_type, parameter, _to_dbus_value(value)),
+				callback or self._make_parameter_logger(effect_type, parameter, value),
+				bool
+			)
+		return False
+	
+	@staticmethod
+	def _make_parameter_logger(effect_type: str, parameter: str, value: Any) -> Callable:
+		"""Default callback for updates queued without one: log failures."""
+		def on_result(success, error):
+			if error is not None:
+				logger.error("Failed to update %s.%s: %s", effect_type, parameter, error)
+			elif not success:
+				logger.warning("Service rejected %s.%s = %r", effect_type, parameter, value)
+		return on_result
 	
 	def start_camera(self) -> bool:
 		"""Start the camera.
@@ -210,10 +293,11 @@ class CamfxDBusClient:
 		Returns:
 			True if successful, False otherwise
 		"""
-		try:
-			return self.control.StartCamera()
-		except dbus.exceptions.DBusException as e:
-			raise ConnectionError(f"D-Bus error: {e}")
+		return self._wrap(self._rpc_start_camera)
+	
+	def start_camera_async(self, callback: Callable):
+		"""Start the camera without blocking; callback(success, error)."""
+		self._call_async(self._rpc_start_camera, (), callback, bool)
 	
 	def stop_camera(self) -> bool:
 		"""Stop the camera.
@@ -221,10 +305,11 @@ class CamfxDBusClient:
 		Returns:
 			True if successful, False otherwise
 		"""
-		try:
-			return self.control.StopCamera()
-		except dbus.exceptions.DBusException as e:
-			raise ConnectionError(f"D-Bus error: {e}")
+		return self._wrap(self._rpc_stop_camera)
+	
+	def stop_camera_async(self, callback: Callable):
+		"""Stop the camera without blocking; callback(success, error)."""
+		self._call_async(self._rpc_stop_camera, (), callback, bool)
 	
 	def get_camera_state(self) -> bool:
 		"""Get current camera state.
@@ -232,59 +317,74 @@ class CamfxDBusClient:
 		Returns:
 			True if camera is active, False otherwise
 		"""
-		try:
-			return self.control.GetCameraState()
-		except dbus.exceptions.DBusException as e:
-			raise ConnectionError(f"D-Bus error: {e}")
+		return self._wrap(self._rpc_get_camera_state)
+	
+	def get_camera_state_async(self, callback: Callable):
+		"""Get the camera state without blocking; callback(is_active, error)."""
+		self._call_async(self._rpc_get_camera_state, (), callback, bool)
+	
+	@staticmethod
+	def _parse_sources(result) -> List[Dict[str, str]]:
+		return [{'id': str(item[0]), 'label': str(item[1])} for item in result]
+	
+	@staticmethod
+	def _parse_modes(result) -> List[Dict[str, Any]]:
+		modes = []
+		for width, height, fps_list in result:
+			modes.append({
+				'width': int(width),
+				'height': int(height),
+				'fps': [int(fps) for fps in fps_list]
+			})
+		return modes
+	
+	@staticmethod
+	def _parse_config(result) -> Dict[str, Any]:
+		source_id, width, height, fps = result
+		return {
+			'source_id': str(source_id),
+			'width': int(width),
+			'height': int(height),
+			'fps': int(fps),
+		}
 	
 	def list_camera_sources(self) -> List[Dict[str, str]]:
 		"""List available camera sources."""
 		if not self.control:
 			return []
-		try:
-			result = self.control.ListCameraSources()
-			return [{'id': str(item[0]), 'label': str(item[1])} for item in result]
-		except dbus.exceptions.DBusException as e:
-			raise ConnectionError(f"D-Bus error: {e}")
+		return self._parse_sources(self._wrap(self._rpc_list_camera_sources))
+	
+	def list_camera_sources_async(self, callback: Callable):
+		"""List camera sources without blocking; callback(sources, error)."""
+		self._call_async(self._rpc_list_camera_sources, (), callback, self._parse_sources)
 	
 	def get_camera_modes(self, source_id: str) -> List[Dict[str, Any]]:
 		"""Get supported modes for a camera source."""
 		if not self.control:
 			return []
-		try:
-			result = self.control.GetCameraModes(source_id)
-			modes = []
-			for width, height, fps_list in result:
-				modes.append({
-					'width': int(width),
-					'height': int(height),
-					'fps': [int(fps) for fps in fps_list]
-				})
-			return modes
-		except dbus.exceptions.DBusException as e:
-			raise ConnectionError(f"D-Bus error: {e}")
+		return self._parse_modes(self._wrap(self._rpc_get_camera_modes, source_id))
+	
+	def get_camera_modes_async(self, source_id: str, callback: Callable):
+		"""Get modes for a camera source without blocking; callback(modes, error)."""
+		self._call_async(self._rpc_get_camera_modes, (source_id,), callback, self._parse_modes)
 	
 	def get_camera_config(self) -> Dict[str, Any]:
 		"""Fetch the current camera configuration."""
 		if not self.control:
 			return {'source_id': '', 'width': 0, 'height': 0, 'fps': 0}
-		try:
-			source_id, width, height, fps = self.control.GetCameraConfig()
-			return {
-				'source_id': str(source_id),
-				'width': int(width),
-				'height': int(height),
-				'fps': int(fps),
-			}
-		except dbus.exceptions.DBusException as e:
-			raise ConnectionError(f"D-Bus error: {e}")
+		return self._parse_config(self._wrap(self._rpc_get_camera_config))
+	
+	def get_camera_config_async(self, callback: Callable):
+		"""Fetch the camera configuration without blocking; callback(config, error)."""
+		self._call_async(self._rpc_get_camera_config, (), callback, self._parse_config)
 	
 	def apply_camera_config(self, source_id: str, width: int, height: int, fps: int) -> bool:
 		"""Apply a new camera configuration."""
 		if not self.control:
 			return False
-		try:
-			return self.control.ApplyCameraConfig(source_id, int(width), int(height), int(fps))
-		except dbus.exceptions.DBusException as e:
-			raise ConnectionError(f"D-Bus error: {e}")
-
+		return self._wrap(self._rpc_apply_camera_config, source_id, int(width), int(height), int(fps))
+	
+	def apply_camera_config_async(self, source_id: str, width: int, height: int, fps: int, callback: Callable):
+		"""Apply a camera configuration without blocking; callback(success, error)."""
+		args = (source_id, int(width), int(height), int(fps))
+		self._call_async(self._rpc_apply_camera_config, args, callback, bool)
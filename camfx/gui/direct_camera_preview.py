@@ -1,5 +1,6 @@
 """Direct camera preview widget (physical camera feed)."""
 
+import queue
 import threading
 import time
 from typing import Optional
@@ -33,10 +34,17 @@ class DirectCameraPreview(Gtk.Box):
 		self.append(self.status_label)
 		
 		self._thread: Optional[threading.Thread] = None
+		self._convert_thread: Optional[threading.Thread] = None
 		self._running = False
+		# Capture -> convert -> present pipeline; bounded so stale frames are dropped
+		self._read_q: queue.Queue = queue.Queue(maxsize=2)
+		self._display_q: queue.Queue = queue.Queue(maxsize=1)
+		self._present_pending = False
 		self._lock = threading.Lock()
 		self._capture: Optional[cv2.VideoCapture] = None
 		self._current_config: Optional[dict] = None
+		# Reused RGB conversion target
+		self._rgb_buf: Optional[np.ndarray] = None
 	
 	def set_camera_config(self, config: dict):
 		"""Update camera configuration used for preview."""
@@ -61,8 +69,11 @@ class DirectCameraPreview(Gtk.Box):
 			return
 		
 		self._running = True
+		self._present_pending = False
 		self._thread = threading.Thread(target=self._preview_loop, daemon=True)
+		self._convert_thread = threading.Thread(target=self._convert_loop, daemon=True)
 		self._thread.start()
+		self._convert_thread.start()
 	
 	def stop_preview(self):
 		if not self._running:
@@ -73,7 +84,12 @@ class DirectCameraPreview(Gtk.Box):
 		self._running = False
 		if self._thread:
 			self._thread.join(timeout=2.0)
+		if self._convert_thread:
+			self._convert_thread.join(timeout=2.0)
 		self._thread = None
+		self._convert_thread = None
+		self._drain(self._read_q)
+		self._drain(self._display_q)
 		self._release_capture()
 		self._update_status("Preview: Camera is OFF")
 		# Clear the picture to show blank screen
@@ -102,7 +118,11 @@ class DirectCameraPreview(Gtk.Box):
 			index = None
 		
 		if index is not None:
-			cap = cv2.VideoCapture(index)
+			# Open through V4L2 directly rather than letting OpenCV probe backends
+			cap = cv2.VideoCapture(index, cv2.CAP_V4L2)
+			if cap and not cap.isOpened():
+				cap.release()
+				cap = cv2.VideoCapture(index)
 			if cap and not cap.isOpened():
 				cap.release()
 				cap = None
@@ -118,12 +138,17 @@ class DirectCameraPreview(Gtk.Box):
 		width = config.get('width')
 		height = config.get('height')
 		fps = config.get('fps')
+		# Raw YUYV is bandwidth-limited to low frame rates on most USB cameras
+		if fps and int(fps) > 15:
+			cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
 		if width:
 			cap.set(cv2.CAP_PROP_FRAME_WIDTH, int(width))
 		if height:
 			cap.set(cv2.CAP_PROP_FRAME_HEIGHT, int(height))
 		if fps:
 			cap.set(cv2.CAP_PROP_FPS, int(fps))
+		# Keep only the newest frame queued so the preview doesn't lag behind
+		cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 		return cap
 	
 	def _preview_loop(self):
@@ -139,35 +164,83 @@ class DirectCameraPreview(Gtk.Box):
 		
 		self._update_status("Preview: Running")
 		
+		# Capture stage: only reads; cap.read() returns a fresh array each call
 		while self._running:
 			ret, frame = cap.read()
 			if not ret or frame is None:
 				time.sleep(0.05)
 				continue
 			
-			GLib.idle_add(self._update_frame, frame.copy())
+			self._put_latest(self._read_q, frame)
 		
 		self._release_capture()
 	
+	def _convert_loop(self):
+		"""Convert stage: BGR frames from the reader into pixbufs for display."""
+		while self._running:
+			try:
+				frame = self._read_q.get(timeout=0.1)
+			except queue.Empty:
+				continue
+			pixbuf = self._frame_to_pixbuf(frame)
+			if pixbuf is None:
+				continue
+			self._put_latest(self._display_q, pixbuf)
+			with self._lock:
+				if self._present_pending:
+					continue
+				self._present_pending = True
+			GLib.idle_add(self._present_frame)
+	
+	@staticmethod
+	def _put_latest(q: queue.Queue, item):
+		"""Enqueue item, dropping the oldest entry when the queue is full."""
+		while True:
+			try:
+				q.put_nowait(item)
+				return
+			except queue.Full:
+				try:
+					q.get_nowait()
+				except queue.Empty:
+					pass
+	
+	@staticmethod
+	def _drain(q: queue.Queue):
+		while True:
+			try:
+				q.get_nowait()
+			except queue.Empty:
+				return
+	
 	def _release_capture(self):
 		with self._lock:
 			if self._capture:
 				self._capture.release()
 			self._capture = None
 	
-	def _update_frame(self, frame: np.ndarray):
+	def _present_frame(self):
+		"""Present stage (main thread): show the newest converted pixbuf."""
+		with self._lock:
+			self._present_pending = False
+		try:
+			pixbuf = self._display_q.get_nowait()
+		except queue.Empty:
+			return False
 		# Don't update if preview is stopped
-		if not self._running:
-			return
-		if frame is None:
-			return
+		if self._running:
+			self.picture.set_pixbuf(pixbuf)
+		return False
+	
+	def _frame_to_pixbuf(self, frame: np.ndarray) -> Optional[GdkPixbuf.Pixbuf]:
 		try:
-			frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-			if not frame_rgb.flags['C_CONTIGUOUS']:
-				frame_rgb = np.ascontiguousarray(frame_rgb)
-			height, width = frame_rgb.shape[:2]
-			pixbuf = GdkPixbuf.Pixbuf.new_from_data(
-				frame_rgb.tobytes(),
+			if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+				self._rgb_buf = np.empty_like(frame)
+			# cvtColor writes a C-contiguous result into the reused buffer
+			cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+			height, width = frame.shape[:2]
+			pixbuf = GdkPixbuf.Pixbuf.new_from_bytes(
+				GLib.Bytes.new_take(self._rgb_buf.tobytes()),
 				GdkPixbuf.Colorspace.RGB,
 				False,
 				8,
@@ -175,11 +248,10 @@ class DirectCameraPreview(Gtk.Box):
 				height,
 				width * 3
 			)
-			# Check again before setting pixbuf (in case stop was called while processing)
-			if self._running:
-				self.picture.set_pixbuf(pixbuf)
+			return pixbuf
 		except Exception as exc:
 			logger.error("Error updating direct preview frame: %s", exc, exc_info=True)
+			return None
 	
 	def _update_status(self, message: str):
 		GLib.idle_add(self.status_label.set_text, message)
@@ -1,5 +1,6 @@
 """Effect chain list widget."""
 
+import os
 from typing import List, Dict, Any, Optional, Callable
 import gi
 gi.require_version('Gtk', '4.0')
@@ -23,15 +24,13 @@ class EffectChainWidget(Gtk.Box):
 		self.on_effect_selected = on_effect_selected
 		self.effect_rows = []
 		self._last_selected_row = None  # Track last selected row for deselection
+		self._placeholder_row: Optional[Gtk.ListBoxRow] = None  # Empty/error state row
 		
-		self.set_margin_start(10)
-		self.set_margin_end(10)
-		self.set_margin_top(10)
-		self.set_margin_bottom(10)
+		self.add_css_class("effect-chain")
 		
 		# Title
-		title_label = Gtk.Label()
-		title_label.set_markup("<b>Effect Chain</b>")
+		title_label = Gtk.Label(label="Effect Chain")
+		title_label.add_css_class("heading")
 		title_label.set_xalign(0)
 		self.append(title_label)
 		
@@ -64,52 +63,87 @@ class EffectChainWidget(Gtk.Box):
 		self._refresh_chain()
 	
 	def _refresh_chain(self):
-		"""Refresh effect chain from D-Bus service."""
-		# Clear ALL existing rows from list_box (including empty/error rows)
-		# Get all children first, then remove them
-		children = []
-		child = self.list_box.get_first_child()
-		while child is not None:
-			children.append(child)
-			child = child.get_next_sibling()
-		
-		for row in children:
-			self.list_box.remove(row)
-		
-		# Clear effect_rows list and reset selection tracking
-		self.effect_rows.clear()
-		self._last_selected_row = None
+		"""Refresh effect chain from D-Bus service.
 		
+		Rows whose position and effect type are unchanged are updated in place;
+		only rows that differ are recreated.
+		"""
 		# Get current effects
 		try:
 			effects = self.dbus_client.get_current_effects()
 		except Exception as e:
 			# Service not available or error
-			error_row = Gtk.ListBoxRow()
-			error_label = Gtk.Label(label=f"Error: {e}")
-			error_label.set_margin_start(10)
-			error_label.set_margin_top(10)
-			error_label.set_margin_bottom(10)
-			error_row.set_child(error_label)
-			self.list_box.append(error_row)
+			self._show_placeholder(f"Error: {e}")
 			return
 		
 		if not effects:
 			# Empty state
-			empty_row = Gtk.ListBoxRow()
-			empty_label = Gtk.Label(label="No effects in chain")
-			empty_label.set_margin_start(10)
-			empty_label.set_margin_top(10)
-			empty_label.set_margin_bottom(10)
-			empty_row.set_child(empty_label)
-			self.list_box.append(empty_row)
+			self._show_placeholder("No effects in chain")
 			return
 		
-		# Add effect rows
+		self._clear_placeholder()
 		for i, (effect_type, class_name, config) in enumerate(effects):
-			row = self._create_effect_row(i, effect_type, config)
-			self.list_box.append(row)
-			self.effect_rows.append(row)
+			if i < len(self.effect_rows):
+				row = self.effect_rows[i]
+				if row.effect_type == effect_type:
+					if row.effect_config != config:
+						row.effect_config = config
+						row.config_label.set_label(self._format_config(config))
+					continue
+				# A different effect now sits at this position
+				self._remove_row(row)
+				row = self._create_effect_row(i, effect_type, config)
+				self.list_box.insert(row, i)
+				self.effect_rows[i] = row
+			else:
+				row = self._create_effect_row(i, effect_type, config)
+				self.list_box.append(row)
+				self.effect_rows.append(row)
+		
+		# Drop rows past the end of the chain
+		for row in self.effect_rows[len(effects):]:
+			self._remove_row(row)
+		del self.effect_rows[len(effects):]
+	
+	def _remove_row(self, row: Gtk.ListBoxRow):
+		"""Remove a row from the list box, forgetting it if it was selected."""
+		self.list_box.remove(row)
+		if self._last_selected_row is row:
+			self._last_selected_row = None
+	
+	def _show_placeholder(self, text: str):
+		"""Replace all effect rows with a single message row."""
+		for row in self.effect_rows:
+			self._remove_row(row)
+		self.effect_rows.clear()
+		
+		if self._placeholder_row is not None:
+			self._placeholder_row.get_child().set_label(text)
+			return
+		label = Gtk.Label(label=text)
+		label.set_margin_start(10)
+		label.set_margin_top(10)
+		label.set_margin_bottom(10)
+		self._placeholder_row = Gtk.ListBoxRow()
+		self._placeholder_row.set_child(label)
+		self.list_box.append(self._placeholder_row)
+	
+	def _clear_placeholder(self):
+		if self._placeholder_row is not None:
+			self.list_box.remove(self._placeholder_row)
+			self._placeholder_row = None
+	
+	@staticmethod
+	def _format_config(config: Dict[str, Any]) -> str:
+		"""Summarize an effect config for display."""
+		config_parts = []
+		for key, value in config.items():
+			if key in ['background', 'image'] and isinstance(value, str):
+				# Show filename only for image paths
+				config_parts.append(f"{key}={os.path.basename(value)}")
+			else:
+				config_parts.append(f"{key}={value}")
+		return ", ".join(config_parts) if config_parts else "default"
 	
 	def _create_effect_row(self, index: int, effect_type: str, config: Dict[str, Any]) -> Gtk.ListBoxRow:
 		"""Create a row widget for an effect.
@@ -126,10 +160,7 @@ class EffectChainWidget(Gtk.Box):
 		
 		# Main box
 		box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-		box.set_margin_start(10)
-		box.set_margin_end(10)
-		box.set_margin_top(5)
-		box.set_margin_bottom(5)
+		box.add_css_class("effect-chain-row")
 		
 		# Index label (use a fixed-width box for alignment)
 		index_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
@@ -147,17 +178,7 @@ class EffectChainWidget(Gtk.Box):
 		info_box.append(name_label)
 		
 		# Config summary
-		config_parts = []
-		for key, value in config.items():
-			if key in ['background', 'image'] and isinstance(value, str):
-				# Show filename only for image paths
-				import os
-				config_parts.append(f"{key}={os.path.basename(value)}")
-			else:
-				config_parts.append(f"{key}={value}")
-		
-		config_text = ", ".join(config_parts) if config_parts else "default"
-		config_label = Gtk.Label(label=config_text)
+		config_label = Gtk.Label(label=self._format_config(config))
 		config_label.set_xalign(0)
 		config_label.add_css_class("dim-label")
 		info_box.append(config_label)
@@ -177,12 +198,15 @@ class EffectChainWidget(Gtk.Box):
 		row.effect_type = effect_type
 		row.effect_config = config
 		row.effect_index = index
+		# Kept for in-place updates in _refresh_chain
+		row.config_label = config_label
 		
 		return row
 	
 	def _on_row_selected(self, list_box: Gtk.ListBox, row: Optional[Gtk.ListBoxRow]):
 		"""Handle effect row selection or deselection."""
-		if row and hasattr(row, 'effect_type'):
+		# Only effect rows carry effect data; the empty/error placeholder acts as deselection
+		if row is not None and row is not self._placeholder_row:
 			# If clicking the same row again, deselect it
 			if self._last_selected_row == row:
 				self.list_box.unselect_row(row)
@@ -266,10 +290,8 @@ class EffectChainWidget(Gtk.Box):
 	
 	def _show_error(self, message: str):
 		"""Show error message."""
-		# Simple error dialog - try to get parent window
-		parent = None
-		if hasattr(self, 'get_root') and self.get_root():
-			parent = self.get_root()
+		# Simple error dialog - parented to our window when we're in one
+		parent = self.get_root()
 		
 		dialog = Gtk.MessageDialog(
 			transient_for=parent,
@@ -316,10 +338,7 @@ class EffectSelectionDialog(Gtk.Dialog):
 		# Content area
 		content = self.get_content_area()
 		content.set_spacing(10)
-		content.set_margin_start(20)
-		content.set_margin_end(20)
-		content.set_margin_top(20)
-		content.set_margin_bottom(20)
+		content.add_css_class("add-effect-content")
 		
 		# Effect type selection
 		label = Gtk.Label(label="Select effect type:")
@@ -327,10 +346,9 @@ class EffectSelectionDialog(Gtk.Dialog):
 		content.append(label)
 		
 		# Dropdown for effect types
-		self.effect_store = Gtk.StringList()
 		effect_types = ['blur', 'replace', 'brightness', 'beautify', 'autoframe', 'gaze-correct']
-		for effect_type in effect_types:
-			self.effect_store.append(format_effect_name(effect_type))
+		# Build the model in one go rather than one items-changed per append
+		self.effect_store = Gtk.StringList.new([format_effect_name(effect_type) for effect_type in effect_types])
 		
 		self.effect_dropdown = Gtk.DropDown(model=self.effect_store)
 		self.effect_dropdown.set_selected(0)
@@ -349,7 +367,7 @@ class EffectSelectionDialog(Gtk.Dialog):
 			if selected is not None:
 				effect_type = self.effect_types[selected]
 				# Get default config
-				config = get_effect_defaults(effect_type)
+				config = dict(get_effect_defaults(effect_type))
 				if self.on_effect_selected:
 					self.on_effect_selected(effect_type, config)
 		
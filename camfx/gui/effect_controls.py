@@ -1,21 +1,68 @@
 """Effect parameter controls widget."""
 
+import os
+from dataclasses import dataclass
 from typing import Dict, Any, Optional, Callable
 import gi
 gi.require_version('Gtk', '4.0')
+gi.require_version('Gdk', '4.0')
 gi.require_version('Gio', '2.0')
-from gi.repository import Gtk, Gio
+from gi.repository import Gtk, Gdk, Gio, GLib
 from .utils import format_parameter_name, get_effect_defaults
 
+# Gtk.FileDialog (GTK 4.10+) opens the portal/native chooser without building a dialog widget tree
+_HAS_FILE_DIALOG = hasattr(Gtk, 'FileDialog')
+
+
+@dataclass(frozen=True, slots=True)
+class SliderSpec:
+	"""Description of one slider control."""
+	
+	key: str
+	label: str
+	lower: float
+	upper: float
+	step: float
+	page: float
+	is_float: bool = False
+	odd: bool = False  # Snap integer values to odd numbers (lower must be odd)
+
+
+# Slider controls per effect type, in display order
+_SLIDER_SPECS: Dict[str, tuple] = {
+	'blur': (
+		SliderSpec('strength', 'Strength:', 3, 51, 2, 10, odd=True),
+	),
+	'brightness': (
+		SliderSpec('brightness', 'Brightness:', -100, 100, 1, 10),
+		SliderSpec('contrast', 'Contrast:', 0.5, 2.0, 0.1, 0.5, is_float=True),
+	),
+	'beautify': (
+		SliderSpec('smoothness', 'Smoothness:', 1, 15, 1, 2),
+	),
+	'autoframe': (
+		SliderSpec('padding', 'Padding:', 0.0, 1.0, 0.05, 0.2, is_float=True),
+		SliderSpec('min_zoom', 'Min Zoom:', 1.0, 3.0, 0.1, 0.5, is_float=True),
+		SliderSpec('max_zoom', 'Max Zoom:', 1.0, 5.0, 0.1, 0.5, is_float=True),
+	),
+	'gaze-correct': (
+		SliderSpec('strength', 'Strength:', 0.0, 1.0, 0.01, 0.05, is_float=True),
+	),
+}
+
 
 class EffectControlsWidget(Gtk.Box):
 	"""Widget for adjusting effect parameters."""
 	
+	# Slider bursts within this window collapse into one pending update
+	DEBOUNCE_MS = 120
+	
 	def __init__(self, effect_type: Optional[str] = None, 
 	             config: Optional[Dict[str, Any]] = None,
 	             on_update: Optional[Callable] = None,
 	             on_apply: Optional[Callable] = None,
-	             application: Optional[Gtk.Application] = None):
+	             application: Optional[Gtk.Application] = None,
+	             on_drag_state: Optional[Callable] = None):
 		"""Initialize effect controls widget.
 		
 		Args:
@@ -24,6 +71,7 @@ class EffectControlsWidget(Gtk.Box):
 			on_update: Callback(effect_type, parameter, value) when parameter changes
 			on_apply: Callback() to refresh effect chain display
 			application: GTK Application instance (for file chooser)
+			on_drag_state: Callback(active) when a slider drag starts or ends
 		"""
 		super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=10)
 		self.effect_type = effect_type
@@ -31,13 +79,19 @@ class EffectControlsWidget(Gtk.Box):
 		self.on_update = on_update
 		self.on_apply = on_apply
 		self.application = application
+		self.on_drag_state = on_drag_state
 		self.controls = {}  # Store control widgets
+		self.apply_button: Optional[Gtk.Button] = None
+		self._file_chooser = None  # Image chooser, created on first use
 		self.pending_updates = {}  # Track pending parameter updates
+		self._debounced: Dict[str, int] = {}  # Slider key -> GLib source id of its pending commit
+		self._slider_values: Dict[str, Any] = {}  # Latest uncommitted slider values
+		self._dragging: set = set()  # Slider keys with a pointer currently held down
+		self._drag_active = False
+		self._built_for: Optional[str] = None  # Effect type the current controls belong to
 		
-		self.set_margin_start(10)
-		self.set_margin_end(10)
-		self.set_margin_top(10)
-		self.set_margin_bottom(10)
+		# Margins come from the application stylesheet
+		self.add_css_class("effect-controls")
 		
 		if effect_type:
 			self._build_controls()
@@ -53,20 +107,27 @@ class EffectControlsWidget(Gtk.Box):
 	
 	def _build_controls(self):
 		"""Build parameter controls based on effect type."""
+		# Updates still waiting belong to the controls being removed
+		self._cancel_debounced()
+		self._slider_values.clear()
+		self._dragging.clear()
+		self._set_drag_active(False)
+		
 		# Clear existing controls - remove all children
 		# Use list() to create a copy since we're modifying during iteration
 		children = list(self)
 		for child in children:
 			self.remove(child)
 		self.controls.clear()
+		self._built_for = self.effect_type
 		
 		if not self.effect_type:
 			self._show_empty_state()
 			return
 		
 		# Title
-		title_label = Gtk.Label()
-		title_label.set_markup(f"<b>Effect Parameters</b>")
+		title_label = Gtk.Label(label="Effect Parameters")
+		title_label.add_css_class("heading")
 		title_label.set_margin_bottom(10)
 		self.append(title_label)
 		
@@ -74,32 +135,22 @@ class EffectControlsWidget(Gtk.Box):
 		self.apply_button = None
 		
 		# Build controls based on effect type
-		if self.effect_type == 'blur':
-			self._add_strength_control(3, 51, 2)  # Odd numbers only
-		elif self.effect_type == 'replace':
+		if self.effect_type == 'replace':
 			self._add_image_picker()
-		elif self.effect_type == 'brightness':
-			self._add_brightness_control()
-			self._add_contrast_control()
+		for spec in _SLIDER_SPECS.get(self.effect_type, ()):
+			self._add_slider(spec)
+		if self.effect_type == 'brightness':
 			self._add_face_only_checkbox()
-		elif self.effect_type == 'beautify':
-			self._add_smoothness_control()
-		elif self.effect_type == 'autoframe':
-			self._add_padding_control()
-			self._add_min_zoom_control()
-			self._add_max_zoom_control()
-		elif self.effect_type == 'gaze-correct':
-			self._add_strength_control(0.0, 1.0, 0.01, is_float=True)
 		
 		# Add Apply button at the end
 		if self.effect_type:
 			self._add_apply_button()
 	
-	def _add_strength_control(self, min_val: float, max_val: float, step: float = 1.0, is_float: bool = False):
-		"""Add strength slider control."""
+	def _add_slider(self, spec: SliderSpec):
+		"""Add a labelled slider control described by spec."""
 		box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
 		
-		label = Gtk.Label(label="Strength:")
+		label = Gtk.Label(label=spec.label)
 		label.set_xalign(0)
 		box.append(label)
 		
@@ -110,348 +161,250 @@ class EffectControlsWidget(Gtk.Box):
 		
 		# Slider
 		adjustment = Gtk.Adjustment(
-			value=self.config.get('strength', get_effect_defaults(self.effect_type).get('strength', min_val)),
-			lower=min_val,
-			upper=max_val,
-			step_increment=step,
-			page_increment=step * 5
+			value=self.config.get(spec.key, get_effect_defaults(self.effect_type).get(spec.key, spec.lower)),
+			lower=spec.lower,
+			upper=spec.upper,
+			step_increment=spec.step,
+			page_increment=spec.page
 		)
 		
 		scale = Gtk.Scale(orientation=Gtk.Orientation.HORIZONTAL, adjustment=adjustment)
 		scale.set_draw_value(False)
 		
-		def on_value_changed(scale):
-			value = scale.get_value()
-			if not is_float and self.effect_type == 'blur':
-				# Ensure odd number for blur
-				value = int(value)
-				if value % 2 == 0:
-					value = max(min_val, value - 1)
-				adjustment.set_value(value)
-			else:
-				value = int(value) if not is_float else round(value, 2) if is_float else value
-			
-			value_label.set_text(str(value))
-			# Store pending update instead of applying immediately
-			self.pending_updates['strength'] = value
-			# Update apply button state
-			if self.apply_button:
-				self.apply_button.set_sensitive(True)
-		
-		scale.connect("value-changed", on_value_changed)
+		# Fixed-precision label formatter, bound once per slider
+		fmt = "{:.2f}".format if spec.is_float else "{:d}".format
+		self._connect_slider(scale, spec, value_label, fmt)
 		
 		# Set initial value label
-		initial_value = adjustment.get_value()
-		if not is_float and self.effect_type == 'blur':
-			initial_value = int(initial_value)
-			if initial_value % 2 == 0:
-				initial_value = max(min_val, initial_value - 1)
-		value_label.set_text(str(initial_value))
+		value_label.set_text(fmt(self._convert_slider_value(spec, adjustment.get_value())))
 		
 		box.append(scale)
 		self.append(box)
-		self.controls['strength'] = (scale, value_label)
+		self.controls[spec.key] = (scale, value_label, spec, fmt)
 	
-	def _add_brightness_control(self):
-		"""Add brightness slider control."""
-		box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-		
-		label = Gtk.Label(label="Brightness:")
-		label.set_xalign(0)
-		box.append(label)
-		
-		value_label = Gtk.Label()
-		value_label.set_xalign(0)
-		box.append(value_label)
-		
-		adjustment = Gtk.Adjustment(
-			value=self.config.get('brightness', 0),
-			lower=-100,
-			upper=100,
-			step_increment=1,
-			page_increment=10
-		)
-		
-		scale = Gtk.Scale(orientation=Gtk.Orientation.HORIZONTAL, adjustment=adjustment)
-		scale.set_draw_value(False)
-		
-		def on_value_changed(scale):
-			value = int(scale.get_value())
-			value_label.set_text(str(value))
-			self.pending_updates['brightness'] = value
-			if self.apply_button:
-				self.apply_button.set_sensitive(True)
-		
-		scale.connect("value-changed", on_value_changed)
-		value_label.set_text(str(int(adjustment.get_value())))
-		
-		box.append(scale)
-		self.append(box)
-		self.controls['brightness'] = (scale, value_label)
-	
-	def _add_contrast_control(self):
-		"""Add contrast slider control."""
-		box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-		
-		label = Gtk.Label(label="Contrast:")
-		label.set_xalign(0)
-		box.append(label)
-		
-		value_label = Gtk.Label()
-		value_label.set_xalign(0)
-		box.append(value_label)
-		
-		adjustment = Gtk.Adjustment(
-			value=self.config.get('contrast', 1.0),
-			lower=0.5,
-			upper=2.0,
-			step_increment=0.1,
-			page_increment=0.5
-		)
-		
-		scale = Gtk.Scale(orientation=Gtk.Orientation.HORIZONTAL, adjustment=adjustment)
-		scale.set_draw_value(False)
-		
-		def on_value_changed(scale):
-			value = round(scale.get_value(), 2)
-			value_label.set_text(str(value))
-			self.pending_updates['contrast'] = value
-			if self.apply_button:
-				self.apply_button.set_sensitive(True)
-		
-		scale.connect("value-changed", on_value_changed)
-		value_label.set_text(str(round(adjustment.get_value(), 2)))
-		
-		box.append(scale)
-		self.append(box)
-		self.controls['contrast'] = (scale, value_label)
+	@staticmethod
+	def _convert_slider_value(spec: SliderSpec, value: float):
+		"""Map a raw slider value to the parameter value for spec."""
+		if spec.is_float:
+			return round(value, 2)
+		if spec.odd:
+			# Snap to the nearest odd number (blur kernel size); lower is odd
+			return 2 * round((value - spec.lower) / 2) + int(spec.lower)
+		return int(value)
 	
 	def _add_face_only_checkbox(self):
 		"""Add face-only checkbox."""
 		checkbox = Gtk.CheckButton(label="Face Only")
 		checkbox.set_active(self.config.get('face_only', False))
 		
-		def on_toggled(checkbox):
-			value = checkbox.get_active()
-			self.pending_updates['face_only'] = value
-			if self.apply_button:
-				self.apply_button.set_sensitive(True)
-		
-		checkbox.connect("toggled", on_toggled)
+		self._face_only_handler_id = checkbox.connect("toggled", self._on_face_only_toggled)
 		self.append(checkbox)
 		self.controls['face_only'] = checkbox
 	
-	def _add_smoothness_control(self):
-		"""Add smoothness slider control."""
-		box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-		
-		label = Gtk.Label(label="Smoothness:")
-		label.set_xalign(0)
-		box.append(label)
-		
-		value_label = Gtk.Label()
-		value_label.set_xalign(0)
-		box.append(value_label)
-		
-		adjustment = Gtk.Adjustment(
-			value=self.config.get('smoothness', 5),
-			lower=1,
-			upper=15,
-			step_increment=1,
-			page_increment=2
-		)
-		
-		scale = Gtk.Scale(orientation=Gtk.Orientation.HORIZONTAL, adjustment=adjustment)
-		scale.set_draw_value(False)
-		
-		def on_value_changed(scale):
-			value = int(scale.get_value())
-			value_label.set_text(str(value))
-			self.pending_updates['smoothness'] = value
-			if self.apply_button:
-				self.apply_button.set_sensitive(True)
-		
-		scale.connect("value-changed", on_value_changed)
-		value_label.set_text(str(int(adjustment.get_value())))
-		
-		box.append(scale)
-		self.append(box)
-		self.controls['smoothness'] = (scale, value_label)
+	def _on_face_only_toggled(self, checkbox: Gtk.CheckButton):
+		self._commit_pending('face_only', checkbox.get_active())
 	
-	def _add_padding_control(self):
-		"""Add padding slider control."""
+	def _add_image_picker(self):
+		"""Add background image picker button."""
 		box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
 		
-		label = Gtk.Label(label="Padding:")
+		label = Gtk.Label(label="Background Image:")
 		label.set_xalign(0)
 		box.append(label)
 		
-		value_label = Gtk.Label()
-		value_label.set_xalign(0)
-		box.append(value_label)
-		
-		adjustment = Gtk.Adjustment(
-			value=self.config.get('padding', 0.3),
-			lower=0.0,
-			upper=1.0,
-			step_increment=0.05,
-			page_increment=0.2
-		)
-		
-		scale = Gtk.Scale(orientation=Gtk.Orientation.HORIZONTAL, adjustment=adjustment)
-		scale.set_draw_value(False)
-		
-		def on_value_changed(scale):
-			value = round(scale.get_value(), 2)
-			value_label.set_text(str(value))
-			self.pending_updates['padding'] = value
-			if self.apply_button:
-				self.apply_button.set_sensitive(True)
+		button = Gtk.Button(label=self._image_button_label())
 		
-		scale.connect("value-changed", on_value_changed)
-		value_label.set_text(str(round(adjustment.get_value(), 2)))
-		
-		box.append(scale)
+		button.connect("clicked", self._on_image_clicked)
+		box.append(button)
 		self.append(box)
-		self.controls['padding'] = (scale, value_label)
+		self.controls['image'] = button
 	
-	def _add_min_zoom_control(self):
-		"""Add min zoom slider control."""
-		box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-		
-		label = Gtk.Label(label="Min Zoom:")
-		label.set_xalign(0)
-		box.append(label)
-		
-		value_label = Gtk.Label()
-		value_label.set_xalign(0)
-		box.append(value_label)
-		
-		adjustment = Gtk.Adjustment(
-			value=self.config.get('min_zoom', 1.0),
-			lower=1.0,
-			upper=3.0,
-			step_increment=0.1,
-			page_increment=0.5
-		)
-		
-		scale = Gtk.Scale(orientation=Gtk.Orientation.HORIZONTAL, adjustment=adjustment)
-		scale.set_draw_value(False)
-		
-		def on_value_changed(scale):
-			value = round(scale.get_value(), 2)
-			value_label.set_text(str(value))
-			self.pending_updates['min_zoom'] = value
-			if self.apply_button:
-				self.apply_button.set_sensitive(True)
-		
-		scale.connect("value-changed", on_value_changed)
-		value_label.set_text(str(round(adjustment.get_value(), 2)))
-		
-		box.append(scale)
-		self.append(box)
-		self.controls['min_zoom'] = (scale, value_label)
+	def _on_image_clicked(self, button: Gtk.Button):
+		"""Show the background image chooser."""
+		if _HAS_FILE_DIALOG:
+			self._get_file_chooser().open(button.get_root(), None, self._on_image_chosen)
+			return
+		dialog = self._get_file_chooser()
+		dialog.set_transient_for(button.get_root())
+		dialog.show()
 	
-	def _add_max_zoom_control(self):
-		"""Add max zoom slider control."""
-		box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-		
-		label = Gtk.Label(label="Max Zoom:")
-		label.set_xalign(0)
-		box.append(label)
-		
-		value_label = Gtk.Label()
-		value_label.set_xalign(0)
-		box.append(value_label)
-		
-		adjustment = Gtk.Adjustment(
-			value=self.config.get('max_zoom', 2.0),
-			lower=1.0,
-			upper=5.0,
-			step_increment=0.1,
-			page_increment=0.5
+	def _get_file_chooser(self):
+		"""Return the image chooser (FileDialog, or FileChooserDialog before GTK 4.10), creating it on first use."""
+		if self._file_chooser is not None:
+			return self._file_chooser
+		
+		# Add image filters
+		filter_image = Gtk.FileFilter()
+		filter_image.set_name("Image files")
+		filter_image.add_mime_type("image/png")
+		filter_image.add_mime_type("image/jpeg")
+		filter_image.add_mime_type("image/jpg")
+		
+		if _HAS_FILE_DIALOG:
+			dialog = Gtk.FileDialog.new()
+			dialog.set_title("Select Background Image")
+			filters = Gio.ListStore.new(Gtk.FileFilter)
+			filters.append(filter_image)
+			dialog.set_filters(filters)
+			dialog.set_default_filter(filter_image)
+			self._file_chooser = dialog
+			return dialog
+		
+		# Create file chooser dialog
+		dialog = Gtk.FileChooserDialog(
+			title="Select Background Image",
+			action=Gtk.FileChooserAction.OPEN
 		)
 		
-		scale = Gtk.Scale(orientation=Gtk.Orientation.HORIZONTAL, adjustment=adjustment)
-		scale.set_draw_value(False)
-		
-		def on_value_changed(scale):
-			value = round(scale.get_value(), 2)
-			value_label.set_text(str(value))
-			self.pending_updates['max_zoom'] = value
-			if self.apply_button:
-				self.apply_button.set_sensitive(True)
+		# Set application if available (required for file access)
+		if self.application:
+			dialog.set_application(self.application)
 		
-		scale.connect("value-changed", on_value_changed)
-		value_label.set_text(str(round(adjustment.get_value(), 2)))
+		dialog.add_buttons(
+			"_Cancel", Gtk.ResponseType.CANCEL,
+			"_Open", Gtk.ResponseType.ACCEPT
+		)
+		dialog.add_filter(filter_image)
 		
-		box.append(scale)
-		self.append(box)
-		self.controls['max_zoom'] = (scale, value_label)
+		# Hidden rather than destroyed on close so it can be shown again
+		dialog.set_hide_on_close(True)
+		dialog.connect("response", self._on_file_chooser_response)
+		self._file_chooser = dialog
+		return dialog
 	
-	def _add_image_picker(self):
-		"""Add background image picker button."""
-		box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-		
-		label = Gtk.Label(label="Background Image:")
-		label.set_xalign(0)
-		box.append(label)
-		
+	def _on_image_chosen(self, dialog: "Gtk.FileDialog", result: Gio.AsyncResult):
+		"""Finish the async FileDialog.open() call."""
+		try:
+			file = dialog.open_finish(result)
+		except GLib.Error:
+			# Dismissed or cancelled
+			return
+		self._set_image(file)
+	
+	def _on_file_chooser_response(self, dialog: Gtk.FileChooserDialog, response: int):
+		"""Record the chosen background image."""
+		if response == Gtk.ResponseType.ACCEPT:
+			self._set_image(dialog.get_file())
+		dialog.hide()
+	
+	def _set_image(self, file: Optional[Gio.File]):
+		"""Record file as the pending background image and relabel the picker."""
+		button = self.controls.get('image')
+		if file and button is not None:
+			file_path = file.get_path()
+			# Use 'image' parameter for file path (as per core.py)
+			self._commit_pending('image', file_path)
+			button.set_label(f"Selected: {file.get_basename()}")
+	
+	def _image_button_label(self) -> str:
+		"""Label for the image picker button from the current config."""
 		# Check if image path is already in config
 		image_path = self.config.get('image') or self.config.get('background')
 		if isinstance(image_path, str):
-			import os
-			button_label = f"Selected: {os.path.basename(image_path)}"
-		else:
-			button_label = "Select Image..."
-		
-		button = Gtk.Button(label=button_label)
-		
-		def on_clicked(button):
-			# Create file chooser dialog
-			dialog = Gtk.FileChooserDialog(
-				title="Select Background Image",
-				transient_for=button.get_root(),
-				action=Gtk.FileChooserAction.OPEN
-			)
-			
-			# Set application if available (required for file access)
-			if self.application:
-				dialog.set_application(self.application)
-			
-			dialog.add_buttons(
-				"_Cancel", Gtk.ResponseType.CANCEL,
-				"_Open", Gtk.ResponseType.ACCEPT
-			)
-			
-			# Add image filters
-			filter_image = Gtk.FileFilter()
-			filter_image.set_name("Image files")
-			filter_image.add_mime_type("image/png")
-			filter_image.add_mime_type("image/jpeg")
-			filter_image.add_mime_type("image/jpg")
-			dialog.add_filter(filter_image)
-			
-			# Show dialog and handle response
-			def on_response(dialog, response):
-				if response == Gtk.ResponseType.ACCEPT:
-					file = dialog.get_file()
-					if file:
-						file_path = file.get_path()
-						# Use 'image' parameter for file path (as per core.py)
-						self.pending_updates['image'] = file_path
-						button.set_label(f"Selected: {file.get_basename()}")
-						if self.apply_button:
-							self.apply_button.set_sensitive(True)
-				dialog.destroy()
-			
-			dialog.connect("response", on_response)
-			dialog.show()
-		
-		button.connect("clicked", on_clicked)
-		box.append(button)
-		self.append(box)
-		self.controls['image'] = button
+			return f"Selected: {os.path.basename(image_path)}"
+		return "Select Image..."
+	
+	def _connect_slider(self, scale: Gtk.Scale, spec: SliderSpec, value_label: Gtk.Label, fmt: Callable):
+		"""Wire a slider: live label on change-value, pending update on release.
+		
+		Pointer drags commit once when the button is released. Keyboard and
+		scroll changes have no release, so they commit after a debounce.
+		The handlers are bound methods with the per-slider state passed as
+		signal user data, so no closures are kept per slider.
+		
+		Args:
+			scale: Slider widget
+			spec: Slider description (parameter key, range, value conversion)
+			value_label: Label showing the current value
+			fmt: Formats the converted value for value_label
+		"""
+		scale.connect("change-value", self._on_slider_change_value, spec, value_label, fmt)
+		# Legacy controller in the capture phase sees the release even though the
+		# scale's own drag gesture claims the pointer sequence
+		events = Gtk.EventControllerLegacy()
+		events.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
+		events.connect("event", self._on_slider_event, spec.key)
+		scale.add_controller(events)
+	
+	def _on_slider_change_value(self, scale: Gtk.Scale, scroll: Gtk.ScrollType, value: float,
+	                            spec: SliderSpec, value_label: Gtk.Label, fmt: Callable) -> bool:
+		"""Snap and show the new slider value; commit it unless a drag is in progress."""
+		adjustment = scale.get_adjustment()
+		key = spec.key
+		value = self._convert_slider_value(spec, min(max(value, adjustment.get_lower()), adjustment.get_upper()))
+		if value == adjustment.get_value():
+			# Snapped to the value already shown: no value-changed, redraw or commit needed
+			return True
+		adjustment.set_value(value)
+		value_label.set_text(fmt(value))
+		self._slider_values[key] = value
+		if key not in self._dragging:
+			self._debounce_commit(key)
+		# Value already set (and snapped) above
+		return True
+	
+	def _on_slider_event(self, controller: Gtk.EventControllerLegacy, event: Gdk.Event, key: str) -> bool:
+		"""Track pointer press/release on a slider; commit its value on release."""
+		event_type = event.get_event_type()
+		if event_type in (Gdk.EventType.BUTTON_PRESS, Gdk.EventType.TOUCH_BEGIN):
+			self._dragging.add(key)
+			self._set_drag_active(True)
+		elif event_type in (Gdk.EventType.BUTTON_RELEASE, Gdk.EventType.TOUCH_END, Gdk.EventType.TOUCH_CANCEL):
+			self._dragging.discard(key)
+			self._set_drag_active(bool(self._dragging))
+			self._commit_slider(key)
+		return False
+	
+	def _set_drag_active(self, active: bool):
+		"""Track whether any slider is being dragged and notify on_drag_state on change."""
+		if active == self._drag_active:
+			return
+		self._drag_active = active
+		if self.on_drag_state:
+			self.on_drag_state(active)
+	
+	def _commit_slider(self, key: str):
+		"""Move a slider's latest value into pending_updates."""
+		source_id = self._debounced.pop(key, None)
+		if source_id is not None:
+			GLib.source_remove(source_id)
+		if key in self._slider_values:
+			self._commit_pending(key, self._slider_values.pop(key))
+	
+	def _debounce_commit(self, key: str):
+		"""Commit a slider's value once no new change arrives within DEBOUNCE_MS.
+		
+		Args:
+			key: Slider parameter key (one pending commit per key)
+		"""
+		source_id = self._debounced.pop(key, None)
+		if source_id is not None:
+			GLib.source_remove(source_id)
+		self._debounced[key] = GLib.timeout_add(self.DEBOUNCE_MS, self._on_debounce_timeout, key)
+	
+	def _on_debounce_timeout(self, key: str) -> bool:
+		"""Debounce timer expired: commit the slider's latest value."""
+		# The source is finishing on its own; drop it so _commit_slider doesn't remove it
+		self._debounced.pop(key, None)
+		self._commit_slider(key)
+		return False
+	
+	def _flush_debounced(self):
+		"""Commit all sliders still waiting on their debounce timer now."""
+		for key in list(self._debounced):
+			self._commit_slider(key)
+	
+	def _cancel_debounced(self):
+		"""Drop all waiting debounced commits."""
+		for source_id in self._debounced.values():
+			GLib.source_remove(source_id)
+		self._debounced.clear()
+	
+	def _commit_pending(self, key: str, value: Any):
+		"""Record a pending parameter update and enable the Apply button."""
+		self.pending_updates[key] = value
+		if self.apply_button:
+			self.apply_button.set_sensitive(True)
 	
 	def _add_apply_button(self):
 		"""Add Apply Changes button."""
@@ -470,6 +423,8 @@ class EffectControlsWidget(Gtk.Box):
 	
 	def _on_apply_clicked(self, button: Gtk.Button):
 		"""Handle Apply Changes button click."""
+		# Pick up slider values still inside the debounce window
+		self._flush_debounced()
 		if not self.effect_type or not self.pending_updates:
 			return
 		
@@ -495,8 +450,44 @@ class EffectControlsWidget(Gtk.Box):
 			effect_type: New effect type (None to clear)
 			config: New effect configuration
 		"""
+		same_type = effect_type is not None and effect_type == self._built_for
 		self.effect_type = effect_type
 		self.config = config or {}
+		if same_type:
+			self._sync_controls()
+		else:
+			self._build_controls()
 		self.pending_updates.clear()  # Clear pending updates when switching effects
-		self._build_controls()
-
+		if self.apply_button:
+			self.apply_button.set_sensitive(False)
+	
+	def _sync_controls(self):
+		"""Show the current config in the existing controls without rebuilding them.
+		
+		Only controls whose value differs from the config are touched, so an
+		update that changes one parameter redraws one control.
+		"""
+		self._cancel_debounced()
+		defaults = get_effect_defaults(self.effect_type)
+		for key, control in self.controls.items():
+			if key == 'face_only':
+				active = bool(self.config.get(key, defaults.get(key, False)))
+				if control.get_active() != active:
+					# Not a user change, so keep it from committing a pending update
+					control.handler_block(self._face_only_handler_id)
+					control.set_active(active)
+					control.handler_unblock(self._face_only_handler_id)
+			elif key == 'image':
+				label = self._image_button_label()
+				if control.get_label() != label:
+					control.set_label(label)
+			elif key not in self._dragging:
+				self._slider_values.pop(key, None)
+				scale, value_label, spec, fmt = control
+				adjustment = scale.get_adjustment()
+				value = self.config.get(key, defaults.get(key, adjustment.get_lower()))
+				if value == adjustment.get_value():
+					continue
+				# set_value doesn't emit change-value, so nothing is committed here
+				adjustment.set_value(value)
+				value_label.set_text(fmt(self._convert_slider_value(spec, adjustment.get_value())))
@@ -1,9 +1,12 @@
 """Main window for camfx control panel."""
 
+import functools
 import logging
 import signal
 import sys
-from typing import Optional, Dict, Any, List
+import threading
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Callable
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Gdk', '4.0')
@@ -18,9 +21,48 @@ from .direct_camera_preview import DirectCameraPreview
 logger = logging.getLogger('camfx.gui.main_window')
 
 
+@dataclass(frozen=True, slots=True)
+class CameraMode:
+	"""One resolution of a camera source, with its fps choices prepared for the dropdowns."""
+	
+	width: int
+	height: int
+	fps: List[int]
+	fps_labels: List[str]
+	fps_index: Dict[int, int]  # fps -> position in fps
+	
+	@classmethod
+	def from_dbus(cls, mode: Dict[str, Any]) -> 'CameraMode':
+		fps = [int(value) for value in mode.get('fps', [])]
+		return cls(
+			width=int(mode.get('width', 0)),
+			height=int(mode.get('height', 0)),
+			fps=fps,
+			fps_labels=[f"{value} fps" for value in fps],
+			fps_index={value: idx for idx, value in enumerate(fps)},
+		)
+
+
+# Styles shared by all widgets, loaded once in CamfxApplication.do_startup
+APP_CSS = """
+.main-box { margin: 10px; }
+.effect-controls { margin: 10px; }
+.effect-chain { margin: 10px; }
+.effect-chain-row { margin: 5px 10px; }
+.add-effect-content { margin: 20px; }
+.preview-frame { margin: 5px; }
+.camera-settings { margin: 0 5px; }
+.camera-settings-body { margin: 10px; }
+.preview-pane { min-width: 640px; min-height: 480px; }
+"""
+
+
 class CamfxMainWindow(Gtk.ApplicationWindow):
 	"""Main window for camfx control panel."""
 	
+	# Quiet period before a camera dropdown change loads modes or rebuilds dependent lists
+	DROPDOWN_DEBOUNCE_MS = 80
+	
 	def __init__(self, app: Gtk.Application):
 		"""Initialize main window.
 		
@@ -30,36 +72,60 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		super().__init__(application=app, title="camfx Control Panel")
 		self.set_default_size(1200, 800)
 		
+		self._app = app
+		
+		# Widgets created by _build_ui; declared here so callbacks can test for None.
+		# The step 2 widgets only exist once _ensure_virtual_preview_page has run.
+		self.preview_widget: Optional[PreviewWidget] = None
+		self.direct_preview_widget: Optional[DirectCameraPreview] = None
+		self.effect_chain: Optional[Gtk.Widget] = None
+		self.effect_controls: Optional[EffectControlsWidget] = None
+		self.camera_toggle: Optional[Gtk.ToggleButton] = None
+		self.preview_toggle: Optional[Gtk.ToggleButton] = None
+		self.status_stack: Optional[Gtk.Stack] = None
+		self._virtual_preview_placeholder: Optional[Gtk.Widget] = None
+		self.camera_apply_button: Optional[Gtk.Button] = None
+		self.camera_settings_status: Optional[Gtk.Label] = None
+		self.camera_source_dropdown: Optional[Gtk.DropDown] = None
+		self._minimized = False  # Toplevel minimized state, tracked for the preview
+		self._dbus_status: Optional[bool] = None  # Result of the connection attempt, once known
+		self._error_dialog: Optional[Gtk.MessageDialog] = None  # Built by _show_error on first use
+		self._error_label: Optional[Gtk.Label] = None
+		
 		# Initialize connection state
 		self.dbus_client = None
 		self.connected = False
 		self.camera_state_active = False
 		
-		# Try to connect to D-Bus service (non-blocking, don't fail if unavailable)
-		try:
-			self.dbus_client = CamfxDBusClient()
-			self.dbus_client.connect_signals(
-				on_effect_changed=self._on_effect_changed,
-				on_camera_state_changed=self._on_camera_state_changed,
-				on_camera_config_changed=self._on_camera_config_changed
-			)
-			self.connected = True
-		except Exception as e:
-			# Don't fail if D-Bus is not available - show warning in UI
-			self.dbus_client = None
-			self.connected = False
-			print(f"Warning: Could not connect to camfx service: {e}")
-			print("The GUI will still open, but you'll need to start camfx with --dbus to use it.")
-		
 		# Current selected effect
 		self.selected_effect_type: Optional[str] = None
 		self.selected_effect_config: Optional[Dict[str, Any]] = None
 		
+		# Widget refreshes requested by D-Bus signals, applied by one idle callback.
+		# D-Bus driven UI sync runs at PRIORITY_LOW so redraws and input go first.
+		self._ui_dirty_flags: set = set()
+		self._ui_idle_id: Optional[int] = None
+		self._ui_controls_state: Optional[tuple] = None  # Latest (effect_type, config) for the controls
+		self._ui_camera_state: Optional[bool] = None  # Latest camera state from D-Bus
+		self._ui_camera_config: Optional[tuple] = None  # Latest (source_id, width, height, fps) from D-Bus
+		
 		# Camera configuration state
 		self.camera_sources: List[Dict[str, Any]] = []
-		self.camera_modes_cache: Dict[str, List[Dict[str, Any]]] = {}
+		self.camera_modes_cache: Dict[str, List[CameraMode]] = {}
+		# O(1) lookups from config values to dropdown positions
+		self._source_ids: List[str] = []  # Ids of camera_sources, by dropdown position
+		self._source_index: Dict[str, int] = {}  # source id -> index in camera_sources
+		self._mode_index: Dict[str, Dict[tuple, int]] = {}  # source id -> {(width, height): mode index}
+		self._resolution_labels: Dict[str, List[str]] = {}  # source id -> "W x H" label per mode
+		self._modes_in_flight: set = set()  # Source ids with a get_camera_modes request pending
+		self._dropdown_items: Dict[Gtk.DropDown, List[str]] = {}  # Items last spliced into each dropdown
+		self._dropdown_stores: Dict[Gtk.DropDown, Gtk.StringList] = {}  # Each dropdown's persistent model
+		self._camera_debounce: Dict[str, tuple] = {}  # dropdown name -> (GLib source id, commit)
+		self._camera_apply_in_flight = False  # ApplyCameraConfig sent, reply not yet received
+		self._camera_status_text = ""  # Last text shown in camera_settings_status
 		self.current_camera_config: Optional[Dict[str, Any]] = None
-		self._camera_controls_busy = False
+		self._current_config_key: Optional[tuple] = None  # (source_id, width, height, fps) of current_camera_config
+		self._ui_sync_busy = False  # Set while widgets are updated programmatically
 		
 		# Build UI
 		try:
@@ -72,21 +138,106 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		# Register crash handlers to ensure camera is released
 		self._register_crash_handlers()
 		
-		# Sync previews (both default OFF)
+		# Connect to the D-Bus service on a worker thread so the window isn't
+		# held up by bus/proxy setup; _on_dbus_ready finishes on the main loop
+		threading.Thread(target=self._connect_dbus_worker, name="camfx-dbus-connect", daemon=True).start()
+		
+		self.connect("realize", self._on_realize)
+		
+		# Sync previews (both default OFF) once the window is shown, so any
+		# capture/PipeWire startup happens after the first paint
+		self._map_handler_id = self.connect("map", self._on_first_map)
+	
+	def _connect_dbus_worker(self):
+		"""Create the D-Bus client off the main thread and hand it back via idle_add."""
+		try:
+			client = CamfxDBusClient()
+		except Exception as e:
+			GLib.idle_add(self._on_dbus_ready, None, e)
+			return
+		GLib.idle_add(self._on_dbus_ready, client, None)
+	
+	def _on_dbus_ready(self, client: Optional[CamfxDBusClient], error: Optional[Exception]) -> bool:
+		"""Finish connecting to the service (or show why it failed) on the main thread."""
+		if error is not None:
+			# Don't fail if D-Bus is not available - show warning in UI
+			print(f"Warning: Could not connect to camfx service: {error}")
+			print("The GUI will still open, but you'll need to start camfx with --dbus to use it.")
+			self._set_dbus_status(False)
+			self._sync_preview_widget()
+			return False
+		
+		self.dbus_client = client
+		# EffectChanged is subscribed by _set_dbus_status along with the chain widget
+		self.dbus_client.connect_signals(
+			on_camera_state_changed=self._on_camera_state_changed,
+			on_camera_config_changed=self._on_camera_config_changed
+		)
+		self.connected = True
+		self._set_dbus_status(True)
+		self._build_camera_settings_body()
+		self._load_initial_camera_data()
+		if self.get_mapped():
+			# Otherwise _on_first_map requests it
+			self._fetch_initial_state()
+		return False
+	
+	def _set_dbus_status(self, connected: bool):
+		"""Show the D-Bus connection result in the status label, toggle and effect chain area."""
+		self._dbus_status = connected
+		if not connected:
+			self.camera_state_active = True
+		if self.status_stack is None:
+			# Step 2 not built yet; _ensure_virtual_preview_page applies the status
+			return
+		self.status_stack.set_visible_child_name("connected" if connected else "disconnected")
+		if connected:
+			self.camera_toggle.set_sensitive(True)
+			# Nothing shows effect changes until step 2 exists, so only now ask the
+			# bus to route them here; subscribe before the chain's initial read
+			self.dbus_client.connect_signals(on_effect_changed=self._on_effect_changed)
+			effect_chain = EffectChainWidget(
+				self.dbus_client,
+				on_effect_selected=self._on_effect_selected
+			)
+		else:
+			self.camera_toggle.set_sensitive(False)
+			effect_chain = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+			error_label = Gtk.Label(label="Cannot connect to camfx service.\nPlease start camfx with --dbus flag.")
+			error_label.set_wrap(True)
+			error_label.add_css_class("error")
+			effect_chain.append(error_label)
+		# Swap in place of the "connecting" placeholder
+		page = self.effect_chain.get_parent()
+		page.insert_child_after(effect_chain, self.effect_chain)
+		page.remove(self.effect_chain)
+		self.effect_chain = effect_chain
+	
+	def _on_first_map(self, window: Gtk.Window):
+		"""Start preview state the first time the window is mapped."""
+		self.disconnect(self._map_handler_id)
 		self._initialize_preview_state()
+		# Ask for the camera state only once the window is on screen
+		GLib.idle_add(self._fetch_initial_state)
+	
+	def _fetch_initial_state(self) -> bool:
+		"""Request the camera state; _on_initial_camera_state applies the reply."""
+		if self.connected and self.dbus_client:
+			try:
+				self.dbus_client.get_camera_state_async(self._on_initial_camera_state)
+			except Exception as e:
+				logger.warning("Failed to request camera state: %s", e)
+		return False
 	
 	def _build_ui(self):
 		"""Build the user interface."""
 		main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
-		main_box.set_margin_start(10)
-		main_box.set_margin_end(10)
-		main_box.set_margin_top(10)
-		main_box.set_margin_bottom(10)
+		main_box.add_css_class("main-box")
 		self.set_child(main_box)
 		
 		# Step indicator
-		step_label = Gtk.Label()
-		step_label.set_markup("<b>Step 1 of 2</b>")
+		step_label = Gtk.Label(label="Step 1 of 2")
+		step_label.add_css_class("heading")
 		step_label.set_margin_bottom(10)
 		self.step_label = step_label
 		main_box.append(step_label)
@@ -100,12 +251,12 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		# Current step (1 or 2)
 		self.current_step = 1
 		
-		# Build pages
+		# Build pages; step 2 is built the first time it is shown
 		camera_setup_page = self._build_camera_setup_page()
-		virtual_preview_page = self._build_virtual_preview_page()
+		self._virtual_preview_placeholder = Gtk.Box()
 		
 		self.stack.add_named(camera_setup_page, "step1")
-		self.stack.add_named(virtual_preview_page, "step2")
+		self.stack.add_named(self._virtual_preview_placeholder, "step2")
 		
 		# Navigation buttons
 		nav_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
@@ -126,9 +277,6 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		
 		# Show step 1 initially
 		self.stack.set_visible_child_name("step1")
-		
-		if self.connected:
-			GLib.idle_add(self._load_initial_camera_data)
 	
 	def _build_camera_setup_page(self) -> Gtk.Widget:
 		page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
@@ -145,6 +293,24 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		self._build_camera_settings(page)
 		return page
 	
+	def _ensure_virtual_preview_page(self) -> bool:
+		"""Swap the step 2 placeholder for the real page on first use.
+		
+		Returns:
+			True if the page was built by this call
+		"""
+		if self._virtual_preview_placeholder is None:
+			return False
+		self.stack.remove(self._virtual_preview_placeholder)
+		self._virtual_preview_placeholder = None
+		self.stack.add_named(self._build_virtual_preview_page(), "step2")
+		# Catch up on state that arrived while the page didn't exist
+		if self._dbus_status is not None:
+			self._set_dbus_status(self._dbus_status)
+		if self.connected:
+			self._update_camera_toggle(self.camera_state_active)
+		return True
+	
 	def _build_virtual_preview_page(self) -> Gtk.Widget:
 		page = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
 		
@@ -153,12 +319,12 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		page.append(preview_label)
 		
 		preview_frame = Gtk.Frame()
-		preview_frame.set_margin_start(5)
-		preview_frame.set_margin_end(5)
-		preview_frame.set_margin_top(5)
-		preview_frame.set_margin_bottom(5)
+		preview_frame.add_css_class("preview-frame")
 		
 		self.preview_widget = PreviewWidget(source_name="camfx")
+		# Only pull frames while the preview can actually be seen
+		self.preview_widget.connect("map", self._on_preview_visibility_changed)
+		self.preview_widget.connect("unmap", self._on_preview_visibility_changed)
 		preview_frame.set_child(self.preview_widget)
 		page.append(preview_frame)
 		
@@ -173,37 +339,24 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		toggle_box.append(self.preview_toggle)
 		page.append(toggle_box)
 		
-		# D-Bus status
-		if self.connected:
-			self.status_label = Gtk.Label(label="D-Bus: Connected")
-			self.status_label.add_css_class("success")
-			try:
-				camera_active = self.dbus_client.get_camera_state()
-				self.camera_state_active = bool(camera_active)
-				self.camera_toggle.set_active(camera_active)
-				self.camera_toggle.set_label("Camera: ON" if camera_active else "Camera: OFF")
-			except Exception:
-				pass
-		else:
-			self.status_label = Gtk.Label(label="D-Bus: Not connected - Start camfx with --dbus")
-			self.status_label.add_css_class("error")
-			self.camera_toggle.set_sensitive(False)
-			self.camera_state_active = True
-		self.status_label.set_xalign(0)
-		page.append(self.status_label)
-		
-		# Effect chain + controls
-		if self.connected:
-			self.effect_chain = EffectChainWidget(
-				self.dbus_client,
-				on_effect_selected=self._on_effect_selected
-			)
-		else:
-			self.effect_chain = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-			error_label = Gtk.Label(label="Cannot connect to camfx service.\nPlease start camfx with --dbus flag.")
-			error_label.set_wrap(True)
-			error_label.add_css_class("error")
-			self.effect_chain.append(error_label)
+		# D-Bus status; each state is a prestyled label and _set_dbus_status picks one
+		self.status_stack = Gtk.Stack()
+		for name, text, css_class in (
+			("connecting", "D-Bus: Connecting...", None),
+			("connected", "D-Bus: Connected", "success"),
+			("disconnected", "D-Bus: Not connected - Start camfx with --dbus", "error"),
+		):
+			status_label = Gtk.Label(label=text)
+			status_label.set_xalign(0)
+			if css_class:
+				status_label.add_css_class(css_class)
+			self.status_stack.add_named(status_label, name)
+		self.status_stack.set_visible_child_name("connecting")
+		self.camera_toggle.set_sensitive(False)
+		page.append(self.status_stack)
+		
+		# Effect chain + controls; the chain widget needs the D-Bus client
+		self.effect_chain = Gtk.Label(label="Connecting to camfx service...")
 		page.append(self.effect_chain)
 		
 		separator = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
@@ -212,12 +365,22 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		self.effect_controls = EffectControlsWidget(
 			on_update=self._on_parameter_update,
 			on_apply=self._on_apply_changes,
-			application=self.get_application()
+			application=self._app,
+			on_drag_state=self._on_slider_drag_state
 		)
 		page.append(self.effect_controls)
 		
 		return page
 	
+	def _on_initial_camera_state(self, camera_active: Optional[bool], error: Optional[Exception]):
+		"""Apply the camera state fetched while building the UI."""
+		if error is not None:
+			return
+		self.camera_state_active = bool(camera_active)
+		# Reflect the service state without calling start_camera back
+		self._update_camera_toggle(self.camera_state_active)
+		self._sync_preview_widget()
+	
 	def _initialize_preview_state(self):
 		"""Initial synchronization of preview widgets."""
 		self._update_direct_preview_config()
@@ -225,19 +388,26 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		self._sync_preview_widget()
 	
 	def _build_camera_settings(self, parent: Gtk.Box):
-		"""Create camera source/resolution/fps selectors."""
-		settings_frame = Gtk.Frame()
-		settings_frame.set_label("Camera Settings")
-		settings_frame.set_margin_start(5)
-		settings_frame.set_margin_end(5)
-		parent.append(settings_frame)
+		"""Create the camera settings frame.
 		
+		The selectors are only useful with the service, so the frame starts
+		with a placeholder and _build_camera_settings_body fills it once
+		D-Bus is connected.
+		"""
+		self.camera_settings_frame = Gtk.Frame()
+		self.camera_settings_frame.set_label("Camera Settings")
+		self.camera_settings_frame.add_css_class("camera-settings")
+		placeholder = Gtk.Label(label="Camera controls require camfx service")
+		placeholder.set_margin_top(10)
+		placeholder.set_margin_bottom(10)
+		self.camera_settings_frame.set_child(placeholder)
+		parent.append(self.camera_settings_frame)
+	
+	def _build_camera_settings_body(self):
+		"""Create camera source/resolution/fps selectors."""
 		settings_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-		settings_box.set_margin_start(10)
-		settings_box.set_margin_end(10)
-		settings_box.set_margin_top(10)
-		settings_box.set_margin_bottom(10)
-		settings_frame.set_child(settings_box)
+		settings_box.add_css_class("camera-settings-body")
+		self.camera_settings_frame.set_child(settings_box)
 		
 		def build_row(title: str) -> Gtk.Box:
 			row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
@@ -277,6 +447,13 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		fps_row.append(self.camera_fps_dropdown)
 		settings_box.append(fps_row)
 		
+		# Models are never replaced, so splices can skip get_model()
+		self._dropdown_stores = {
+			self.camera_source_dropdown: self.camera_source_store,
+			self.camera_resolution_dropdown: self.camera_resolution_store,
+			self.camera_fps_dropdown: self.camera_fps_store,
+		}
+		
 		# Apply button
 		self.camera_apply_button = Gtk.Button(label="Apply Settings")
 		self.camera_apply_button.set_sensitive(False)
@@ -284,50 +461,120 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		settings_box.append(self.camera_apply_button)
 		
 		# Status label
-		self.camera_settings_status = Gtk.Label(label="Camera controls require camfx service")
+		self._camera_status_text = "Camera controls require camfx service"
+		self.camera_settings_status = Gtk.Label(label=self._camera_status_text)
 		self.camera_settings_status.set_xalign(0)
 		settings_box.append(self.camera_settings_status)
 	
-	def _refresh_string_list(self, dropdown: Gtk.DropDown, items: List[str]) -> Gtk.StringList:
-		store = Gtk.StringList()
-		for item in items:
-			store.append(item)
-		dropdown.set_model(store)
-		if items:
-			dropdown.set_selected(0)
-		else:
-			dropdown.set_selected(Gtk.INVALID_LIST_POSITION)
-		return store
+	def _splice_string_list(self, dropdown: Gtk.DropDown, items: List[str], selected: int = 0):
+		"""Replace a dropdown's items in place and select one, skipping what is unchanged.
+		
+		The dropdown keeps its StringList; splice() replaces only the rows
+		between the common leading and trailing items, with a single
+		items-changed emission. The selection moves straight to ``selected``
+		(none for an empty list) without running the notify::selected handlers.
+		
+		Args:
+			dropdown: One of the camera dropdowns
+			items: New labels
+			selected: Position to select when items is not empty
+		"""
+		old = self._dropdown_items.get(dropdown, [])
+		# Label lists come from per-source/per-mode caches, so a re-applied list is
+		# usually the very same object and the element comparison can be skipped
+		if old is items or old == items:
+			self._set_dropdown_selection(dropdown, selected if items else -1)
+			return
+		shared = min(len(old), len(items))
+		start = 0
+		while start < shared and old[start] == items[start]:
+			start += 1
+		end = 0
+		while end < shared - start and old[-1 - end] == items[-1 - end]:
+			end += 1
+		store = self._dropdown_stores[dropdown]
+		self._ui_sync_busy = True
+		# The splice can move the selection and set_selected moves it again; freezing
+		# collapses those into at most one notify::selected, emitted on thaw
+		dropdown.freeze_notify()
+		try:
+			store.splice(start, len(old) - start - end, items[start:len(items) - end])
+			position = selected if items else Gtk.INVALID_LIST_POSITION
+			if dropdown.get_selected() != position:
+				dropdown.set_selected(position)
+		finally:
+			dropdown.thaw_notify()
+			self._ui_sync_busy = False
+		# Kept by reference: callers pass cached or freshly built lists and never mutate them
+		self._dropdown_items[dropdown] = items
 	
 	def _load_initial_camera_data(self):
-		"""Fetch initial camera configuration and available sources."""
+		"""Fetch initial camera configuration and available sources.
+		
+		Both requests are sent together; the dropdowns are filled once both
+		replies are in, since the selection depends on the current config.
+		Modes for the configured source are requested as soon as the config
+		reply arrives, so all three round-trips overlap. Other sources are
+		probed only when selected, since the service probes each device
+		synchronously and would hold back the user's first camera commands.
+		"""
 		if not self.connected or not self.dbus_client:
 			self._clear_camera_dropdowns("camfx service not connected")
 			return False
+		replies: Dict[str, tuple] = {}
+		
+		def on_reply(name: str, result, error: Optional[Exception]):
+			replies[name] = (result, error)
+			if name == 'config' and error is None and result and result.get('source_id'):
+				# The configured source is the one shown first; don't wait for the source list
+				self._request_camera_modes(result['source_id'])
+			if len(replies) == 2:
+				self._on_initial_camera_config(*replies['config'])
+				self._on_camera_sources_loaded(*replies['sources'])
+		
 		try:
-			self.current_camera_config = self.dbus_client.get_camera_config()
-			self._update_direct_preview_config()
+			self.dbus_client.get_camera_config_async(lambda config, error: on_reply('config', config, error))
+			self.dbus_client.list_camera_sources_async(lambda sources, error: on_reply('sources', sources, error))
 		except Exception as e:
-			self.current_camera_config = None
-			self._update_camera_settings_status(f"Failed to fetch camera config: {e}")
-		self._refresh_camera_sources()
+			self._on_initial_camera_config(None, e)
+			self._on_camera_sources_loaded(None, e)
 		return False
 	
-	def _refresh_camera_sources(self):
-		"""Refresh camera source list from D-Bus."""
-		if not self.dbus_client:
-			self._clear_camera_dropdowns("camfx service unavailable")
+	def _on_initial_camera_config(self, config: Optional[Dict[str, Any]], error: Optional[Exception]):
+		"""Store the fetched camera config."""
+		if error is None:
+			self._set_current_camera_config(config)
+			self._update_direct_preview_config()
+		else:
+			self._set_current_camera_config(None)
+			self._update_camera_settings_status(f"Failed to fetch camera config: {error}")
+	
+	def _request_camera_modes(self, source_id: str):
+		"""Send one get_camera_modes request per source at a time."""
+		if source_id in self.camera_modes_cache or source_id in self._modes_in_flight:
 			return
+		self._modes_in_flight.add(source_id)
 		try:
-			sources = self.dbus_client.list_camera_sources()
+			self.dbus_client.get_camera_modes_async(
+				source_id, lambda modes, error: self._on_camera_modes_loaded(source_id, modes, error))
 		except Exception as e:
-			self._clear_camera_dropdowns(f"Failed to load cameras: {e}")
+			self._on_camera_modes_loaded(source_id, None, e)
+	
+	def _on_camera_sources_loaded(self, sources: Optional[List[Dict[str, str]]], error: Optional[Exception]):
+		"""Populate the source dropdown from a list_camera_sources reply."""
+		if error is not None:
+			self._clear_camera_dropdowns(f"Failed to load cameras: {error}")
 			return
 		
 		self.camera_sources = sources
-		self.camera_source_store = self._refresh_string_list(
+		self._source_ids = [source['id'] for source in sources]
+		self._source_index = {source_id: idx for idx, source_id in enumerate(self._source_ids)}
+		target_id = self.current_camera_config.get('source_id') if self.current_camera_config else None
+		selected_index = self._source_index.get(target_id, 0)
+		self._splice_string_list(
 			self.camera_source_dropdown,
-			[source['label'] for source in sources]
+			[source['label'] for source in sources],
+			selected_index
 		)
 		
 		if not sources:
@@ -339,223 +586,278 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 			return
 		
 		self.camera_source_dropdown.set_sensitive(True)
-		target_id = self.current_camera_config.get('source_id') if self.current_camera_config else None
-		selected_index = 0
-		if target_id:
-			for idx, source in enumerate(sources):
-				if source['id'] == target_id:
-					selected_index = idx
-					break
-		self._set_dropdown_selection(self.camera_source_dropdown, selected_index)
-		self._load_modes_for_source(sources[selected_index]['id'])
+		self._load_modes_for_source(self._source_ids[selected_index])
 	
 	def _load_modes_for_source(self, source_id: str):
 		"""Load and display resolution/fps combos for a source."""
 		modes = self.camera_modes_cache.get(source_id)
-		if modes is None:
-			if not self.dbus_client:
-				return
-			try:
-				modes = self.dbus_client.get_camera_modes(source_id)
-			except Exception as e:
-				self._update_camera_settings_status(f"Failed to load modes: {e}")
-				self._clear_resolution_and_fps()
-				return
+		if modes is not None:
+			self._populate_resolution_dropdown(source_id, modes)
+			return
+		if not self.dbus_client:
+			return
+		# Shown by _on_camera_modes_loaded when the reply arrives
+		self._request_camera_modes(source_id)
+	
+	def _on_camera_modes_loaded(self, source_id: str, modes: Optional[List[Dict[str, Any]]], error: Optional[Exception]):
+		"""Cache a get_camera_modes reply and show it if the source is still selected."""
+		self._modes_in_flight.discard(source_id)
+		if error is None:
+			# Parse fps values and dropdown labels once per mode, not on every selection change
+			modes = [CameraMode.from_dbus(mode) for mode in modes]
+			self._mode_index[source_id] = {(mode.width, mode.height): idx for idx, mode in enumerate(modes)}
+			self._resolution_labels[source_id] = [f"{mode.width} x {mode.height}" for mode in modes]
 			self.camera_modes_cache[source_id] = modes
+		if self._selected_source_id() != source_id:
+			# The user moved on while the reply was in flight
+			return
+		if error is not None:
+			self._update_camera_settings_status(f"Failed to load modes: {error}")
+			self._clear_resolution_and_fps()
+			return
 		self._populate_resolution_dropdown(source_id, modes)
 	
+	def _selected_source_id(self) -> Optional[str]:
+		"""Id of the camera source selected in the dropdown, if any."""
+		# get_selected() is unsigned; INVALID_LIST_POSITION fails the bounds check
+		index = self.camera_source_dropdown.get_selected()
+		if index >= len(self._source_ids):
+			return None
+		return self._source_ids[index]
+	
 	def _clear_resolution_and_fps(self):
-		self.camera_resolution_store = self._refresh_string_list(self.camera_resolution_dropdown, [])
-		self.camera_fps_store = self._refresh_string_list(self.camera_fps_dropdown, [])
+		self._splice_string_list(self.camera_resolution_dropdown, [])
+		self._splice_string_list(self.camera_fps_dropdown, [])
 		self.camera_resolution_dropdown.set_sensitive(False)
 		self.camera_fps_dropdown.set_sensitive(False)
 		self.camera_apply_button.set_sensitive(False)
 	
-	def _populate_resolution_dropdown(self, source_id: str, modes: List[Dict[str, Any]]):
-		labels = [f"{mode.get('width', 0)} x {mode.get('height', 0)}" for mode in modes]
-		self.camera_resolution_store = self._refresh_string_list(self.camera_resolution_dropdown, labels)
+	def _populate_resolution_dropdown(self, source_id: str, modes: List[CameraMode]):
+		key = self._current_config_key
+		selected_index = 0
+		if key and key[0] == source_id:
+			selected_index = self._mode_index[source_id].get(key[1:3], 0)
+		labels = self._resolution_labels[source_id]
+		self._splice_string_list(self.camera_resolution_dropdown, labels, selected_index)
 		if not labels:
 			self._clear_resolution_and_fps()
 			self._update_camera_settings_status("No supported modes for selected camera")
 			return
 		
 		self.camera_resolution_dropdown.set_sensitive(True)
-		target = None
-		if self.current_camera_config and self.current_camera_config.get('source_id') == source_id:
-			target = (
-				self.current_camera_config.get('width'),
-				self.current_camera_config.get('height')
-			)
-		
-		selected_index = 0
-		if target:
-			for idx, mode in enumerate(modes):
-				if int(mode.get('width', 0)) == int(target[0]) and int(mode.get('height', 0)) == int(target[1]):
-					selected_index = idx
-					break
-		self._set_dropdown_selection(self.camera_resolution_dropdown, selected_index)
 		self._populate_fps_dropdown(source_id, modes, selected_index)
 	
-	def _populate_fps_dropdown(self, source_id: str, modes: List[Dict[str, Any]], mode_index: int):
+	def _populate_fps_dropdown(self, source_id: str, modes: List[CameraMode], mode_index: int):
 		if mode_index < 0 or mode_index >= len(modes):
 			self._clear_resolution_and_fps()
 			return
 		
 		mode = modes[mode_index]
-		fps_values = [int(fps) for fps in mode.get('fps', [])]
-		fps_labels = [f"{fps} fps" for fps in fps_values]
-		self.camera_fps_store = self._refresh_string_list(self.camera_fps_dropdown, fps_labels)
+		key = self._current_config_key
+		selected_index = 0
+		if key and key[:3] == (source_id, mode.width, mode.height):
+			selected_index = mode.fps_index.get(key[3], 0)
+		self._splice_string_list(self.camera_fps_dropdown, mode.fps_labels, selected_index)
 		
-		if not fps_values:
+		if not mode.fps:
 			self.camera_fps_dropdown.set_sensitive(False)
 			self.camera_apply_button.set_sensitive(False)
 			self._update_camera_settings_status("No frame rates available for selected resolution")
 			return
 		
 		self.camera_fps_dropdown.set_sensitive(True)
-		target_fps = None
-		if (self.current_camera_config and
-		    self.current_camera_config.get('source_id') == source_id and
-		    int(self.current_camera_config.get('width', 0)) == int(mode.get('width', 0)) and
-		    int(self.current_camera_config.get('height', 0)) == int(mode.get('height', 0))):
-			target_fps = int(self.current_camera_config.get('fps', 0))
-		
-		selected_index = 0
-		if target_fps:
-			for idx, fps in enumerate(fps_values):
-				if fps == target_fps:
-					selected_index = idx
-					break
-		self._set_dropdown_selection(self.camera_fps_dropdown, selected_index)
 		self._update_camera_apply_button_state()
 	
 	def _on_camera_source_changed(self, dropdown: Gtk.DropDown, _param):
-		if self._camera_controls_busy:
+		if self._ui_sync_busy:
 			return
-		index = dropdown.get_selected()
-		if index is None or index < 0 or index >= len(self.camera_sources):
+		self._debounce_camera_control('source', self._commit_source_change)
+	
+	def _on_resolution_changed(self, dropdown: Gtk.DropDown, _param):
+		if self._ui_sync_busy:
+			return
+		self._debounce_camera_control('resolution', self._commit_resolution_change)
+	
+	def _on_fps_changed(self, dropdown: Gtk.DropDown, _param):
+		if self._ui_sync_busy:
+			return
+		self._debounce_camera_control('fps', self._commit_fps_change)
+	
+	def _commit_source_change(self):
+		source_id = self._selected_source_id()
+		if source_id is None:
 			self._clear_resolution_and_fps()
 			return
-		source_id = self.camera_sources[index]['id']
 		self._load_modes_for_source(source_id)
 		self._update_camera_apply_button_state()
 	
-	def _on_resolution_changed(self, dropdown: Gtk.DropDown, _param):
-		if self._camera_controls_busy:
-			return
-		source_index = self.camera_source_dropdown.get_selected()
-		if source_index is None or source_index < 0 or source_index >= len(self.camera_sources):
+	def _commit_resolution_change(self):
+		source_id = self._selected_source_id()
+		if source_id is None:
 			self._clear_resolution_and_fps()
 			return
-		mode_index = dropdown.get_selected()
-		source_id = self.camera_sources[source_index]['id']
+		mode_index = self.camera_resolution_dropdown.get_selected()
 		modes = self.camera_modes_cache.get(source_id, [])
-		if mode_index is None or mode_index < 0 or mode_index >= len(modes):
+		if mode_index >= len(modes):
 			self._clear_resolution_and_fps()
 			return
 		self._populate_fps_dropdown(source_id, modes, mode_index)
 	
-	def _on_fps_changed(self, dropdown: Gtk.DropDown, _param):
-		if self._camera_controls_busy:
-			return
-		if dropdown.get_selected() is None or dropdown.get_selected() < 0:
+	def _commit_fps_change(self):
+		if self.camera_fps_dropdown.get_selected() == Gtk.INVALID_LIST_POSITION:
 			self.camera_apply_button.set_sensitive(False)
 			return
 		self._update_camera_apply_button_state()
 	
+	def _debounce_camera_control(self, name: str, commit: Callable):
+		"""Run commit once the named dropdown has been quiet for DROPDOWN_DEBOUNCE_MS."""
+		previous = self._camera_debounce.pop(name, None)
+		if previous is not None:
+			GLib.source_remove(previous[0])
+		
+		def on_timeout():
+			self._camera_debounce.pop(name, None)
+			commit()
+			return GLib.SOURCE_REMOVE
+		
+		self._camera_debounce[name] = (GLib.timeout_add(self.DROPDOWN_DEBOUNCE_MS, on_timeout), commit)
+	
+	def _flush_camera_debounce(self):
+		"""Run pending dropdown commits now, upstream controls first."""
+		for name in ('source', 'resolution', 'fps'):
+			pending = self._camera_debounce.pop(name, None)
+			if pending is not None:
+				GLib.source_remove(pending[0])
+				pending[1]()
+	
 	def _get_selected_camera_config(self) -> Optional[Dict[str, Any]]:
-		source_index = self.camera_source_dropdown.get_selected()
-		if source_index is None or source_index < 0 or source_index >= len(self.camera_sources):
+		source_id = self._selected_source_id()
+		if source_id is None:
 			return None
-		source = self.camera_sources[source_index]
-		modes = self.camera_modes_cache.get(source['id'])
+		modes = self.camera_modes_cache.get(source_id)
 		if not modes:
 			return None
 		res_index = self.camera_resolution_dropdown.get_selected()
-		if res_index is None or res_index < 0 or res_index >= len(modes):
+		if res_index >= len(modes):
 			return None
 		mode = modes[res_index]
-		fps_values = [int(fps) for fps in mode.get('fps', [])]
 		fps_index = self.camera_fps_dropdown.get_selected()
-		if fps_index is None or fps_index < 0 or fps_index >= len(fps_values):
+		if fps_index >= len(mode.fps):
 			return None
 		return {
-			'source_id': source['id'],
-			'width': int(mode.get('width', 0)),
-			'height': int(mode.get('height', 0)),
-			'fps': int(fps_values[fps_index]),
+			'source_id': source_id,
+			'width': mode.width,
+			'height': mode.height,
+			'fps': mode.fps[fps_index],
 		}
 	
 	def _update_camera_apply_button_state(self):
-		if not hasattr(self, 'camera_apply_button'):
+		if self.camera_apply_button is None:
 			return
-		if not self.connected or not self.dbus_client:
+		if not self.connected or not self.dbus_client or self._camera_apply_in_flight:
 			self.camera_apply_button.set_sensitive(False)
 			return
 		selected = self._get_selected_camera_config()
 		if not selected:
 			self.camera_apply_button.set_sensitive(False)
 			return
-		if not self.current_camera_config:
-			self.camera_apply_button.set_sensitive(True)
-			return
-		is_same = (
-			self.current_camera_config.get('source_id') == selected['source_id'] and
-			int(self.current_camera_config.get('width', 0)) == selected['width'] and
-			int(self.current_camera_config.get('height', 0)) == selected['height'] and
-			int(self.current_camera_config.get('fps', 0)) == selected['fps']
-		)
-		self.camera_apply_button.set_sensitive(not is_same)
+		selected_key = (selected['source_id'], selected['width'], selected['height'], selected['fps'])
+		self.camera_apply_button.set_sensitive(selected_key != self._current_config_key)
+	
+	def _set_current_camera_config(self, config: Optional[Dict[str, Any]]) -> bool:
+		"""Store the active camera config along with its comparison key.
+		
+		Returns:
+			True if the config differs from the previous one
+		"""
+		self.current_camera_config = config
+		if config:
+			key = (
+				config.get('source_id'),
+				int(config.get('width', 0)),
+				int(config.get('height', 0)),
+				int(config.get('fps', 0)),
+			)
+		else:
+			key = None
+		changed = key != self._current_config_key
+		self._current_config_key = key
+		return changed
 	
 	def _on_apply_camera_settings(self, _button):
 		if not self.connected or not self.dbus_client:
 			self._update_camera_settings_status("camfx service not connected")
 			return
+		# A selection made just before clicking may still be inside the debounce window
+		self._flush_camera_debounce()
 		config = self._get_selected_camera_config()
 		if not config:
 			self._update_camera_settings_status("Select source, resolution, and fps before applying")
 			return
+		self._camera_apply_in_flight = True
+		self.camera_apply_button.set_sensitive(False)
+		self._update_camera_settings_status("Applying camera settings...")
 		try:
-			success = self.dbus_client.apply_camera_config(
+			self.dbus_client.apply_camera_config_async(
 				config['source_id'],
 				config['width'],
 				config['height'],
-				config['fps']
+				config['fps'],
+				lambda success, error: self._on_camera_config_applied(config, success, error)
 			)
-			if success:
-				self.current_camera_config = config
-				self._update_camera_settings_status("Camera settings applied")
-				self._update_camera_apply_button_state()
-				self._update_direct_preview_config()
-				self._sync_direct_preview()
-				self._sync_preview_widget(restart=self.camera_state_active or not self.connected)
-			else:
-				self._update_camera_settings_status("Failed to apply camera settings")
 		except Exception as e:
-			self._update_camera_settings_status(f"Error applying camera settings: {e}")
-			self._show_error(f"Error applying camera settings: {e}")
+			self._on_camera_config_applied(config, None, e)
+	
+	def _on_camera_config_applied(self, config: Dict[str, Any], success: Optional[bool], error: Optional[Exception]):
+		"""Finish an apply_camera_config request."""
+		self._camera_apply_in_flight = False
+		if error is not None:
+			self._update_camera_settings_status(f"Error applying camera settings: {error}")
+			self._update_camera_apply_button_state()
+			self._show_error(f"Error applying camera settings: {error}")
+			return
+		if not success:
+			self._update_camera_settings_status("Failed to apply camera settings")
+			self._update_camera_apply_button_state()
+			return
+		changed = self._set_current_camera_config(config)
+		self._update_camera_settings_status("Camera settings applied")
+		self._update_camera_apply_button_state()
+		self._update_direct_preview_config()
+		self._sync_direct_preview()
+		# Restarting rebuilds the pipeline, so only do it when the stream actually changes
+		self._sync_preview_widget(restart=changed and (self.camera_state_active or not self.connected))
 	
 	def _update_camera_settings_status(self, message: str):
-		if hasattr(self, 'camera_settings_status') and self.camera_settings_status:
+		if self.camera_settings_status is not None and message != self._camera_status_text:
+			self._camera_status_text = message
 			self.camera_settings_status.set_text(message)
 	
 	def _clear_camera_dropdowns(self, message: str):
 		self.camera_sources = []
+		self._source_ids = []
+		self._source_index.clear()
 		self.camera_modes_cache.clear()
-		self.camera_source_store = self._refresh_string_list(self.camera_source_dropdown, [])
+		self._mode_index.clear()
+		self._resolution_labels.clear()
+		if self.camera_source_dropdown is None:
+			# Selectors not built yet (service not connected)
+			return
+		self._splice_string_list(self.camera_source_dropdown, [])
 		self._clear_resolution_and_fps()
 		self.camera_source_dropdown.set_sensitive(False)
 		self._update_camera_settings_status(message)
 	
 	def _set_dropdown_selection(self, dropdown: Gtk.DropDown, index: int):
-		self._camera_controls_busy = True
+		position = index if index >= 0 else Gtk.INVALID_LIST_POSITION
+		if dropdown.get_selected() == position:
+			# Setting the same position still emits notify::selected
+			return
+		self._ui_sync_busy = True
 		try:
-			if index >= 0:
-				dropdown.set_selected(index)
-			else:
-				dropdown.set_selected(Gtk.INVALID_LIST_POSITION)
+			dropdown.set_selected(position)
 		finally:
-			self._camera_controls_busy = False
+			self._ui_sync_busy = False
 	
 	def _sync_camera_controls(self):
 		if not self.camera_sources or not self.current_camera_config:
@@ -563,20 +865,22 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		target_id = self.current_camera_config.get('source_id')
 		if not target_id:
 			return
-		for idx, source in enumerate(self.camera_sources):
-			if source['id'] == target_id:
-				self._set_dropdown_selection(self.camera_source_dropdown, idx)
-				self._load_modes_for_source(target_id)
-				break
+		idx = self._source_index.get(target_id)
+		if idx is not None:
+			self._set_dropdown_selection(self.camera_source_dropdown, idx)
+			self._load_modes_for_source(target_id)
 		self._update_camera_apply_button_state()
 	
 	def _handle_camera_config_changed(self, source_id: str, width: int, height: int, fps: int):
-		self.current_camera_config = {
+		changed = self._set_current_camera_config({
 			'source_id': str(source_id),
 			'width': int(width),
 			'height': int(height),
 			'fps': int(fps),
-		}
+		})
+		if not changed:
+			# The service also re-announces the config we just applied; nothing to redo
+			return False
 		self._sync_camera_controls()
 		self._update_direct_preview_config()
 		self._sync_direct_preview()
@@ -597,6 +901,9 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 	def _on_parameter_update(self, effect_type: str, parameter: str, value: Any):
 		"""Handle parameter update from controls.
 		
+		The D-Bus client merges updates per (effect_type, parameter) and sends
+		them on a short timer, so bursts of changes cost one call per parameter.
+		
 		Args:
 			effect_type: Effect type
 			parameter: Parameter name
@@ -605,21 +912,36 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		if not self.connected or not self.dbus_client:
 			return
 		
-		try:
-			# Update parameter via D-Bus
-			success = self.dbus_client.update_effect_parameter(effect_type, parameter, value)
-			if success:
-				# Update local config
-				if self.selected_effect_config is not None:
-					self.selected_effect_config[parameter] = value
-			else:
-				self._show_error("Failed to update parameter")
-		except Exception as e:
-			self._show_error(f"Error updating parameter: {e}")
+		self.dbus_client.update_effect_parameter(
+			effect_type, parameter, value,
+			functools.partial(self._on_parameter_applied, effect_type, parameter, value)
+		)
+	
+	def _flush_dbus(self):
+		"""Send queued parameter updates now."""
+		if self.dbus_client:
+			self.dbus_client.flush()
+	
+	def _on_parameter_applied(self, effect_type: str, parameter: str, value: Any,
+	                          success: bool, error: Optional[Exception]):
+		"""Record a parameter update once the service accepted it."""
+		if error is not None:
+			self._show_error(f"Error updating parameter: {error}")
+		elif not success:
+			self._show_error("Failed to update parameter")
+		elif self.selected_effect_config is not None and effect_type == self.selected_effect_type:
+			self.selected_effect_config[parameter] = value
+	
+	def _on_slider_drag_state(self, active: bool):
+		"""Render the preview at half resolution while a slider is dragged."""
+		if self.preview_widget is not None:
+			self.preview_widget.set_downsample(2 if active else 1)
 	
 	def _on_apply_changes(self):
 		"""Handle Apply Changes button click - refresh effect chain display."""
-		if hasattr(self, 'effect_chain') and isinstance(self.effect_chain, EffectChainWidget):
+		# The refresh below reads the chain back, so send pending updates first
+		self._flush_dbus()
+		if isinstance(self.effect_chain, EffectChainWidget):
 			# Refresh the effect chain to show updated parameter values
 			self.effect_chain.refresh()
 	
@@ -632,8 +954,8 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 			config: Effect configuration
 		"""
 		# Refresh effect chain display
-		if hasattr(self, 'effect_chain') and isinstance(self.effect_chain, EffectChainWidget):
-			GLib.idle_add(self.effect_chain.refresh)
+		if isinstance(self.effect_chain, EffectChainWidget):
+			self._ui_dirty_flags.add('chain')
 		
 		# Handle selection based on action
 		if action == 'remove' or action == 'clear':
@@ -641,11 +963,37 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 			if self.selected_effect_type == effect_type or action == 'clear':
 				self.selected_effect_type = None
 				self.selected_effect_config = None
-				GLib.idle_add(self.effect_controls.update_effect, None, None)
+				self._ui_dirty_flags.add('controls')
+				self._ui_controls_state = (None, None)
 		elif action == 'update':
 			# If this is the selected effect, update controls
 			if self.selected_effect_type == effect_type:
-				GLib.idle_add(self.effect_controls.update_effect, effect_type, config)
+				self._ui_dirty_flags.add('controls')
+				self._ui_controls_state = (effect_type, config)
+		
+		self._schedule_ui_flush()
+	
+	def _schedule_ui_flush(self):
+		"""Queue _flush_ui unless it is already pending."""
+		if self._ui_dirty_flags and self._ui_idle_id is None:
+			self._ui_idle_id = GLib.idle_add(self._flush_ui, priority=GLib.PRIORITY_LOW)
+	
+	def _flush_ui(self) -> bool:
+		"""Apply all widget refreshes queued since the last idle, once each."""
+		self._ui_idle_id = None
+		dirty, self._ui_dirty_flags = self._ui_dirty_flags, set()
+		if 'camera_state' in dirty:
+			self._handle_camera_state_change(self._ui_camera_state)
+		if 'camera_config' in dirty:
+			self._handle_camera_config_changed(*self._ui_camera_config)
+		if 'chain' in dirty:
+			self.effect_chain.refresh()
+		if 'controls' in dirty and self._ui_controls_state is not None:
+			effect_type, config = self._ui_controls_state
+			self._ui_controls_state = None
+			if self.effect_controls is not None:
+				self.effect_controls.update_effect(effect_type, config)
+		return False
 	
 	def _on_camera_state_changed(self, is_active: bool):
 		"""Handle camera state change signal from D-Bus.
@@ -653,7 +1001,9 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		Args:
 			is_active: True if camera is active
 		"""
-		GLib.idle_add(self._handle_camera_state_change, is_active)
+		self._ui_camera_state = bool(is_active)
+		self._ui_dirty_flags.add('camera_state')
+		self._schedule_ui_flush()
 	
 	def _handle_camera_state_change(self, is_active: bool):
 		"""Sync UI controls when camera state changes."""
@@ -663,14 +1013,24 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 	
 	def _on_camera_config_changed(self, source_id: str, width: int, height: int, fps: int):
 		"""Handle camera configuration changes from D-Bus."""
-		GLib.idle_add(self._handle_camera_config_changed, source_id, width, height, fps)
+		# Only the latest config of a burst is applied
+		self._ui_camera_config = (source_id, width, height, fps)
+		self._ui_dirty_flags.add('camera_config')
+		self._schedule_ui_flush()
 	
 	def _update_camera_toggle(self, is_active: bool):
 		"""Update camera toggle button state without triggering callback."""
-		self.camera_toggle.handler_block_by_func(self._on_camera_toggled)
-		self.camera_toggle.set_active(is_active)
-		self.camera_toggle.set_label("Camera: ON" if is_active else "Camera: OFF")
-		self.camera_toggle.handler_unblock_by_func(self._on_camera_toggled)
+		if self.camera_toggle is None:
+			return
+		if self.camera_toggle.get_active() == is_active:
+			# Every path that changes the active state also sets the label
+			return
+		self._ui_sync_busy = True
+		try:
+			self.camera_toggle.set_active(is_active)
+			self.camera_toggle.set_label("Camera: ON" if is_active else "Camera: OFF")
+		finally:
+			self._ui_sync_busy = False
 	
 	def _on_camera_toggled(self, button: Gtk.ToggleButton):
 		"""Handle camera toggle button click.
@@ -678,32 +1038,35 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		Args:
 			button: The toggle button
 		"""
-		if not self.connected or not self.dbus_client:
+		if self._ui_sync_busy or not self.connected or not self.dbus_client:
 			return
 		
 		is_active = button.get_active()
+		button.set_label("Camera: ON" if is_active else "Camera: OFF")
+		# Ignore further clicks until the service answers
+		button.set_sensitive(False)
 		try:
 			if is_active:
-				success = self.dbus_client.start_camera()
-				if success:
-					button.set_label("Camera: ON")
-					self._handle_camera_state_change(True)
-				else:
-					button.set_active(False)
-					self._show_error("Failed to start camera")
+				self.dbus_client.start_camera_async(
+					lambda success, error: self._on_camera_toggle_done(True, success, error))
 			else:
-				success = self.dbus_client.stop_camera()
-				if success:
-					button.set_label("Camera: OFF")
-					self._handle_camera_state_change(False)
-				else:
-					button.set_active(True)
-					self._show_error("Failed to stop camera")
+				self.dbus_client.stop_camera_async(
+					lambda success, error: self._on_camera_toggle_done(False, success, error))
 		except Exception as e:
-			# Revert toggle state on error
-			button.set_active(not button.get_active())
-			button.set_label("Camera: ON" if button.get_active() else "Camera: OFF")
-			self._show_error(f"Error controlling camera: {e}")
+			self._on_camera_toggle_done(is_active, False, e)
+	
+	def _on_camera_toggle_done(self, requested: bool, success: Optional[bool], error: Optional[Exception]):
+		"""Finish a camera start/stop request from the toggle button."""
+		self.camera_toggle.set_sensitive(True)
+		if error is None and success:
+			self._handle_camera_state_change(requested)
+			return
+		# Revert toggle state on failure
+		self._update_camera_toggle(not requested)
+		if error is not None:
+			self._show_error(f"Error controlling camera: {error}")
+		else:
+			self._show_error("Failed to start camera" if requested else "Failed to stop camera")
 	
 	def _on_preview_toggled(self, button: Gtk.ToggleButton):
 		"""Handle preview toggle button click.
@@ -726,9 +1089,34 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		button.set_label("Direct Preview: ON" if is_active else "Direct Preview: OFF")
 		self._sync_direct_preview()
 	
+	def _preview_visible(self) -> bool:
+		"""True if the preview widget is mapped and the window isn't minimized."""
+		return self.preview_widget.get_mapped() and not self._minimized
+	
+	def _on_preview_visibility_changed(self, *_args):
+		"""Start the preview when it becomes visible and stop it when hidden."""
+		if self.preview_widget is None:
+			return
+		if self._preview_visible():
+			self._sync_preview_widget()
+		elif self.preview_widget.is_running() and self.preview_widget.fullscreen_window is None:
+			self.preview_widget.stop_preview("Preview paused while hidden")
+	
+	def _on_realize(self, _window: Gtk.Window):
+		"""Watch the toplevel surface for minimize/restore."""
+		surface = self.get_surface()
+		if surface is not None:
+			surface.connect("notify::state", self._on_surface_state_changed)
+	
+	def _on_surface_state_changed(self, surface, _param):
+		minimized = bool(surface.get_state() & Gdk.ToplevelState.MINIMIZED)
+		if minimized != self._minimized:
+			self._minimized = minimized
+			self._on_preview_visibility_changed()
+	
 	def _sync_preview_widget(self, restart: bool = False):
 		"""Ensure preview widget matches toggle and camera state."""
-		if not hasattr(self, 'preview_widget'):
+		if self.preview_widget is None:
 			return
 		
 		if not self.preview_toggle.get_active():
@@ -739,6 +1127,10 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 			self.preview_widget.show_camera_inactive_message()
 			return
 		
+		if not self._preview_visible():
+			# Started by _on_preview_visibility_changed when it becomes visible
+			return
+		
 		try:
 			if restart and self.preview_widget.is_running():
 				self.preview_widget.restart_preview()
@@ -749,7 +1141,7 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 	
 	def _sync_direct_preview(self):
 		"""Ensure direct preview matches toggle and camera config."""
-		if not hasattr(self, 'direct_preview_widget'):
+		if self.direct_preview_widget is None:
 			return
 		if not self.direct_preview_toggle.get_active():
 			self.direct_preview_widget.stop_preview()
@@ -762,24 +1154,33 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 			self.direct_preview_widget.start_preview()
 	
 	def _update_direct_preview_config(self):
-		if hasattr(self, 'direct_preview_widget'):
+		if self.direct_preview_widget is not None:
 			self.direct_preview_widget.set_camera_config(self.current_camera_config)
 	
 	def _show_error(self, message: str):
-		"""Show error message dialog."""
-		dialog = Gtk.MessageDialog(
-			transient_for=self,
-			message_type=Gtk.MessageType.ERROR,
-			buttons=Gtk.ButtonsType.OK,
-			text="Error"
-		)
-		# In GTK4, use get_message_area() to add secondary text
-		message_area = dialog.get_message_area()
-		secondary_label = Gtk.Label(label=message)
-		secondary_label.set_wrap(True)
-		message_area.append(secondary_label)
-		dialog.connect("response", lambda d, r: d.destroy())
-		dialog.show()
+		"""Show error message dialog.
+		
+		One dialog is created on first use and reused; a new error while it is
+		open just replaces the message.
+		"""
+		if self._error_dialog is None:
+			self._error_dialog = Gtk.MessageDialog(
+				transient_for=self,
+				message_type=Gtk.MessageType.ERROR,
+				buttons=Gtk.ButtonsType.OK,
+				text="Error"
+			)
+			# In GTK4, use get_message_area() to add secondary text
+			self._error_label = Gtk.Label()
+			self._error_label.set_wrap(True)
+			self._error_dialog.get_message_area().append(self._error_label)
+			self._error_dialog.set_hide_on_close(True)
+			# Hidden between errors, so it must not outlive the window
+			self._error_dialog.set_destroy_with_parent(True)
+			self._error_dialog.connect("response", lambda d, r: d.hide())
+		self._error_label.set_text(message)
+		# present() also raises the dialog if it is already open behind the window
+		self._error_dialog.present()
 	
 	def _on_next_clicked(self, button: Gtk.Button):
 		"""Handle Next button click - move to step 2 or finish."""
@@ -788,13 +1189,15 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 			self._release_step1_resources()
 			# Move to step 2
 			self.current_step = 2
+			page_built = self._ensure_virtual_preview_page()
 			self.stack.set_visible_child_name("step2")
-			self.step_label.set_markup("<b>Step 2 of 2</b>")
+			self.step_label.set_text("Step 2 of 2")
 			self.back_button.set_sensitive(True)
 			self.next_button.set_label("Finish")
-			# Refresh effect chain when entering step 2
-			if self.connected and hasattr(self, 'effect_chain') and isinstance(self.effect_chain, EffectChainWidget):
-				GLib.idle_add(self.effect_chain.refresh)
+			# Refresh effect chain when re-entering step 2 (a new chain widget loads it itself)
+			if not page_built and self.connected and isinstance(self.effect_chain, EffectChainWidget):
+				self._ui_dirty_flags.add('chain')
+				self._schedule_ui_flush()
 			# Initialize step 2 if needed
 			if self.connected:
 				GLib.idle_add(self._load_initial_camera_data)
@@ -811,7 +1214,7 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 			# Move to step 1
 			self.current_step = 1
 			self.stack.set_visible_child_name("step1")
-			self.step_label.set_markup("<b>Step 1 of 2</b>")
+			self.step_label.set_text("Step 1 of 2")
 			self.back_button.set_sensitive(False)
 			self.next_button.set_label("Next")
 	
@@ -820,34 +1223,50 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 		logger.info("Releasing step 1 resources")
 		try:
 			# Stop direct preview
-			if hasattr(self, 'direct_preview_widget'):
+			if self.direct_preview_widget is not None:
 				self.direct_preview_widget.stop_preview()
 				logger.debug("Direct preview stopped")
 		except Exception as e:
 			logger.error(f"Error releasing step 1 resources: {e}", exc_info=True)
 	
-	def _release_step2_resources(self):
-		"""Release all resources used in step 2 (Virtual Preview)."""
+	def _release_step2_resources(self, wait: bool = False):
+		"""Release all resources used in step 2 (Virtual Preview).
+		
+		Args:
+			wait: Block until the service has stopped the camera. Needed when
+				closing, since an async request would not be sent once the
+				main loop exits.
+		"""
 		logger.info("Releasing step 2 resources")
 		try:
 			# Stop preview widget
-			if hasattr(self, 'preview_widget'):
+			if self.preview_widget is not None:
 				self.preview_widget.stop_preview()
 				logger.debug("Preview widget stopped")
 			
 			# Stop camera via D-Bus if active
 			if self.connected and self.dbus_client and self.camera_state_active:
 				try:
-					self.dbus_client.stop_camera()
+					if wait:
+						self.dbus_client.stop_camera()
+						logger.debug("Camera stopped via D-Bus")
+					else:
+						self.dbus_client.stop_camera_async(self._on_release_camera_stopped)
 					self.camera_state_active = False
-					if hasattr(self, 'camera_toggle'):
+					if self.camera_toggle is not None:
 						self._update_camera_toggle(False)
-					logger.debug("Camera stopped via D-Bus")
 				except Exception as e:
 					logger.error(f"Error stopping camera via D-Bus: {e}", exc_info=True)
 		except Exception as e:
 			logger.error(f"Error releasing step 2 resources: {e}", exc_info=True)
 	
+	def _on_release_camera_stopped(self, success: Optional[bool], error: Optional[Exception]):
+		"""Log the outcome of the stop_camera request sent when leaving step 2."""
+		if error is not None:
+			logger.error(f"Error stopping camera via D-Bus: {error}")
+		elif success:
+			logger.debug("Camera stopped via D-Bus")
+	
 	def _register_crash_handlers(self):
 		"""Register signal handlers to ensure camera is released on crash."""
 		def emergency_cleanup():
@@ -855,13 +1274,13 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 			logger.critical("Emergency cleanup triggered - releasing camera resources")
 			try:
 				# Release all resources regardless of current step
-				if hasattr(self, 'direct_preview_widget'):
+				if self.direct_preview_widget is not None:
 					try:
 						self.direct_preview_widget.stop_preview()
 					except Exception:
 						pass
 				
-				if hasattr(self, 'preview_widget'):
+				if self.preview_widget is not None:
 					try:
 						self.preview_widget.stop_preview()
 					except Exception:
@@ -899,16 +1318,18 @@ class CamfxMainWindow(Gtk.ApplicationWindow):
 	def do_close_request(self):
 		"""Handle window close request."""
 		logger.info("Window close requested, releasing all resources")
+		self._flush_dbus()
+		if self.dbus_client:
+			# Queued updates go out asynchronously; write them before the loop stops
+			self.dbus_client.bus.flush()
 		# Release resources based on current step
 		if self.current_step == 1:
 			self._release_step1_resources()
 		else:
-			self._release_step2_resources()
+			self._release_step2_resources(wait=True)
 		
 		# Quit the application
-		app = self.get_application()
-		if app:
-			app.quit()
+		self._app.quit()
 		return False  # Allow window to close
 
 
@@ -924,6 +1345,20 @@ class CamfxApplication(Gtk.Application):
 		super().__init__(application_id="org.camfx.ControlPanel", flags=0)
 		self.window: Optional[CamfxMainWindow] = None
 	
+	def do_startup(self):
+		"""Install the application stylesheet once per process."""
+		Gtk.Application.do_startup(self)
+		display = Gdk.Display.get_default()
+		if display is None:
+			return
+		provider = Gtk.CssProvider()
+		if hasattr(provider, 'load_from_string'):
+			# GTK 4.12+
+			provider.load_from_string(APP_CSS)
+		else:
+			provider.load_from_data(APP_CSS.encode())
+		Gtk.StyleContext.add_provider_for_display(display, provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+	
 	def do_activate(self):
 		"""Activate application."""
 		if self.window is None:
@@ -969,38 +1404,12 @@ def main():
 	try:
 		app = CamfxApplication()
 		
-		# Run the application - this will call do_activate automatically
-		# Note: app.run() blocks until the application quits
+		# Gtk.Application.run() registers the app (forwarding to an already
+		# running instance), activates it and runs the main loop until quit.
+		# Only argv[0] is passed: the app takes no arguments of its own, and
+		# leftover ones such as "gui" from `camfx gui` would be rejected as files.
 		try:
-			# Register the application first
-			register_result = app.register()
-			
-			if not register_result:
-				return 1
-			
-			# Check if app is already running (single-instance)
-			is_remote = app.get_is_remote()
-			
-			if is_remote:
-				app.activate()
-				return 0
-			
-			# Activate the application (this will call do_activate)
-			app.activate()
-			
-			# Run the main loop
-			from gi.repository import GLib
-			main_loop = GLib.MainLoop()
-			
-			# Connect quit signal to exit main loop
-			def on_quit(app):
-				main_loop.quit()
-			
-			app.connect("shutdown", on_quit)
-			
-			main_loop.run()
-			
-			return 0
+			return app.run(sys.argv[:1])
 		except Exception as run_error:
 			import traceback
 			traceback.print_exc()
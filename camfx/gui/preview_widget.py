@@ -1,6 +1,7 @@
 """Preview widget for displaying live camera feed."""
 
 import logging
+import os
 import sys
 import threading
 import time
@@ -14,8 +15,13 @@ gi.require_version('GdkPixbuf', '2.0')
 gi.require_version('GLib', '2.0')
 from gi.repository import Gtk, Gdk, GdkPixbuf, GLib
 
+from .._kernels import bgr_to_rgb
+
 logger = logging.getLogger('camfx.gui.preview')
 
+# Use the numba channel swap instead of cvtColor, for OpenCV builds without SIMD dispatch
+_FORCE_NUMBA_CVT = os.environ.get('CAMFX_FORCE_NUMBA_CVT') == '1'
+
 try:
 	from ..input_pipewire import PipeWireInput
 	PIPEWIRE_AVAILABLE = True
@@ -28,34 +34,45 @@ except ImportError as e:
 class PreviewWidget(Gtk.Box):
 	"""Widget showing live preview from camfx virtual camera."""
 	
-	def __init__(self, source_name: str = "camfx"):
+	def __init__(self, source_name: str = "camfx", prefer_rgb: bool = True):
 		"""Initialize preview widget.
 		
 		Args:
 			source_name: Name of PipeWire source to preview
+			prefer_rgb: Ask PipeWire for RGB frames so no color conversion is needed here
 		"""
 		super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=10)
 		self.source_name = source_name
+		self._pixel_format = 'RGB' if prefer_rgb else 'BGR'
 		self.pipewire_input: Optional[PipeWireInput] = None
 		self.preview_thread: Optional[threading.Thread] = None
 		self.running = False
 		self.current_frame: Optional[np.ndarray] = None
+		# Cached logger.isEnabledFor(DEBUG), refreshed on each start_preview()
+		self._debug_logging = False
 		self._frame_log_interval = 1.0
 		self._last_frame_log = 0.0
 		self._ui_log_interval = 1.0
 		self._last_ui_log = 0.0
 		self._placeholder_displayed = False
 		self._last_placeholder_reason: Optional[str] = None
+		self._downsample = 1
+		self._rgb_buf: Optional[np.ndarray] = None  # Reused cvtColor output, reallocated on size change
+		# At most one frame update is queued on the main loop; it always shows the newest frame
+		self._update_pending = False
+		self._update_lock = threading.Lock()
+		self._ready_pixbuf: Optional[GdkPixbuf.Pixbuf] = None
+		self._convert_lock = threading.Lock()
+		# Device-pixel size of the picture, refreshed on size-allocate; frames are scaled down to fit it
+		self._display_size: Optional[tuple[int, int]] = None
 		
 		# Create picture widget for displaying frames
 		self.picture = Gtk.Picture()
 		self.picture.set_content_fit(Gtk.ContentFit.CONTAIN)
 		self.picture.set_hexpand(True)
 		self.picture.set_vexpand(True)
-		# Set minimum size so preview area is visible
-		self.picture.set_size_request(640, 480)
-		# Set a background color so we can see the widget area
-		self.picture.set_css_classes(["preview-picture"])
+		# Minimum size comes from the application stylesheet so the preview area is visible
+		self.picture.set_css_classes(["preview-picture", "preview-pane"])
 		self.append(self.picture)
 		
 		# Preview status label
@@ -79,6 +96,9 @@ class PreviewWidget(Gtk.Box):
 		
 		logger.info(f"Starting preview for source '{self.source_name}'")
 		self.running = True
+		self._debug_logging = logger.isEnabledFor(logging.DEBUG)
+		self._update_pending = False
+		self._ready_pixbuf = None
 		self.preview_thread = threading.Thread(target=self._preview_loop, daemon=True)
 		self.preview_thread.start()
 		logger.debug("Preview thread started")
@@ -151,7 +171,7 @@ class PreviewWidget(Gtk.Box):
 			while self.running and self.pipewire_input is None:
 				try:
 					logger.info(f"Connecting to PipeWire source '{self.source_name}'")
-					self.pipewire_input = PipeWireInput(source_name=self.source_name)
+					self.pipewire_input = PipeWireInput(source_name=self.source_name, pixel_format=self._pixel_format)
 					logger.info("Successfully connected to PipeWire source")
 					GLib.idle_add(self._update_status, "Preview: Connected")
 				except RuntimeError as e:
@@ -191,7 +211,16 @@ class PreviewWidget(Gtk.Box):
 						if self._should_log_debug('_last_frame_log', self._frame_log_interval):
 							logger.debug("Frame received: shape=%s, dtype=%s", frame.shape, frame.dtype)
 						self.current_frame = frame
-						GLib.idle_add(self._update_frame, frame)
+						# Convert here so the main thread only sets the finished pixbuf
+						pixbuf = self._frame_to_pixbuf(frame)
+						if pixbuf is None:
+							continue
+						with self._update_lock:
+							self._ready_pixbuf = pixbuf
+							schedule = not self._update_pending
+							self._update_pending = True
+						if schedule:
+							GLib.idle_add(self._update_frame_latest)
 						
 						# Update FPS counter (rough estimate)
 						frame_count += 1
@@ -202,7 +231,7 @@ class PreviewWidget(Gtk.Box):
 							fps = frame_count / elapsed if elapsed > 0 else 0.0
 							frame_count = 0
 							last_fps_time = current_time
-							logger.debug(f"Preview FPS: {fps:.2f}")
+							logger.debug("Preview FPS: %.2f", fps)
 							GLib.idle_add(self._update_status, f"Status: Connected ({fps:.2f} FPS)")
 						
 						# Log summary every 10 seconds
@@ -213,10 +242,11 @@ class PreviewWidget(Gtk.Box):
 						no_frame_count += 1
 						if no_frame_count == 1:
 							logger.debug("No frame available from PipeWireInput")
-						if no_frame_count > 100:  # ~1 second at 10ms intervals
+						if no_frame_count > 10:  # ~1 second of 100ms waits
 							logger.warning("No frames received for ~1 second")
 							no_frame_count = 0
-						time.sleep(0.01)  # Small delay if no frame available
+						# Sleep until the appsink delivers a frame instead of polling
+						self.pipewire_input.wait_for_frame(0.1)
 				except Exception as e:
 					logger.error(f"Exception in preview loop: {e}", exc_info=True)
 					time.sleep(0.1)
@@ -237,33 +267,67 @@ class PreviewWidget(Gtk.Box):
 				logger.error(f"Error releasing PipeWireInput: {e}", exc_info=True)
 		self.pipewire_input = None
 	
+	def _update_frame_latest(self):
+		"""Show the newest converted frame (idle callback, main thread)."""
+		with self._update_lock:
+			self._update_pending = False
+			pixbuf = self._ready_pixbuf
+			self._ready_pixbuf = None
+		if pixbuf is not None and self.running:
+			self._show_pixbuf(pixbuf)
+		return False
+	
 	def _update_frame(self, frame: np.ndarray):
-		"""Update picture widget with new frame (called from main thread)."""
+		"""Convert and show a frame right away (called from main thread)."""
 		if not self.running:
 			return
+		pixbuf = self._frame_to_pixbuf(frame)
+		if pixbuf is not None:
+			self._show_pixbuf(pixbuf)
+	
+	def _show_pixbuf(self, pixbuf: GdkPixbuf.Pixbuf):
+		"""Set pixbuf on the picture and the fullscreen window (main thread)."""
+		self._placeholder_displayed = False
+		self.picture.set_pixbuf(pixbuf)
 		
+		# Update fullscreen window if open
+		if self.fullscreen_window:
+			fullscreen_picture = self.fullscreen_window.get_child()
+			if fullscreen_picture and isinstance(fullscreen_picture, Gtk.Picture):
+				fullscreen_picture.set_pixbuf(pixbuf)
+	
+	def _frame_to_pixbuf(self, frame: np.ndarray) -> Optional[GdkPixbuf.Pixbuf]:
+		"""Scale and convert a captured frame into a pixbuf (safe to call off the main thread)."""
 		try:
-			# Convert numpy array to GdkPixbuf
 			height, width = frame.shape[:2]
 			if self._should_log_debug('_last_ui_log', self._ui_log_interval):
 				logger.debug("Updating frame: %sx%s", width, height)
-			self._placeholder_displayed = False
 			
 			# Validate frame dimensions
 			if width <= 0 or height <= 0:
 				logger.error(f"Invalid frame dimensions: {width}x{height}")
-				return
+				return None
 			
-			# Convert BGR to RGB
-			frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+			if self._downsample > 1:
+				# Fewer pixels to convert and upload; the picture scales it back up
+				width = max(1, width // self._downsample)
+				height = max(1, height // self._downsample)
+				frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_NEAREST)
+			elif self.fullscreen_window is None:
+				target = self._fit_to_display(width, height)
+				if target is not None:
+					width, height = target
+					frame = cv2.resize(frame, target, interpolation=cv2.INTER_AREA)
 			
-			# Ensure frame is contiguous in memory
-			if not frame_rgb.flags['C_CONTIGUOUS']:
-				frame_rgb = np.ascontiguousarray(frame_rgb)
+			if self._pixel_format == 'RGB':
+				# Already in pixbuf channel order; the snapshot is the only copy
+				data = GLib.Bytes.new_take(frame.tobytes())
+			else:
+				data = self._bgr_to_rgb_bytes(frame)
 			
-			# Create pixbuf
-			pixbuf = GdkPixbuf.Pixbuf.new_from_data(
-				frame_rgb.tobytes(),
+			# Hand the snapshot to GLib directly; new_from_data's override copies it again
+			return GdkPixbuf.Pixbuf.new_from_bytes(
+				data,
 				GdkPixbuf.Colorspace.RGB,
 				False,
 				8,
@@ -271,18 +335,51 @@ class PreviewWidget(Gtk.Box):
 				height,
 				width * 3
 			)
-			
-			# Update picture widget
-			self.picture.set_pixbuf(pixbuf)
-			
-			# Update fullscreen window if open
-			if self.fullscreen_window:
-				fullscreen_picture = self.fullscreen_window.get_child()
-				if fullscreen_picture and isinstance(fullscreen_picture, Gtk.Picture):
-					fullscreen_picture.set_pixbuf(pixbuf)
-		
 		except Exception as e:
 			logger.error(f"Error updating frame: {e}", exc_info=True)
+			return None
+	
+	def _bgr_to_rgb_bytes(self, frame: np.ndarray) -> GLib.Bytes:
+		"""Convert a BGR frame to an RGB GLib.Bytes snapshot."""
+		# The buffer is shared with main-thread redraws; tobytes() snapshots it before release
+		with self._convert_lock:
+			# Convert BGR to RGB into the reused buffer (always contiguous)
+			if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+				self._rgb_buf = np.empty_like(frame)
+			if _FORCE_NUMBA_CVT:
+				frame_rgb = bgr_to_rgb(frame, self._rgb_buf)
+			else:
+				frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+			return GLib.Bytes.new_take(frame_rgb.tobytes())
+	
+	def _fit_to_display(self, width: int, height: int) -> Optional[tuple[int, int]]:
+		"""Return the aspect-preserving size that fits the picture, or None if no shrink is needed."""
+		if self._display_size is None:
+			return None
+		scale = min(self._display_size[0] / width, self._display_size[1] / height)
+		if scale >= 1.0:
+			return None
+		return max(1, round(width * scale)), max(1, round(height * scale))
+	
+	def do_size_allocate(self, width: int, height: int, baseline: int):
+		Gtk.Box.do_size_allocate(self, width, height, baseline)
+		factor = self.get_scale_factor()
+		size = (self.picture.get_width() * factor, self.picture.get_height() * factor)
+		self._display_size = size if size[0] > 0 and size[1] > 0 else None
+	
+	def set_downsample(self, factor: int):
+		"""Render frames at 1/factor resolution (e.g. while a slider is dragged).
+		
+		Args:
+			factor: Downsample factor; 1 restores full resolution
+		"""
+		factor = max(1, int(factor))
+		if factor == self._downsample:
+			return
+		self._downsample = factor
+		if factor == 1 and self.current_frame is not None:
+			# Redraw the last frame at full resolution right away
+			self._update_frame(self.current_frame)
 	
 	def _update_status(self, status: str):
 		"""Update status label (called from main thread)."""
@@ -328,6 +425,8 @@ class PreviewWidget(Gtk.Box):
 
 	def _should_log_debug(self, attr_name: str, interval: float) -> bool:
 		"""Return True if a debug log should be emitted for the given attribute."""
+		if not self._debug_logging:
+			return False
 		now = time.time()
 		last = getattr(self, attr_name, 0.0)
 		if now - last >= interval:
@@ -1,6 +1,43 @@
 """Utility functions for GUI."""
 
-from typing import Dict, Any
+import types
+from typing import Any, Mapping
+
+
+_EFFECT_NAMES = {
+	'blur': 'Background Blur',
+	'replace': 'Background Replace',
+	'brightness': 'Brightness Adjustment',
+	'beautify': 'Face Beautification',
+	'autoframe': 'Auto Framing',
+	'gaze-correct': 'Eye Gaze Correction',
+}
+
+_PARAMETER_NAMES = {
+	'strength': 'Strength',
+	'background': 'Background Image',
+	'brightness': 'Brightness',
+	'contrast': 'Contrast',
+	'face_only': 'Face Only',
+	'smoothness': 'Smoothness',
+	'padding': 'Padding',
+	'min_zoom': 'Min Zoom',
+	'max_zoom': 'Max Zoom',
+}
+
+# Read-only so the shared mappings handed out by get_effect_defaults can't be mutated
+_EFFECT_DEFAULTS = {
+	effect_type: types.MappingProxyType(defaults)
+	for effect_type, defaults in {
+		'blur': {'strength': 25},
+		'replace': {'background': None},
+		'brightness': {'brightness': 0, 'contrast': 1.0, 'face_only': False},
+		'beautify': {'smoothness': 5},
+		'autoframe': {'padding': 0.3, 'min_zoom': 1.0, 'max_zoom': 2.0},
+		'gaze-correct': {'strength': 0.5},
+	}.items()
+}
+_NO_DEFAULTS: Mapping[str, Any] = types.MappingProxyType({})
 
 
 def format_effect_name(effect_type: str) -> str:
@@ -12,15 +49,7 @@ def format_effect_name(effect_type: str) -> str:
 	Returns:
 		Formatted display name
 	"""
-	name_map = {
-		'blur': 'Background Blur',
-		'replace': 'Background Replace',
-		'brightness': 'Brightness Adjustment',
-		'beautify': 'Face Beautification',
-		'autoframe': 'Auto Framing',
-		'gaze-correct': 'Eye Gaze Correction',
-	}
-	return name_map.get(effect_type, effect_type.replace('-', ' ').title())
+	return _EFFECT_NAMES.get(effect_type) or effect_type.replace('-', ' ').title()
 
 
 def format_parameter_name(parameter: str) -> str:
@@ -32,36 +61,19 @@ def format_parameter_name(parameter: str) -> str:
 	Returns:
 		Formatted display name
 	"""
-	name_map = {
-		'strength': 'Strength',
-		'background': 'Background Image',
-		'brightness': 'Brightness',
-		'contrast': 'Contrast',
-		'face_only': 'Face Only',
-		'smoothness': 'Smoothness',
-		'padding': 'Padding',
-		'min_zoom': 'Min Zoom',
-		'max_zoom': 'Max Zoom',
-	}
-	return name_map.get(parameter, parameter.replace('_', ' ').title())
+	return _PARAMETER_NAMES.get(parameter) or parameter.replace('_', ' ').title()
 
 
-def get_effect_defaults(effect_type: str) -> Dict[str, Any]:
+def get_effect_defaults(effect_type: str) -> Mapping[str, Any]:
 	"""Get default parameter values for an effect.
 	
+	The returned mapping is shared between callers and read-only; copy it
+	with dict() before modifying.
+	
 	Args:
 		effect_type: Effect type string
 	
 	Returns:
-		Dictionary of default parameter values
+		Read-only mapping of default parameter values
 	"""
-	defaults = {
-		'blur': {'strength': 25},
-		'replace': {'background': None},
-		'brightness': {'brightness': 0, 'contrast': 1.0, 'face_only': False},
-		'beautify': {'smoothness': 5},
-		'autoframe': {'padding': 0.3, 'min_zoom': 1.0, 'max_zoom': 2.0},
-		'gaze-correct': {'strength': 0.5},
-	}
-	return defaults.get(effect_type, {})
-
+	return _EFFECT_DEFAULTS.get(effect_type, _NO_DEFAULTS)
@@ -109,18 +109,23 @@ def _find_pipewire_source_id(source_name: str) -> Optional[int]:
 class PipeWireInput:
 	"""Read from PipeWire virtual camera source using GStreamer."""
 	
-	def __init__(self, source_name: str = "camfx"):
+	def __init__(self, source_name: str = "camfx", pixel_format: str = 'BGR'):
 		"""Initialize PipeWire input.
 		
 		Args:
 			source_name: Name of the PipeWire source to read from
+			pixel_format: Channel order of returned frames, 'BGR' or 'RGB'
 		"""
+		if pixel_format not in ('BGR', 'RGB'):
+			raise ValueError(f"Unsupported pixel format: {pixel_format}")
+		
 		if not GSTREAMER_AVAILABLE:
 			logger.error("GStreamer Python bindings not available")
 			raise RuntimeError("GStreamer Python bindings not available. Install PyGObject.")
 		
 		logger.info(f"Initializing PipeWireInput for source '{source_name}'")
 		self.source_name = source_name
+		self.pixel_format = pixel_format
 		self.pipeline: Optional[Gst.Pipeline] = None
 		self.appsink: Optional[Gst.Element] = None
 		self.pipewire_src: Optional[Gst.Element] = None
@@ -181,11 +186,11 @@ class PipeWireInput:
 		)
 		
 		# Create pipeline using string (simpler and often more reliable)
-		# pipewiresrc -> videoconvert -> appsink with BGR format
+		# pipewiresrc -> videoconvert -> appsink; videoconvert produces the requested channel order
 		pipeline_str = (
 			'pipewiresrc name=pwsrc do-timestamp=true ! '
 			'videoconvert ! '
-			'video/x-raw,format=BGR ! '
+			f'video/x-raw,format={self.pixel_format} ! '
 			'appsink name=sink'
 		)
 		logger.debug("Input pipeline description: %s", pipeline_str)
@@ -258,7 +263,7 @@ class PipeWireInput:
 		
 		# Configure appsink programmatically for better control
 		# Set caps to specify expected format (helps with negotiation)
-		caps_str = "video/x-raw,format=BGR"
+		caps_str = f"video/x-raw,format={self.pixel_format}"
 		caps = Gst.Caps.from_string(caps_str)
 		self.appsink.set_property('caps', caps)
 		
@@ -392,18 +397,20 @@ class PipeWireInput:
 					# Store frame in queue (keep latest)
 					self.frame_queue.append(frame.copy())
 					self.sample_available.set()
-					logger.debug(f"Frame queued: {width}x{height}")
 					self._frames_received += 1
-					now = time.time()
-					if self._frames_received == 1 or now - self._last_sample_log >= 5.0:
-						logger.debug(
-							"Total frames received from '%s': %s (latest %sx%s)",
-							self.source_name,
-							self._frames_received,
-							width,
-							height,
-						)
-						self._last_sample_log = now
+					# Per-frame path: skip the formatting and clock read unless debug is on
+					if logger.isEnabledFor(logging.DEBUG):
+						logger.debug("Frame queued: %sx%s", width, height)
+						now = time.time()
+						if self._frames_received == 1 or now - self._last_sample_log >= 5.0:
+							logger.debug(
+								"Total frames received from '%s': %s (latest %sx%s)",
+								self.source_name,
+								self._frames_received,
+								width,
+								height,
+							)
+							self._last_sample_log = now
 					
 				finally:
 					buffer.unmap(map_info)
@@ -416,7 +423,7 @@ class PipeWireInput:
 		"""Read a frame from PipeWire source.
 		
 		Returns:
-			Tuple of (success, frame) where frame is BGR format numpy array
+			Tuple of (success, frame) where frame is a numpy array in ``pixel_format`` order
 		"""
 		if not self.running or self.appsink is None:
 			return False, None
@@ -473,6 +480,19 @@ class PipeWireInput:
 			self._last_empty_log = now
 		return False, None
 	
+	def wait_for_frame(self, timeout: float) -> bool:
+		"""Block until a frame is queued, the input is released, or timeout expires.
+		
+		Args:
+			timeout: Maximum time to wait in seconds
+		
+		Returns:
+			True if a frame is ready to read
+		"""
+		if self.sample_available.wait(timeout=timeout):
+			return self.running and bool(self.frame_queue)
+		return False
+	
 	def release(self):
 		"""Release resources."""
 		self.running = False
@@ -1,10 +1,14 @@
 """Tests for effect chaining functionality."""
 
+import os
+from types import SimpleNamespace
+
 import cv2
 import numpy as np
 import pytest
 
-from camfx.control import EffectChain, EffectController
+from camfx import _kernels
+from camfx.control import EffectChain, EffectController, EffectPipeline, _read_background
 from camfx.effects import (
 	BackgroundBlur, BackgroundReplace, BrightnessAdjustment,
 	FaceBeautification, AutoFraming, EyeGazeCorrection
@@ -81,6 +85,20 @@ class TestEffectChain:
 		result = chain.apply(frame, mask)
 		assert result.shape == frame.shape
 	
+	def test_replace_picks_up_new_background(self):
+		"""Test replace re-resizes when the background image changes."""
+		effect = BackgroundReplace()
+		frame = np.zeros((100, 100, 3), dtype=np.uint8)
+		mask = np.zeros((100, 100), dtype=np.float32)
+		
+		white = np.full((50, 50, 3), 255, dtype=np.uint8)
+		result = effect.apply(frame, mask, white)
+		assert result[0, 0, 0] == 255
+		
+		gray = np.full((50, 50, 3), 100, dtype=np.uint8)
+		result = effect.apply(frame, mask, gray)
+		assert result[0, 0, 0] == 100
+	
 	def test_brightness_face_only_with_mask(self):
 		"""Test brightness with face_only requires mask."""
 		chain = EffectChain()
@@ -126,6 +144,21 @@ class TestEffectChain:
 		result = chain.apply(frame, mask)
 		assert result.shape == frame.shape
 	
+	def test_chain_writes_into_dst(self):
+		"""Test that the final effect writes into a caller-supplied buffer."""
+		chain = EffectChain()
+		chain.add_effect('blur', {'strength': 25})
+		chain.add_effect('brightness', {'brightness': 10})
+		
+		frame = np.ones((100, 100, 3), dtype=np.uint8) * 128
+		mask = np.ones((100, 100), dtype=np.float32) * 0.5
+		dst = np.zeros_like(frame)
+		
+		result = chain.apply(frame, mask, dst=dst)
+		assert result is dst
+		np.testing.assert_array_equal(frame, 128)  # Input left untouched
+		np.testing.assert_array_equal(result, chain.apply(frame, mask))
+	
 	def test_chain_remove_effect(self):
 		"""Test removing effect from chain by index."""
 		chain = EffectChain()
@@ -342,6 +375,19 @@ class TestEffectController:
 		effect, config = chain.effects[0]
 		assert config['brightness'] == 20
 	
+	def test_get_chain_snapshot_isolated_from_updates(self):
+		"""Test that a chain snapshot is not mutated by later parameter updates."""
+		controller = EffectController()
+		
+		controller.add_effect('brightness', {'brightness': 10})
+		snapshot = controller.get_chain()
+		controller.update_effect_parameter('brightness', 'brightness', 20)
+		
+		_, old_config = snapshot.effects[0]
+		_, new_config = controller.get_chain().effects[0]
+		assert old_config['brightness'] == 10
+		assert new_config['brightness'] == 20
+	
 	def test_update_effect_parameter_not_found(self):
 		"""Test updating parameter of non-existent effect."""
 		controller = EffectController()
@@ -419,6 +465,176 @@ class TestEffectController:
 		assert len(chain) >= 0  # At least 0 (could be empty if all removed)
 
 
+class TestReadBackground:
+	"""Test background image loading and caching."""
+	
+	def test_same_array_while_file_unchanged(self, tmp_path):
+		"""Test that an unchanged file is decoded once."""
+		path = str(tmp_path / "bg.png")
+		cv2.imwrite(path, np.full((8, 8, 3), 10, dtype=np.uint8))
+		assert _read_background(path) is _read_background(path)
+	
+	def test_missing_file_picked_up_once_created(self, tmp_path):
+		"""Test that a failed read is not cached."""
+		path = str(tmp_path / "bg.png")
+		assert _read_background(path) is None
+		cv2.imwrite(path, np.full((8, 8, 3), 10, dtype=np.uint8))
+		background = _read_background(path)
+		assert background is not None
+		assert background.shape == (8, 8, 3)
+	
+	def test_replaced_file_reloaded(self, tmp_path):
+		"""Test that rewriting the file at the same path reloads it."""
+		path = str(tmp_path / "bg.png")
+		cv2.imwrite(path, np.full((8, 8, 3), 10, dtype=np.uint8))
+		assert _read_background(path)[0, 0, 0] == 10
+		cv2.imwrite(path, np.full((8, 8, 3), 200, dtype=np.uint8))
+		# Bump mtime explicitly; coarse filesystem timestamps may not change otherwise
+		stat = os.stat(path)
+		os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+		assert _read_background(path)[0, 0, 0] == 200
+
+
+class TestEffectPipeline:
+	"""Test EffectPipeline stage threading."""
+	
+	def test_matches_serial_chain_in_order(self):
+		"""Test pipelined output equals the serial chain, frame for frame."""
+		chain = EffectChain()
+		chain.add_effect('brightness', {'brightness': 10})
+		chain.add_effect('blur', {'strength': 5})
+		mask = np.full((40, 40), 0.5, dtype=np.float32)
+		frames = [np.full((40, 40, 3), value, dtype=np.uint8) for value in range(0, 200, 20)]
+		expected = [chain.apply(frame, mask) for frame in frames]
+		
+		pipeline = EffectPipeline(chain.effects, pin_threads=False)
+		try:
+			outputs = [pipeline.process(frame, mask, chain) for frame in frames]
+		finally:
+			pipeline.stop()
+		
+		# At most `depth` frames are still in flight; the rest come out in submission order
+		produced = [out for out in outputs if out is not None]
+		assert len(produced) >= len(frames) - pipeline.depth
+		for result, reference in zip(produced, expected):
+			np.testing.assert_array_equal(result, reference)
+	
+	def test_matches_tracks_effect_instances(self):
+		"""Test a pipeline is only reused for the same effect instances."""
+		chain = EffectChain()
+		chain.add_effect('brightness', {'brightness': 10})
+		chain.add_effect('blur', {'strength': 5})
+		pipeline = EffectPipeline(chain.effects, pin_threads=False)
+		try:
+			assert pipeline.matches(chain)
+			chain.remove_effect(1)
+			assert not pipeline.matches(chain)
+		finally:
+			pipeline.stop()
+
+
+class TestBgrToRgb:
+	"""Test the BGR->RGB kernel on the cv2 fallback and, when installed, numba."""
+	
+	@pytest.fixture(params=[
+		False,
+		pytest.param(True, marks=pytest.mark.skipif(not _kernels.NUMBA_AVAILABLE, reason="numba not installed")),
+	], ids=['cv2', 'numba'])
+	def use_numba(self, request, monkeypatch):
+		monkeypatch.setattr(_kernels, 'NUMBA_AVAILABLE', request.param)
+		return request.param
+	
+	def _frame(self):
+		return np.random.default_rng(0).integers(0, 256, (7, 9, 3), dtype=np.uint8)
+	
+	def test_separate_dst(self, use_numba):
+		"""Test conversion into a separate output buffer."""
+		frame = self._frame()
+		dst = np.empty_like(frame)
+		result = _kernels.bgr_to_rgb(frame, dst)
+		assert result is dst
+		np.testing.assert_array_equal(dst, frame[..., ::-1])
+	
+	def test_in_place(self, use_numba):
+		"""Test that dst may alias src."""
+		frame = self._frame()
+		expected = frame[..., ::-1].copy()
+		result = _kernels.bgr_to_rgb(frame, frame)
+		assert result is frame
+		np.testing.assert_array_equal(frame, expected)
+
+
+class TestFaceBeautification:
+	"""Test FaceBeautification face mask caching."""
+	
+	def _fake_mesh(self, face: bool = True):
+		"""Face Mesh stand-in that reports a centered circular face (or none) and counts calls."""
+		angles = np.linspace(0, 2 * np.pi, 478, endpoint=False)
+		landmarks = [SimpleNamespace(x=0.5 + 0.2 * np.cos(a), y=0.5 + 0.2 * np.sin(a)) for a in angles]
+		results = SimpleNamespace(multi_face_landmarks=[SimpleNamespace(landmark=landmarks)] if face else None)
+		mesh = SimpleNamespace(calls=0)
+		
+		def process(frame_rgb):
+			mesh.calls += 1
+			return results
+		
+		mesh.process = process
+		return mesh
+	
+	def test_mask_reused_on_still_frames(self):
+		"""Test Face Mesh is skipped between intervals when nothing moves."""
+		effect = FaceBeautification()
+		effect.face_mesh = self._fake_mesh()
+		frame = np.full((90, 160, 3), 128, dtype=np.uint8)
+		
+		for _ in range(FaceBeautification._MESH_INTERVAL):
+			effect.apply(frame, None, smoothness=5)
+		assert effect.face_mesh.calls == 1
+		
+		effect.apply(frame, None, smoothness=5)
+		assert effect.face_mesh.calls == 2
+	
+	def test_smoothness_one_skips_face_mesh(self):
+		"""Test the identity smoothness level returns the frame untouched."""
+		effect = FaceBeautification()
+		effect.face_mesh = self._fake_mesh()
+		frame = np.full((90, 160, 3), 128, dtype=np.uint8)
+		
+		assert effect.apply(frame, None, smoothness=1) is frame
+		assert effect.face_mesh.calls == 0
+	
+	def test_misses_back_off(self):
+		"""Test consecutive misses on a still scene skip increasingly many frames."""
+		effect = FaceBeautification()
+		effect.face_mesh = self._fake_mesh(face=False)
+		frame = np.full((90, 160, 3), 128, dtype=np.uint8)
+		
+		for _ in range(6):
+			assert effect.apply(frame, None, smoothness=5) is frame
+		# Runs on frames 1, 3 (after skipping 1) and 6 (after skipping 2)
+		assert effect.face_mesh.calls == 3
+	
+	def test_writes_into_dst(self):
+		"""Test the smoothed result lands in the caller's buffer."""
+		effect = FaceBeautification()
+		effect.face_mesh = self._fake_mesh()
+		frame = np.random.randint(0, 256, (90, 160, 3), dtype=np.uint8)
+		dst = np.empty_like(frame)
+		
+		result = effect.apply(frame, None, smoothness=5, dst=dst)
+		assert result is dst
+		np.testing.assert_array_equal(result, effect.apply(frame, None, smoothness=5))
+	
+	def test_motion_forces_mesh_rerun(self):
+		"""Test a large scene change re-runs Face Mesh immediately."""
+		effect = FaceBeautification()
+		effect.face_mesh = self._fake_mesh()
+		
+		effect.apply(np.zeros((90, 160, 3), dtype=np.uint8), None, smoothness=5)
+		effect.apply(np.full((90, 160, 3), 255, dtype=np.uint8), None, smoothness=5)
+		assert effect.face_mesh.calls == 2
+
+
 class TestEffectChainingEdgeCases:
 	"""Test edge cases and corner cases for effect chaining."""
 	
@@ -0,0 +1,73 @@
+"""Tests for the CUDA offload helpers, with cv2.cuda mocked."""
+
+import threading
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+import pytest
+
+from camfx import gpu
+
+
+class FakeGpuMat:
+	"""Host-memory stand-in for cv2.cuda_GpuMat."""
+	
+	def __init__(self):
+		self.data = None
+	
+	def upload(self, frame):
+		self.data = frame.copy()
+	
+	def download(self, dst=None):
+		if dst is None:
+			return self.data.copy()
+		dst[...] = self.data
+		return dst
+
+
+@pytest.fixture
+def fake_cuda(monkeypatch):
+	"""Enable the GPU path with cv2.cuda ops that overlap across two threads."""
+	barrier = threading.Barrier(2, timeout=5)
+	
+	def bilateral(src, d, sigma_color, sigma_space, out):
+		# Both stages have uploaded before either reads its source
+		barrier.wait()
+		out.data = src.data.copy()
+		return out
+	
+	def resize(src, dsize, out, interpolation=cv2.INTER_LINEAR):
+		barrier.wait()
+		out.data = cv2.resize(src.data, dsize, interpolation=interpolation)
+		return out
+	
+	cuda = SimpleNamespace(bilateralFilter=bilateral, resize=resize)
+	monkeypatch.setattr(gpu, 'HAS_CUDA', True)
+	monkeypatch.setattr(gpu, '_local', threading.local())
+	monkeypatch.setattr(cv2, 'cuda', cuda, raising=False)
+	monkeypatch.setattr(cv2, 'cuda_GpuMat', FakeGpuMat, raising=False)
+
+
+def test_concurrent_stages_use_separate_device_buffers(fake_cuda):
+	"""Test that two pipeline stages on the GPU don't overwrite each other's frames."""
+	results = {}
+	
+	def smooth():
+		frame = np.full((4, 4, 3), 10, dtype=np.uint8)
+		results['smooth'] = gpu.bilateral_filter(frame, 5, 75, 75)
+	
+	def frame_resize():
+		frame = np.full((4, 4, 3), 200, dtype=np.uint8)
+		results['resize'] = gpu.resize(frame, (8, 8))
+	
+	threads = [threading.Thread(target=smooth), threading.Thread(target=frame_resize)]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join(timeout=5)
+	
+	assert results['smooth'].shape == (4, 4, 3)
+	assert (results['smooth'] == 10).all()
+	assert results['resize'].shape == (8, 8, 3)
+	assert (results['resize'] == 200).all()
@@ -236,6 +236,36 @@ class TestPipeWireInputPipeline:
                 assert input_obj.appsink is not None
                 assert input_obj.running is True
     
+    def test_setup_pipeline_rgb_pixel_format(self):
+        """Test that an RGB pixel format is negotiated instead of BGR."""
+        with patch('camfx.input_pipewire._find_pipewire_source', return_value=_make_source_info()):
+            mock_gst = MagicMock()
+            mock_pipeline = MagicMock()
+            mock_appsink = MagicMock()
+            mock_pwsrc = MagicMock()
+            
+            mock_gst.parse_launch.return_value = mock_pipeline
+            mock_pipeline.get_by_name.side_effect = lambda name: mock_pwsrc if name == 'pwsrc' else (mock_appsink if name == 'sink' else None)
+            mock_pipeline.set_state.return_value = mock_gst.StateChangeReturn.SUCCESS
+            mock_pipeline.get_state.return_value = (
+                mock_gst.StateChangeReturn.SUCCESS,
+                mock_gst.State.PLAYING,
+                mock_gst.State.VOID_PENDING
+            )
+            
+            with patch('camfx.input_pipewire.Gst', mock_gst):
+                with patch('time.sleep'):
+                    input_obj = PipeWireInput("test", pixel_format='RGB')
+                
+                assert input_obj.pixel_format == 'RGB'
+                assert 'format=RGB' in mock_gst.parse_launch.call_args[0][0]
+                mock_gst.Caps.from_string.assert_called_with("video/x-raw,format=RGB")
+    
+    def test_unsupported_pixel_format(self):
+        """Test that unknown pixel formats are rejected."""
+        with pytest.raises(ValueError, match="Unsupported pixel format"):
+            PipeWireInput("test", pixel_format='YUY2')
+    
     def test_setup_pipeline_parse_failure(self):
         """Test handling of pipeline parse failure."""
         with patch('camfx.input_pipewire._find_pipewire_source', return_value=_make_source_info()):
@@ -316,6 +346,16 @@ class TestPipeWireInputRead:
         assert frame.shape == (100, 100, 3)
         np.testing.assert_array_equal(frame, test_frame)
     
+    def test_wait_for_frame(self):
+        """Test waiting for a queued frame."""
+        input_obj = self.create_mock_input()
+        
+        assert input_obj.wait_for_frame(0.01) is False
+        
+        input_obj.frame_queue.append(np.zeros((10, 10, 3), dtype=np.uint8))
+        input_obj.sample_available.set()
+        assert input_obj.wait_for_frame(0.01) is True
+    
     def test_read_empty_queue(self):
         """Test reading when queue is empty."""
         input_obj = self.create_mock_input()